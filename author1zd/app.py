@@ -1,28 +1,78 @@
+import logging
 import os
+import time
 import uuid
 from typing import Final, Literal
 
 from fastapi import HTTPException, FastAPI, Form, Query, Depends
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from starlette import status
 from starlette.requests import Request
-from starlette.responses import RedirectResponse
+from starlette.responses import JSONResponse, RedirectResponse, Response
 from starlette.staticfiles import StaticFiles
 from starlette.templating import Jinja2Templates
 
 from author1zd.database.abstract.repositories.client_repository import ClientRepository
 from author1zd.database.abstract.repositories.user_repository import UserRepository
 from author1zd.database.exceptions import NonUniqueUserDataException
-from author1zd.dependencies.database import create_user_repository, create_client_repository
+from author1zd.dependencies.client_cache import open_client_cache, close_client_cache
+from author1zd.dependencies.database import (
+    create_user_repository,
+    create_client_repository,
+    create_database_schema,
+    open_engine,
+    dispose_engine,
+    open_read_replicas,
+    close_read_replicas,
+)
+from author1zd.dependencies.introspection import (
+    open_verified_token_cache,
+    close_verified_token_cache,
+    get_verified_token_cache,
+)
 from author1zd.dependencies.key_value_storage import (
+    open_key_value_storage,
+    close_key_value_storage,
+    get_redis_connection_pool_stats,
+    create_redis_client,
+    create_redis_pubsub_client,
     create_auth_info_collection,
     create_auth_code_collection,
     create_refresh_token_collection,
+    create_revoked_access_token_collection,
+    create_login_rate_limit_collection,
+    create_signup_rate_limit_collection,
+    open_user_filter,
+    close_user_filter,
+    start_refresh_token_index_pruner,
+    stop_refresh_token_index_pruner,
+)
+from author1zd.dependencies.readiness import start_warm_up, stop_warm_up, is_ready
+from author1zd.dependencies.rate_limit import (
+    open_local_rate_limiter,
+    close_local_rate_limiter,
+    get_local_rate_limiter,
+    get_client_address,
 )
+from author1zd.dependencies.token_keys import open_token_key_rings, get_token_key_rings
+from author1zd.dependencies.user_cache import open_user_cache, close_user_cache
+from author1zd.dependencies.auth_info_storage import open_auth_info_storage, close_auth_info_storage
+from author1zd.dependencies.user_filter import start_user_filter_builder, stop_user_filter_builder
+from author1zd.dependencies.password import open_password_hasher, close_password_hasher, get_password_hasher
 from author1zd.entities.user import User
+from author1zd.exchange_objects.token_introspection import TokenIntrospection, TokenIntrospectionBatch
+from author1zd.exchange_objects.username_availability import UsernameAvailability
+from author1zd.monitoring.collectors import create_metrics_registry
+from author1zd.monitoring.instrumentation import enable_tracing
+from author1zd.monitoring.metrics import STARTUP_DURATION_SECONDS
+from author1zd.monitoring.middleware import MetricsMiddleware
 from author1zd.objects.auth_code_data import AuthCodeData
 from author1zd.objects.auth_info import AuthInfo
+from author1zd.key_value_storage.abstract.collections.indexed_string_set import IndexedStringSet
+from author1zd.key_value_storage.abstract.collections.sliding_window_counter import SlidingWindowCounter
 from author1zd.key_value_storage.abstract.collections.string_set import StringSet
 from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.key_value_storage.memory.expiring_store import StoreFullException
 from author1zd.services.client import (
     ClientNotRegisteredException,
     RedirectUriNotAllowedException,
@@ -30,19 +80,295 @@ from author1zd.services.client import (
     check_client_secret,
     check_redirect_uri,
 )
-from author1zd.settings import JwtSettings, settings_provider
-from author1zd.services.token import generate_token_pair, get_refresh_token_claims
-from author1zd.utility.password import verify_password, hash_password
+from author1zd.settings import (
+    AuthInfoStorageSettings,
+    ClientCacheSettings,
+    UserCacheSettings,
+    KeyValueStorageSettings,
+    IntrospectionSettings,
+    JwtSettings,
+    MonitoringSettings,
+    PasswordHashingSettings,
+    PostgresSettings,
+    RateLimitSettings,
+    RedisSettings,
+    StartupSettings,
+    UserFilterSettings,
+    settings_provider,
+)
+from author1zd.services.introspection import (
+    TokenClientMismatchException,
+    TokenType,
+    VerifiedTokenCache,
+    introspect_tokens,
+    revoke_token,
+)
+from author1zd.services.key_ring import TokenKeyRings
+from author1zd.services.rate_limit import (
+    RateLimitExceededException,
+    check_local_rate_limit,
+    check_login_rate_limits,
+    check_signup_rate_limits,
+    check_username_taken_rate_limits,
+)
+from author1zd.services.user import EmailTakenException, UsernameTakenException, check_user_data_is_unique
+from author1zd.services.token import (
+    InvalidTokenException,
+    generate_token_pair,
+    get_refresh_token_claims,
+    rotate_token_pair,
+)
+from author1zd.utility.circuit_breaker import CircuitOpenException
+from author1zd.utility.password import PasswordHasher, PasswordHashingOverloadedException
+from author1zd.utility.token_bucket import TokenBucketLimiter
 from author1zd.utility.url import set_query_params
 
 BASE_DIR: Final[str] = os.path.dirname(os.path.realpath(__file__))
 
+LOGGER: Final = logging.getLogger(__name__)
+
 app = FastAPI()
 
 app.mount("/static", StaticFiles(directory=os.path.join(BASE_DIR, "static")), name="static")
 
 templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
 
+app.add_middleware(MetricsMiddleware, get_routes=lambda: app.routes)
+
+METRICS_REGISTRY: Final = create_metrics_registry(get_redis_connection_pool_stats)
+
+_startup_started_at: float | None = None
+
+
+# NOTE: startup hooks only create pools and objects without waiting for network,
+# connections are opened in background by warm-up that readiness endpoint reports on
+
+
+@app.on_event("startup")
+async def start_startup_timer_on_startup():
+    global _startup_started_at
+    _startup_started_at = time.perf_counter()
+
+
+@app.on_event("startup")
+async def enable_tracing_on_startup():
+    if settings_provider(MonitoringSettings)().tracing_enabled:
+        enable_tracing()
+
+
+@app.on_event("startup")
+async def open_engine_on_startup():
+    open_engine(settings_provider(PostgresSettings)())
+
+
+@app.on_event("startup")
+async def create_database_schema_on_startup():
+    if settings_provider(StartupSettings)().create_schema:
+        await create_database_schema()
+
+
+@app.on_event("startup")
+async def open_read_replicas_on_startup():
+    open_read_replicas(settings_provider(PostgresSettings)())
+
+
+@app.on_event("startup")
+async def open_key_value_storage_on_startup():
+    open_key_value_storage(settings_provider(KeyValueStorageSettings)(), settings_provider(RedisSettings)())
+
+
+@app.on_event("startup")
+async def open_client_cache_on_startup():
+    key_value_storage_settings = settings_provider(KeyValueStorageSettings)()
+    open_client_cache(
+        settings_provider(ClientCacheSettings)(),
+        create_redis_pubsub_client() if key_value_storage_settings.backend == "redis" else None,
+    )
+
+
+@app.on_event("startup")
+async def open_user_cache_on_startup():
+    key_value_storage_settings = settings_provider(KeyValueStorageSettings)()
+    if key_value_storage_settings.backend == "redis":
+        open_user_cache(settings_provider(UserCacheSettings)(), create_redis_client(), create_redis_pubsub_client())
+    else:
+        open_user_cache(settings_provider(UserCacheSettings)(), None, None)
+
+
+@app.on_event("startup")
+async def open_auth_info_storage_on_startup():
+    open_auth_info_storage(settings_provider(AuthInfoStorageSettings)())
+
+
+@app.on_event("startup")
+async def open_user_filter_on_startup():
+    open_user_filter(settings_provider(UserFilterSettings)())
+
+
+@app.on_event("startup")
+async def start_user_filter_builder_on_startup():
+    start_user_filter_builder(settings_provider(UserFilterSettings)())
+
+
+@app.on_event("startup")
+async def open_token_key_rings_on_startup():
+    open_token_key_rings(settings_provider(JwtSettings)())
+
+
+@app.on_event("startup")
+async def start_refresh_token_index_pruner_on_startup():
+    start_refresh_token_index_pruner(settings_provider(JwtSettings)())
+
+
+@app.on_event("startup")
+async def open_verified_token_cache_on_startup():
+    open_verified_token_cache(settings_provider(IntrospectionSettings)())
+
+
+@app.on_event("startup")
+async def open_password_hasher_on_startup():
+    open_password_hasher(settings_provider(PasswordHashingSettings)())
+
+
+@app.on_event("startup")
+async def open_local_rate_limiter_on_startup():
+    open_local_rate_limiter(settings_provider(RateLimitSettings)())
+
+
+@app.on_event("startup")
+async def start_warm_up_on_startup():
+    start_warm_up(settings_provider(StartupSettings)(), settings_provider(PostgresSettings)())
+
+
+@app.on_event("startup")
+async def record_startup_duration_on_startup():
+    elapsed = time.perf_counter() - _startup_started_at
+    STARTUP_DURATION_SECONDS.set(elapsed)
+    LOGGER.info("Application started in %.3f s", elapsed)
+
+
+@app.on_event("shutdown")
+async def stop_warm_up_on_shutdown():
+    await stop_warm_up()
+
+
+@app.on_event("shutdown")
+async def stop_user_filter_builder_on_shutdown():
+    await stop_user_filter_builder()
+
+
+@app.on_event("shutdown")
+async def close_read_replicas_on_shutdown():
+    await close_read_replicas()
+
+
+@app.on_event("shutdown")
+async def dispose_engine_on_shutdown():
+    await dispose_engine()
+
+
+@app.on_event("shutdown")
+async def close_client_cache_on_shutdown():
+    await close_client_cache()
+
+
+@app.on_event("shutdown")
+async def close_user_cache_on_shutdown():
+    await close_user_cache()
+
+
+@app.on_event("shutdown")
+async def close_auth_info_storage_on_shutdown():
+    close_auth_info_storage()
+
+
+@app.on_event("shutdown")
+async def stop_refresh_token_index_pruner_on_shutdown():
+    await stop_refresh_token_index_pruner()
+
+
+@app.on_event("shutdown")
+async def close_user_filter_on_shutdown():
+    close_user_filter()
+
+
+@app.on_event("shutdown")
+async def close_key_value_storage_on_shutdown():
+    await close_key_value_storage()
+
+
+@app.on_event("shutdown")
+async def close_verified_token_cache_on_shutdown():
+    close_verified_token_cache()
+
+
+@app.on_event("shutdown")
+async def close_password_hasher_on_shutdown():
+    close_password_hasher()
+
+
+@app.on_event("shutdown")
+async def close_local_rate_limiter_on_shutdown():
+    close_local_rate_limiter()
+
+
+@app.exception_handler(PasswordHashingOverloadedException)
+async def password_hashing_overloaded_handler(request: Request, exc: PasswordHashingOverloadedException):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(StoreFullException)
+async def store_full_handler(request: Request, exc: StoreFullException):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(CircuitOpenException)
+async def circuit_open_handler(request: Request, exc: CircuitOpenException):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(RateLimitExceededException)
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceededException):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.get("/.well-known/jwks.json")
+async def jwks_view(
+    response: Response,
+    token_key_rings: TokenKeyRings = Depends(get_token_key_rings),
+    jwt_settings: JwtSettings = Depends(settings_provider(JwtSettings)),
+):
+    response.headers["Cache-Control"] = f"public, max-age={jwt_settings.jwks_max_age}"
+    return token_key_rings.access_token.get_public_jwks()
+
+
+@app.get("/metrics")
+async def metrics_view():
+    return Response(generate_latest(METRICS_REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/ready")
+async def readiness_view():
+    if not is_ready():
+        return JSONResponse({"status": "warming_up"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return {"status": "ready"}
+
 
 @app.get("/authorize", status_code=status.HTTP_302_FOUND)
 async def authorize_view(
@@ -54,14 +380,14 @@ async def authorize_view(
     auth_info_collection: StringToDataclassMap[AuthInfo] = Depends(create_auth_info_collection),
 ):
     try:
-        check_redirect_uri(client_id, redirect_uri, client_repository)
+        await check_redirect_uri(client_id, redirect_uri, client_repository)
     except ClientNotRegisteredException as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     except RedirectUriNotAllowedException as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
     auth_info_key = uuid.uuid4().hex
-    auth_info_collection.save(auth_info_key, AuthInfo(client_id, redirect_uri, state))
+    await auth_info_collection.save(auth_info_key, AuthInfo(client_id, redirect_uri, state))
 
     return RedirectResponse(
         url=set_query_params("/login", auth_info_key=auth_info_key),
@@ -85,8 +411,15 @@ async def login_post_view(
     user_repository: UserRepository = Depends(create_user_repository),
     auth_info_collection: StringToDataclassMap[AuthInfo] = Depends(create_auth_info_collection),
     auth_code_collection: StringToDataclassMap[AuthCodeData] = Depends(create_auth_code_collection),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
+    client_address: str = Depends(get_client_address),
+    local_rate_limiter: TokenBucketLimiter | None = Depends(get_local_rate_limiter),
+    login_rate_limit_collection: SlidingWindowCounter = Depends(create_login_rate_limit_collection),
+    rate_limit_settings: RateLimitSettings = Depends(settings_provider(RateLimitSettings)),
 ):
-    auth_info = auth_info_collection.get(auth_info_key)
+    check_local_rate_limit(client_address, local_rate_limiter)
+
+    auth_info = await auth_info_collection.get(auth_info_key)
 
     if auth_info is None:
         return RedirectResponse(
@@ -98,9 +431,17 @@ async def login_post_view(
             status_code=status.HTTP_303_SEE_OTHER,
         )
 
-    user = user_repository.get_by_username(username)
+    await check_login_rate_limits(
+        client_address, username, auth_info.client_id, login_rate_limit_collection, rate_limit_settings
+    )
+
+    user = await user_repository.get_by_username(username)
+
+    verified, new_password_hash = False, None
+    if user is not None:
+        verified, new_password_hash = await password_hasher.verify_and_update_password(password, user.password_hash)
 
-    if user is None or not verify_password(password, user.password_hash):
+    if not verified:
         return RedirectResponse(
             url=set_query_params(
                 "/authentication_error",
@@ -110,10 +451,24 @@ async def login_post_view(
             status_code=status.HTTP_303_SEE_OTHER,
         )
 
-    auth_info_collection.remove(auth_info_key)
+    # NOTE: auth info was only peeked at above, popping it consumes it atomically,
+    # so concurrent or replayed submissions of the same login can't both get authorization code
+    auth_info = await auth_info_collection.pop(auth_info_key)
+    if auth_info is None:
+        return RedirectResponse(
+            url=set_query_params(
+                "/authentication_error",
+                error_code=status.HTTP_401_UNAUTHORIZED,
+                error_message="Authentication time expired. Try again",
+            ),
+            status_code=status.HTTP_303_SEE_OTHER,
+        )
+
+    if new_password_hash is not None:
+        await user_repository.update_password_hash(user.id, new_password_hash)
 
     authorization_code = uuid.uuid4().hex
-    auth_code_collection.save(authorization_code, AuthCodeData(client_id=auth_info.client_id, user_id=user.id))
+    await auth_code_collection.save(authorization_code, AuthCodeData(client_id=auth_info.client_id, user_id=user.id))
 
     return RedirectResponse(
         url=set_query_params(auth_info.redirect_uri, code=authorization_code, state=auth_info.state),
@@ -138,8 +493,15 @@ async def signup_post_view(
     user_repository: UserRepository = Depends(create_user_repository),
     auth_info_collection: StringToDataclassMap[AuthInfo] = Depends(create_auth_info_collection),
     auth_code_collection: StringToDataclassMap[AuthCodeData] = Depends(create_auth_code_collection),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
+    client_address: str = Depends(get_client_address),
+    local_rate_limiter: TokenBucketLimiter | None = Depends(get_local_rate_limiter),
+    signup_rate_limit_collection: SlidingWindowCounter = Depends(create_signup_rate_limit_collection),
+    rate_limit_settings: RateLimitSettings = Depends(settings_provider(RateLimitSettings)),
 ):
-    auth_info = auth_info_collection.get(auth_info_key)
+    check_local_rate_limit(client_address, local_rate_limiter)
+
+    auth_info = await auth_info_collection.get(auth_info_key)
 
     if auth_info is None:
         return RedirectResponse(
@@ -151,9 +513,33 @@ async def signup_post_view(
             status_code=status.HTTP_303_SEE_OTHER,
         )
 
+    await check_signup_rate_limits(
+        client_address, auth_info.client_id, signup_rate_limit_collection, rate_limit_settings
+    )
+
     try:
-        user = user_repository.save(User.create(username, email, hash_password(password)))
-    except NonUniqueUserDataException as e:
+        await check_user_data_is_unique(username, email, user_repository)
+        password_hash = await password_hasher.hash_password(password)
+
+        # NOTE: auth info is consumed atomically before user is created, so concurrent or replayed submissions
+        # of the same signup can't both get authorization code, and it is put back if user can't be created
+        auth_info = await auth_info_collection.pop(auth_info_key)
+        if auth_info is None:
+            return RedirectResponse(
+                url=set_query_params(
+                    "/authentication_error",
+                    error_code=status.HTTP_401_UNAUTHORIZED,
+                    error_message="Authentication time expired. Try again",
+                ),
+                status_code=status.HTTP_303_SEE_OTHER,
+            )
+
+        try:
+            user = await user_repository.save(User.create(username, email, password_hash))
+        except Exception:
+            await auth_info_collection.save(auth_info_key, auth_info)
+            raise
+    except (UsernameTakenException, EmailTakenException, NonUniqueUserDataException) as e:
         return RedirectResponse(
             url=set_query_params(
                 "/authentication_error",
@@ -163,10 +549,8 @@ async def signup_post_view(
             status_code=status.HTTP_303_SEE_OTHER,
         )
 
-    auth_info_collection.remove(auth_info_key)
-
     authorization_code = uuid.uuid4().hex
-    auth_code_collection.save(authorization_code, AuthCodeData(client_id=auth_info.client_id, user_id=user.id))
+    await auth_code_collection.save(authorization_code, AuthCodeData(client_id=auth_info.client_id, user_id=user.id))
 
     return RedirectResponse(
         url=set_query_params(auth_info.redirect_uri, code=authorization_code, state=auth_info.state),
@@ -174,6 +558,21 @@ async def signup_post_view(
     )
 
 
+@app.get("/signup/username_taken", response_model=UsernameAvailability)
+async def username_taken_view(
+    username: str = Query(),
+    user_repository: UserRepository = Depends(create_user_repository),
+    client_address: str = Depends(get_client_address),
+    local_rate_limiter: TokenBucketLimiter | None = Depends(get_local_rate_limiter),
+    signup_rate_limit_collection: SlidingWindowCounter = Depends(create_signup_rate_limit_collection),
+    rate_limit_settings: RateLimitSettings = Depends(settings_provider(RateLimitSettings)),
+):
+    check_local_rate_limit(client_address, local_rate_limiter)
+    await check_username_taken_rate_limits(client_address, signup_rate_limit_collection, rate_limit_settings)
+
+    return UsernameAvailability(username=username, taken=await user_repository.is_username_taken(username))
+
+
 @app.get("/authentication_error")
 async def error_page_view(request: Request, error_code: int, error_message: str):
     return templates.TemplateResponse(
@@ -192,28 +591,27 @@ async def token_code_view(
     client_repository: ClientRepository = Depends(create_client_repository),
     user_repository: UserRepository = Depends(create_user_repository),
     auth_code_collection: StringToDataclassMap[AuthCodeData] = Depends(create_auth_code_collection),
-    refresh_token_collection: StringSet = Depends(create_refresh_token_collection),
+    refresh_token_collection: IndexedStringSet = Depends(create_refresh_token_collection),
     jwt_settings: JwtSettings = Depends(settings_provider(JwtSettings)),
+    token_key_rings: TokenKeyRings = Depends(get_token_key_rings),
 ):
     try:
-        check_client_secret(client_id, client_secret, client_repository)
+        await check_client_secret(client_id, client_secret, client_repository)
     except ClientNotRegisteredException as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     except SecretMismatchException as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
-    auth_code_data = auth_code_collection.get(code)
+    auth_code_data = await auth_code_collection.pop(code)
     if auth_code_data is None:
         raise HTTPException(status_code=status.HTTP_410_GONE, detail="Code expired")
 
     if client_id != auth_code_data.client_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid client id")
 
-    auth_code_collection.remove(code)
+    user = await user_repository.get_by_id(auth_code_data.user_id)
 
-    user = user_repository.get_by_id(auth_code_data.user_id)
-
-    return generate_token_pair(client_id, user, refresh_token_collection, jwt_settings)
+    return await generate_token_pair(client_id, user, refresh_token_collection, jwt_settings, token_key_rings)
 
 
 @app.post("/refresh")
@@ -224,26 +622,138 @@ async def token_refresh_view(
     refresh_token: str = Form(),
     client_repository: ClientRepository = Depends(create_client_repository),
     user_repository: UserRepository = Depends(create_user_repository),
-    refresh_token_collection: StringSet = Depends(create_refresh_token_collection),
+    refresh_token_collection: IndexedStringSet = Depends(create_refresh_token_collection),
     jwt_settings: JwtSettings = Depends(settings_provider(JwtSettings)),
+    token_key_rings: TokenKeyRings = Depends(get_token_key_rings),
 ):
     try:
-        check_client_secret(client_id, client_secret, client_repository)
+        await check_client_secret(client_id, client_secret, client_repository)
     except ClientNotRegisteredException as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     except SecretMismatchException as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
-    if not refresh_token_collection.contains(refresh_token):
+    try:
+        refresh_token_claims = get_refresh_token_claims(refresh_token, token_key_rings)
+    except InvalidTokenException:
         raise HTTPException(status_code=status.HTTP_410_GONE, detail="Token expired")
 
-    refresh_token_claims = get_refresh_token_claims(refresh_token, jwt_settings)
-
     if client_id != refresh_token_claims.client_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid client id")
 
-    refresh_token_collection.remove(refresh_token)
+    user = await user_repository.get_by_id(int(refresh_token_claims.sub))
+
+    token_pair = await rotate_token_pair(
+        client_id, user, refresh_token, refresh_token_claims, refresh_token_collection, jwt_settings, token_key_rings
+    )
+    if token_pair is None:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Token expired")
+
+    return token_pair
 
-    user = user_repository.get_by_id(int(refresh_token_claims.sub))
 
-    return generate_token_pair(client_id, user, refresh_token_collection, jwt_settings)
+@app.post("/introspect", response_model=TokenIntrospection, response_model_exclude_none=True)
+async def token_introspection_view(
+    client_id: str = Form(),
+    client_secret: str = Form(),
+    token: str = Form(),
+    token_type_hint: TokenType | None = Form(default=None),
+    client_repository: ClientRepository = Depends(create_client_repository),
+    refresh_token_collection: IndexedStringSet = Depends(create_refresh_token_collection),
+    revoked_access_token_collection: StringSet = Depends(create_revoked_access_token_collection),
+    verified_token_cache: VerifiedTokenCache = Depends(get_verified_token_cache),
+    token_key_rings: TokenKeyRings = Depends(get_token_key_rings),
+):
+    try:
+        await check_client_secret(client_id, client_secret, client_repository)
+    except ClientNotRegisteredException as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except SecretMismatchException as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+
+    (token_introspection,) = await introspect_tokens(
+        [token],
+        token_type_hint,
+        verified_token_cache,
+        token_key_rings,
+        refresh_token_collection,
+        revoked_access_token_collection,
+    )
+    return token_introspection
+
+
+@app.post("/introspect/batch", response_model=TokenIntrospectionBatch, response_model_exclude_none=True)
+async def token_batch_introspection_view(
+    client_id: str = Form(),
+    client_secret: str = Form(),
+    token: list[str] = Form(),
+    token_type_hint: TokenType | None = Form(default=None),
+    client_repository: ClientRepository = Depends(create_client_repository),
+    refresh_token_collection: IndexedStringSet = Depends(create_refresh_token_collection),
+    revoked_access_token_collection: StringSet = Depends(create_revoked_access_token_collection),
+    verified_token_cache: VerifiedTokenCache = Depends(get_verified_token_cache),
+    token_key_rings: TokenKeyRings = Depends(get_token_key_rings),
+    introspection_settings: IntrospectionSettings = Depends(settings_provider(IntrospectionSettings)),
+):
+    try:
+        await check_client_secret(client_id, client_secret, client_repository)
+    except ClientNotRegisteredException as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except SecretMismatchException as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+
+    if len(token) > introspection_settings.max_batch_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch should contain at most {introspection_settings.max_batch_size} tokens",
+        )
+
+    token_introspections = await introspect_tokens(
+        token,
+        token_type_hint,
+        verified_token_cache,
+        token_key_rings,
+        refresh_token_collection,
+        revoked_access_token_collection,
+    )
+    return TokenIntrospectionBatch(tokens=token_introspections)
+
+
+@app.post("/revoke")
+async def token_revocation_view(
+    client_id: str = Form(),
+    client_secret: str = Form(),
+    token: str = Form(),
+    token_type_hint: TokenType | None = Form(default=None),
+    client_repository: ClientRepository = Depends(create_client_repository),
+    refresh_token_collection: IndexedStringSet = Depends(create_refresh_token_collection),
+    revoked_access_token_collection: StringSet = Depends(create_revoked_access_token_collection),
+    verified_token_cache: VerifiedTokenCache = Depends(get_verified_token_cache),
+    token_key_rings: TokenKeyRings = Depends(get_token_key_rings),
+):
+    try:
+        await check_client_secret(client_id, client_secret, client_repository)
+    except ClientNotRegisteredException as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except SecretMismatchException as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+
+    try:
+        await revoke_token(
+            token,
+            client_id,
+            token_type_hint,
+            verified_token_cache,
+            token_key_rings,
+            refresh_token_collection,
+            revoked_access_token_collection,
+        )
+    except TokenClientMismatchException as e:
+        # NOTE: client itself is authenticated, it just doesn't own the token, RFC 7009 answers it with error
+        # response of RFC 6749 section 5.2
+        return JSONResponse(
+            {"error": "unauthorized_client", "error_description": str(e)},
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return Response(status_code=status.HTTP_200_OK)
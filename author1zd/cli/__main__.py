@@ -0,0 +1,38 @@
+import argparse
+import asyncio
+
+from author1zd.cli import (
+    calibrate_password_hashing,
+    create_schema,
+    export_users,
+    import_users,
+    invalidate_client,
+    invalidate_user,
+    rebuild_user_filter,
+    revoke_sessions,
+)
+
+COMMANDS = [
+    create_schema,
+    invalidate_client,
+    invalidate_user,
+    revoke_sessions,
+    calibrate_password_hashing,
+    import_users,
+    export_users,
+    rebuild_user_filter,
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m author1zd.cli")
+    subparsers = parser.add_subparsers(required=True)
+    for command in COMMANDS:
+        command.add_parser(subparsers)
+
+    args = parser.parse_args()
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+
+from author1zd.settings import PasswordHashingSettings
+from author1zd.utility.password import create_password_context, measure_verify_time
+
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+MAX_ARGON2_TIME_COST = 20
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "calibrate-password-hashing",
+        help="Measure password verification on this machine and print cost settings closest to target time",
+    )
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], help="defaults to PASSWORD_HASHING_SCHEME")
+    parser.add_argument("--target-ms", type=float, default=250, help="target verification time in milliseconds")
+    parser.add_argument("--samples", type=int, default=5, help="verifications measured for every candidate cost")
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    password_hashing_settings = PasswordHashingSettings()
+    scheme = args.scheme or password_hashing_settings.scheme
+    target = args.target_ms / 1000
+
+    if scheme == "bcrypt":
+        cost_name, candidates = "PASSWORD_HASHING_BCRYPT_ROUNDS", range(MIN_BCRYPT_ROUNDS, MAX_BCRYPT_ROUNDS + 1)
+    else:
+        # NOTE: memory cost and parallelism are capacity decisions, so only time cost is calibrated
+        cost_name, candidates = "PASSWORD_HASHING_ARGON2_TIME_COST", range(1, MAX_ARGON2_TIME_COST + 1)
+
+    best_cost, best_duration = None, None
+    for cost in candidates:
+        if scheme == "bcrypt":
+            context = create_password_context(scheme, bcrypt_rounds=cost)
+        else:
+            context = create_password_context(
+                scheme,
+                argon2_time_cost=cost,
+                argon2_memory_cost=password_hashing_settings.argon2_memory_cost,
+                argon2_parallelism=password_hashing_settings.argon2_parallelism,
+            )
+        duration = measure_verify_time(context, args.samples)
+        print(f"{cost_name}={cost}: {duration * 1000:.1f} ms")
+
+        if best_duration is None or abs(duration - target) < abs(best_duration - target):
+            best_cost, best_duration = cost, duration
+        if duration >= target:
+            break
+
+    print()
+    print(f"PASSWORD_HASHING_SCHEME={scheme}")
+    print(f"{cost_name}={best_cost}")
+    if scheme == "argon2":
+        print(f"PASSWORD_HASHING_ARGON2_MEMORY_COST={password_hashing_settings.argon2_memory_cost}")
+        print(f"PASSWORD_HASHING_ARGON2_PARALLELISM={password_hashing_settings.argon2_parallelism}")
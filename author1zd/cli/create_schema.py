@@ -0,0 +1,19 @@
+import argparse
+
+from author1zd.dependencies.database import open_engine, create_database_schema, dispose_engine
+from author1zd.settings import PostgresSettings
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "create-schema", help="Create missing database tables, run once before starting workers of new deployment"
+    )
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    open_engine(PostgresSettings())
+    try:
+        await create_database_schema()
+    finally:
+        await dispose_engine()
@@ -0,0 +1,30 @@
+import argparse
+import sys
+
+from author1zd.database.sqlalchemy.repositories.sqlalchemy_user_repository import SqlAlchemyUserRepository
+from author1zd.dependencies.database import open_engine, open_session, dispose_engine
+from author1zd.services.user_transfer import export_users
+from author1zd.settings import PostgresSettings
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "export-users", help="Export all users including password hashes to CSV or JSONL file in constant memory"
+    )
+    parser.add_argument("file", help="'-' to write to stdout")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="jsonl")
+    parser.add_argument("--batch-size", type=int, default=1000, help="users fetched from database cursor at once")
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    open_engine(PostgresSettings())
+    output_file = sys.stdout if args.file == "-" else open(args.file, "w", newline="")
+    try:
+        async with open_session() as session:
+            exported = await export_users(SqlAlchemyUserRepository(session), output_file, args.format, args.batch_size)
+        print(f"Exported {exported} users", file=sys.stderr)
+    finally:
+        if output_file is not sys.stdout:
+            output_file.close()
+        await dispose_engine()
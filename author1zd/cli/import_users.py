@@ -0,0 +1,93 @@
+import argparse
+import dataclasses
+import json
+import sys
+
+from author1zd.database.abstract.repositories.user_repository import UserRepository
+from author1zd.database.filtered.repositories.filtered_user_repository import FilteredUserRepository
+from author1zd.database.sqlalchemy.repositories.sqlalchemy_user_repository import SqlAlchemyUserRepository
+from author1zd.dependencies.database import open_engine, open_session, dispose_engine
+from author1zd.dependencies.key_value_storage import (
+    open_redis_connection_pool,
+    close_redis_connection_pool,
+    create_user_filter,
+)
+from author1zd.dependencies.password import open_password_hasher, close_password_hasher, get_password_hasher
+from author1zd.services.user_transfer import MAX_IMPORT_BATCH_SIZE, UserImportIssue, import_users, read_user_records
+from author1zd.settings import (
+    KeyValueStorageSettings,
+    PasswordHashingSettings,
+    PostgresSettings,
+    RedisSettings,
+    UserFilterSettings,
+)
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "import-users",
+        help="Import users from CSV or JSONL file with 'username', 'email' and either 'password' or 'password_hash', "
+        "users with taken username or email are reported and skipped",
+    )
+    parser.add_argument("file", help="'-' to read from stdin")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="jsonl")
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help=f"users inserted by one statement, at most {MAX_IMPORT_BATCH_SIZE}"
+    )
+    parser.add_argument("--report", help="JSONL file to write skipped users to, stderr by default")
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    password_hashing_settings = PasswordHashingSettings()
+    open_password_hasher(password_hashing_settings)
+    open_engine(PostgresSettings())
+    # imported users have to be added to filter shared by workers, in-memory filters are rebuilt on worker start
+    user_filter_settings = UserFilterSettings()
+    update_user_filter = user_filter_settings.enabled and KeyValueStorageSettings().backend == "redis"
+    if update_user_filter:
+        open_redis_connection_pool(RedisSettings())
+
+    input_file = sys.stdin if args.file == "-" else open(args.file, newline="")
+    report_file = sys.stderr if args.report is None else open(args.report, "w")
+
+    def report_issue(issue: UserImportIssue) -> None:
+        report_file.write(json.dumps(dataclasses.asdict(issue)) + "\n")
+
+    user_filter_failures = 0
+
+    def count_user_filter_failure() -> None:
+        nonlocal user_filter_failures
+        user_filter_failures += 1
+
+    try:
+        async with open_session() as session:
+            user_repository: UserRepository = SqlAlchemyUserRepository(session)
+            if update_user_filter:
+                user_repository = FilteredUserRepository(
+                    user_repository, create_user_filter(user_filter_settings), on_add_failure=count_user_filter_failure
+                )
+
+            summary = await import_users(
+                read_user_records(input_file, args.format),
+                user_repository,
+                get_password_hasher(),
+                batch_size=args.batch_size,
+                max_concurrent_hashes=password_hashing_settings.max_workers,
+                report_issue=report_issue,
+            )
+        print(f"Imported {summary.imported} users, skipped {summary.conflicts} conflicts and {summary.invalid} invalid")
+        if user_filter_failures:
+            print(
+                f"Failed to add {user_filter_failures} batches of imported users to user filter, "
+                "run 'rebuild-user-filter' command",
+                file=sys.stderr,
+            )
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if report_file is not sys.stderr:
+            report_file.close()
+        close_password_hasher()
+        await dispose_engine()
+        await close_redis_connection_pool()
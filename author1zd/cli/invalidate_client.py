@@ -0,0 +1,29 @@
+import argparse
+
+from author1zd.dependencies.key_value_storage import (
+    open_redis_connection_pool,
+    close_redis_connection_pool,
+    create_redis_pubsub_client,
+)
+from author1zd.key_value_storage.redis.invalidation import (
+    CLIENT_INVALIDATION_CHANNEL,
+    INVALIDATE_ALL,
+    publish_invalidation,
+)
+from author1zd.settings import RedisSettings
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "invalidate-client", help="Drop client app from cache of every running worker after it was changed"
+    )
+    parser.add_argument("client_id", nargs="?", default=INVALIDATE_ALL, help="omit to invalidate all client apps")
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    open_redis_connection_pool(RedisSettings())
+    try:
+        await publish_invalidation(create_redis_pubsub_client(), CLIENT_INVALIDATION_CHANNEL, args.client_id)
+    finally:
+        await close_redis_connection_pool()
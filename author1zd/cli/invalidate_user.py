@@ -0,0 +1,33 @@
+import argparse
+import datetime
+
+from author1zd.dependencies.key_value_storage import (
+    open_redis_connection_pool,
+    close_redis_connection_pool,
+    create_redis_client,
+    create_redis_pubsub_client,
+)
+from author1zd.key_value_storage.redis.collections.factory_functions import create_redis_user_collection
+from author1zd.key_value_storage.redis.invalidation import USER_INVALIDATION_CHANNEL, publish_invalidation
+from author1zd.settings import RedisSettings, UserCacheSettings
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "invalidate-user",
+        help="Drop user from shared cache and from cache of every running worker after it was changed",
+    )
+    parser.add_argument("user_id", type=int)
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    open_redis_connection_pool(RedisSettings())
+    try:
+        user_collection = create_redis_user_collection(
+            create_redis_client(), default_ttl=datetime.timedelta(seconds=UserCacheSettings().shared_ttl)
+        )
+        await user_collection.remove(str(args.user_id))
+        await publish_invalidation(create_redis_pubsub_client(), USER_INVALIDATION_CHANNEL, str(args.user_id))
+    finally:
+        await close_redis_connection_pool()
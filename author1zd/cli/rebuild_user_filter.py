@@ -0,0 +1,34 @@
+import argparse
+
+from author1zd.dependencies.database import open_engine, dispose_engine
+from author1zd.dependencies.key_value_storage import (
+    open_redis_connection_pool,
+    close_redis_connection_pool,
+    create_user_filter,
+)
+from author1zd.dependencies.user_filter import build_user_filter
+from author1zd.settings import PostgresSettings, RedisSettings, UserFilterSettings
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "rebuild-user-filter",
+        help="Rebuild username and email filter shared by workers after users were changed in database directly",
+    )
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    user_filter_settings = UserFilterSettings()
+    open_engine(PostgresSettings())
+    open_redis_connection_pool(RedisSettings())
+    try:
+        await build_user_filter(
+            create_user_filter(user_filter_settings),
+            batch_size=user_filter_settings.build_batch_size,
+            retry_interval=user_filter_settings.build_retry_interval,
+            force=True,
+        )
+    finally:
+        await close_redis_connection_pool()
+        await dispose_engine()
@@ -0,0 +1,32 @@
+import argparse
+
+from author1zd.dependencies.key_value_storage import (
+    open_redis_connection_pool,
+    close_redis_connection_pool,
+    create_refresh_token_collection,
+)
+from author1zd.services.token import revoke_client_refresh_tokens, revoke_user_refresh_tokens
+from author1zd.settings import JwtSettings, RedisSettings
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "revoke-sessions", help="Revoke all refresh tokens of user or client app, issued access tokens stay valid"
+    )
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--user-id", type=int)
+    group.add_argument("--client-id")
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace) -> None:
+    open_redis_connection_pool(RedisSettings())
+    try:
+        refresh_token_collection = create_refresh_token_collection(JwtSettings())
+        if args.user_id is not None:
+            revoked = await revoke_user_refresh_tokens(args.user_id, refresh_token_collection)
+        else:
+            revoked = await revoke_client_refresh_tokens(args.client_id, refresh_token_collection)
+        print(f"Revoked {revoked} refresh tokens")
+    finally:
+        await close_redis_connection_pool()
@@ -9,5 +9,5 @@ class ClientRepository(ABC):
     # Therefore ClientRepository does NOT provide methods to save client
 
     @abstractmethod
-    def get_by_client_id(self, client_id: str) -> Client | None:
+    async def get_by_client_id(self, client_id: str) -> Client | None:
         """Get client by client_id"""
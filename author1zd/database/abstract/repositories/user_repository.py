@@ -1,17 +1,43 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 from author1zd.entities.user import User
 
 
 class UserRepository(ABC):
     @abstractmethod
-    def save(self, user: User) -> User:
+    async def save(self, user: User) -> User:
         """Save user to database"""
 
     @abstractmethod
-    def get_by_username(self, username: str) -> User | None:
+    async def get_by_username(self, username: str) -> User | None:
         """Get user by username"""
 
     @abstractmethod
-    def get_by_id(self, user_id: int) -> User | None:
+    async def get_by_id(self, user_id: int) -> User | None:
         """Get user by id"""
+
+    @abstractmethod
+    async def is_username_taken(self, username: str) -> bool:
+        """Check whether user with username exists"""
+
+    @abstractmethod
+    async def is_email_taken(self, email: str) -> bool:
+        """Check whether user with email exists"""
+
+    @abstractmethod
+    async def get_many_by_ids(self, user_ids: list[int]) -> list[User | None]:
+        """Get users by ids in one query, return user or None for every id in the same order"""
+
+    @abstractmethod
+    async def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        """Replace password hash of user"""
+
+    @abstractmethod
+    async def save_many(self, users: list[User]) -> list[User | None]:
+        """Save users to database skipping ones with taken username or email,
+        return saved user or None for every user in the same order"""
+
+    @abstractmethod
+    def iterate_all(self, batch_size: int) -> AsyncIterator[User]:
+        """Iterate over all users ordered by id, fetching them from database in batches"""
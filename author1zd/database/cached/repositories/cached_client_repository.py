@@ -0,0 +1,79 @@
+import asyncio
+from typing import Final
+
+from author1zd.database.abstract.repositories.client_repository import ClientRepository
+from author1zd.entities.client import Client
+from author1zd.utility.ttl_lru_cache import TtlLruCache
+
+_MISSING: Final = object()
+
+
+class ClientCache:
+    # NOTE: one cache is shared by all requests handled by a worker,
+    # unknown client ids are cached as None for 'negative_ttl' seconds
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float) -> None:
+        self._cache: TtlLruCache[str, Client | None] = TtlLruCache(max_size)
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._loading: dict[str, asyncio.Future[Client | None]] = {}
+        self._generation = 0
+
+    async def get_by_client_id(self, client_id: str, repository: ClientRepository) -> Client | None:
+        while True:
+            client = self._cache.get(client_id, _MISSING)
+            if client is not _MISSING:
+                return client
+
+            loading = self._loading.get(client_id)
+            if loading is None:
+                return await self._load(client_id, repository)
+
+            try:
+                return await asyncio.shield(loading)
+            except asyncio.CancelledError:
+                # request that was loading the client got cancelled, try loading it again
+                if not loading.cancelled():
+                    raise
+
+    def invalidate(self, client_id: str) -> None:
+        self._generation += 1
+        self._cache.remove(client_id)
+
+    def invalidate_all(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+
+    async def _load(self, client_id: str, repository: ClientRepository) -> Client | None:
+        generation = self._generation
+        loading = asyncio.get_running_loop().create_future()
+        self._loading[client_id] = loading
+
+        try:
+            client = await repository.get_by_client_id(client_id)
+        except asyncio.CancelledError:
+            loading.cancel()
+            raise
+        except BaseException as e:
+            loading.set_exception(e)
+            # mark exception as retrieved, so it is not logged when nobody else waits for it
+            loading.exception()
+            raise
+        finally:
+            del self._loading[client_id]
+
+        # client could have been changed while it was loading, do not cache possibly stale data
+        if generation == self._generation:
+            self._cache.set(client_id, client, ttl=self._ttl if client is not None else self._negative_ttl)
+
+        loading.set_result(client)
+        return client
+
+
+class CachedClientRepository(ClientRepository):
+    def __init__(self, repository: ClientRepository, cache: ClientCache) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def get_by_client_id(self, client_id: str) -> Client | None:
+        return await self._cache.get_by_client_id(client_id, self._repository)
@@ -0,0 +1,115 @@
+import dataclasses
+from typing import AsyncIterator, Awaitable, Callable, Final
+
+from author1zd.database.abstract.repositories.user_repository import UserRepository
+from author1zd.entities.user import User
+from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.utility.ttl_lru_cache import TtlLruCache
+
+_MISSING: Final = object()
+
+# users are looked up by id only to issue tokens, which need no password hash
+REDACTED_PASSWORD_HASH: Final[str] = ""
+
+
+class UserCache:
+    # NOTE: users are looked up in worker local cache, then in shared collection and only then in database,
+    # unknown user ids are not cached, since users are never deleted and ids are only taken from issued tokens.
+    # Password hashes are kept out of both tiers, so they never reach Redis shared with other services
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        shared_collection: StringToDataclassMap[User] | None,
+        publish_invalidation: Callable[[str], Awaitable[None]] | None,
+    ) -> None:
+        self._cache: TtlLruCache[int, User] = TtlLruCache(max_size)
+        self._ttl = ttl
+        self._shared_collection = shared_collection
+        self._publish_invalidation = publish_invalidation
+        self._generation = 0
+
+    async def get_by_id(self, user_id: int, repository: UserRepository) -> User | None:
+        user = self._cache.get(user_id, _MISSING)
+        if user is not _MISSING:
+            return user
+
+        generation = self._generation
+        if self._shared_collection is not None:
+            user = await self._shared_collection.get(str(user_id))
+            if user is not None:
+                # entries saved before hashes were redacted stay until their ttl runs out
+                user = _redact(user)
+                self._set(generation, user)
+                return user
+
+        user = await repository.get_by_id(user_id)
+        if user is None:
+            return None
+        user = _redact(user)
+
+        # user could have been changed while it was loading, do not cache possibly stale data
+        if generation == self._generation and self._shared_collection is not None:
+            await self._shared_collection.save(str(user_id), user)
+        self._set(generation, user)
+        return user
+
+    async def invalidate(self, user_id: int) -> None:
+        """Drop user from shared collection and from caches of all workers"""
+        self.drop(str(user_id))
+        if self._shared_collection is not None:
+            await self._shared_collection.remove(str(user_id))
+        if self._publish_invalidation is not None:
+            await self._publish_invalidation(str(user_id))
+
+    def drop(self, user_id: str) -> None:
+        self._generation += 1
+        self._cache.remove(int(user_id))
+
+    def drop_all(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+
+    def _set(self, generation: int, user: User) -> None:
+        if generation == self._generation:
+            self._cache.set(user.id, user, ttl=self._ttl)
+
+
+def _redact(user: User) -> User:
+    return dataclasses.replace(user, password_hash=REDACTED_PASSWORD_HASH)
+
+
+class CachedUserRepository(UserRepository):
+    # NOTE: users returned by get_by_id come from cache and have no password hash
+    def __init__(self, repository: UserRepository, cache: UserCache) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def save(self, user: User) -> User:
+        return await self._repository.save(user)
+
+    async def get_by_username(self, username: str) -> User | None:
+        return await self._repository.get_by_username(username)
+
+    async def get_by_id(self, user_id: int) -> User | None:
+        return await self._cache.get_by_id(user_id, self._repository)
+
+    async def is_username_taken(self, username: str) -> bool:
+        return await self._repository.is_username_taken(username)
+
+    async def is_email_taken(self, email: str) -> bool:
+        return await self._repository.is_email_taken(email)
+
+    async def get_many_by_ids(self, user_ids: list[int]) -> list[User | None]:
+        return await self._repository.get_many_by_ids(user_ids)
+
+    async def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        await self._repository.update_password_hash(user_id, password_hash)
+        await self._cache.invalidate(user_id)
+
+    async def save_many(self, users: list[User]) -> list[User | None]:
+        return await self._repository.save_many(users)
+
+    def iterate_all(self, batch_size: int) -> AsyncIterator[User]:
+        return self._repository.iterate_all(batch_size)
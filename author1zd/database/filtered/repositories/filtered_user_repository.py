@@ -0,0 +1,96 @@
+import logging
+from typing import AsyncIterator, Callable, Final
+
+from author1zd.database.abstract.repositories.user_repository import UserRepository
+from author1zd.entities.user import User
+from author1zd.key_value_storage.abstract.collections.bloom_filter import BloomFilter
+from author1zd.monitoring.metrics import USER_FILTER_CHECKS_TOTAL
+
+LOGGER: Final = logging.getLogger(__name__)
+
+
+def get_username_filter_value(username: str) -> str:
+    return f"username:{username}"
+
+
+def get_email_filter_value(email: str) -> str:
+    return f"email:{email}"
+
+
+async def iterate_user_filter_values(users: AsyncIterator[User]) -> AsyncIterator[str]:
+    async for user in users:
+        yield get_username_filter_value(user.username)
+        yield get_email_filter_value(user.email)
+
+
+class FilteredUserRepository(UserRepository):
+    # NOTE: values missing from filter are certainly not taken, so only possible hits are looked up in database,
+    # users are added to filter after they are saved, so filter never misses user that exists,
+    # user saved to database stays saved when filter fails to add it, filter is reported stale instead
+    # and has to be rebuilt before it can be trusted again
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        user_filter: BloomFilter,
+        on_add_failure: Callable[[], None] | None = None,
+    ) -> None:
+        self._repository = repository
+        self._user_filter = user_filter
+        self._on_add_failure = on_add_failure
+
+    async def save(self, user: User) -> User:
+        saved_user = await self._repository.save(user)
+        await self._add_to_filter([saved_user])
+        return saved_user
+
+    async def get_by_username(self, username: str) -> User | None:
+        return await self._repository.get_by_username(username)
+
+    async def get_by_id(self, user_id: int) -> User | None:
+        return await self._repository.get_by_id(user_id)
+
+    async def is_username_taken(self, username: str) -> bool:
+        if not await self._user_filter.might_contain(get_username_filter_value(username)):
+            USER_FILTER_CHECKS_TOTAL.labels(result="missing").inc()
+            return False
+        return self._count_confirmation(await self._repository.is_username_taken(username))
+
+    async def is_email_taken(self, email: str) -> bool:
+        if not await self._user_filter.might_contain(get_email_filter_value(email)):
+            USER_FILTER_CHECKS_TOTAL.labels(result="missing").inc()
+            return False
+        return self._count_confirmation(await self._repository.is_email_taken(email))
+
+    async def get_many_by_ids(self, user_ids: list[int]) -> list[User | None]:
+        return await self._repository.get_many_by_ids(user_ids)
+
+    async def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        await self._repository.update_password_hash(user_id, password_hash)
+
+    async def save_many(self, users: list[User]) -> list[User | None]:
+        saved_users = await self._repository.save_many(users)
+        await self._add_to_filter([saved_user for saved_user in saved_users if saved_user is not None])
+        return saved_users
+
+    def iterate_all(self, batch_size: int) -> AsyncIterator[User]:
+        return self._repository.iterate_all(batch_size)
+
+    async def _add_to_filter(self, users: list[User]) -> None:
+        if not users:
+            return
+
+        values = []
+        for user in users:
+            values.extend((get_username_filter_value(user.username), get_email_filter_value(user.email)))
+        try:
+            await self._user_filter.add(values)
+        except Exception:
+            LOGGER.warning("Failed to add %d saved users to user filter, filter is stale", len(users), exc_info=True)
+            if self._on_add_failure is not None:
+                self._on_add_failure()
+
+    @staticmethod
+    def _count_confirmation(taken: bool) -> bool:
+        USER_FILTER_CHECKS_TOTAL.labels(result="taken" if taken else "not_taken").inc()
+        return taken
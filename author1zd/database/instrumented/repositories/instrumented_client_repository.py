@@ -0,0 +1,13 @@
+from author1zd.database.abstract.repositories.client_repository import ClientRepository
+from author1zd.entities.client import Client
+from author1zd.monitoring.instrumentation import timed
+from author1zd.monitoring.metrics import DATABASE_QUERY_DURATION_SECONDS
+
+
+class InstrumentedClientRepository(ClientRepository):
+    def __init__(self, repository: ClientRepository) -> None:
+        self._repository = repository
+
+    async def get_by_client_id(self, client_id: str) -> Client | None:
+        with timed("database.query", DATABASE_QUERY_DURATION_SECONDS, repository="client", method="get_by_client_id"):
+            return await self._repository.get_by_client_id(client_id)
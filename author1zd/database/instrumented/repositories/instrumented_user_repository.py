@@ -0,0 +1,46 @@
+from typing import AsyncIterator
+
+from author1zd.database.abstract.repositories.user_repository import UserRepository
+from author1zd.entities.user import User
+from author1zd.monitoring.instrumentation import timed
+from author1zd.monitoring.metrics import DATABASE_QUERY_DURATION_SECONDS
+
+
+class InstrumentedUserRepository(UserRepository):
+    def __init__(self, repository: UserRepository) -> None:
+        self._repository = repository
+
+    async def save(self, user: User) -> User:
+        with timed("database.query", DATABASE_QUERY_DURATION_SECONDS, repository="user", method="save"):
+            return await self._repository.save(user)
+
+    async def get_by_username(self, username: str) -> User | None:
+        with timed("database.query", DATABASE_QUERY_DURATION_SECONDS, repository="user", method="get_by_username"):
+            return await self._repository.get_by_username(username)
+
+    async def get_by_id(self, user_id: int) -> User | None:
+        with timed("database.query", DATABASE_QUERY_DURATION_SECONDS, repository="user", method="get_by_id"):
+            return await self._repository.get_by_id(user_id)
+
+    async def is_username_taken(self, username: str) -> bool:
+        with timed("database.query", DATABASE_QUERY_DURATION_SECONDS, repository="user", method="is_username_taken"):
+            return await self._repository.is_username_taken(username)
+
+    async def is_email_taken(self, email: str) -> bool:
+        with timed("database.query", DATABASE_QUERY_DURATION_SECONDS, repository="user", method="is_email_taken"):
+            return await self._repository.is_email_taken(email)
+
+    async def get_many_by_ids(self, user_ids: list[int]) -> list[User | None]:
+        with timed("database.query", DATABASE_QUERY_DURATION_SECONDS, repository="user", method="get_many_by_ids"):
+            return await self._repository.get_many_by_ids(user_ids)
+
+    async def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        with timed("database.query", DATABASE_QUERY_DURATION_SECONDS, repository="user", method="update_password_hash"):
+            await self._repository.update_password_hash(user_id, password_hash)
+
+    async def save_many(self, users: list[User]) -> list[User | None]:
+        with timed("database.query", DATABASE_QUERY_DURATION_SECONDS, repository="user", method="save_many"):
+            return await self._repository.save_many(users)
+
+    def iterate_all(self, batch_size: int) -> AsyncIterator[User]:
+        return self._repository.iterate_all(batch_size)
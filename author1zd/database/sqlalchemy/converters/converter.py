@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import Any, TypeVar, Generic, Sequence
+
+from sqlalchemy import Column
 
 from author1zd.database.sqlalchemy.models import BaseModel
 
@@ -16,3 +18,12 @@ class Converter(ABC, Generic[TEntity, TModel]):
     @abstractmethod
     def model_to_entity(self, model: TModel) -> TEntity:
         """Convert database model to business entity"""
+
+    @property
+    @abstractmethod
+    def columns(self) -> list[Column]:
+        """Get model columns to select to convert selected rows with 'row_to_entity'"""
+
+    @abstractmethod
+    def row_to_entity(self, row: Sequence[Any]) -> TEntity:
+        """Convert row of column-only select of 'columns' to business entity"""
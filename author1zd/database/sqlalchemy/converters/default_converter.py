@@ -1,5 +1,7 @@
-from dataclasses import asdict
-from typing import Type, TypeVar
+import dataclasses
+from typing import Any, Callable, Sequence, Type, TypeVar
+
+from sqlalchemy import Column
 
 from author1zd.database.sqlalchemy.models import BaseModel
 from author1zd.database.sqlalchemy.converters.converter import Converter
@@ -9,23 +11,59 @@ TModel = TypeVar("TModel", bound=BaseModel)
 
 
 class DefaultConverter(Converter[TEntity, TModel]):
+    # NOTE: conversion functions are generated once per entity/model pair from dataclass fields and table columns,
+    # so converting does no reflection, copying or dict building on every call
+
     def __init__(self, entity_type: Type[TEntity], model_type: Type[TModel]) -> None:
         self._entity_type = entity_type
         self._model_type = model_type
+        self._columns = list(model_type.__table__.columns)
 
-    def entity_to_model(self, entity: TEntity) -> TModel:
-        model = self._model_type()
+        field_names = [field.name for field in dataclasses.fields(entity_type)]
+        column_names = [column.name for column in self._columns]
 
-        for field, value in asdict(entity).items():
-            if value is not None:
-                setattr(model, field, value)
+        self._entity_to_model = _generate_function(
+            "entity_to_model",
+            "entity",
+            [
+                "model = model_type()",
+                *(
+                    line
+                    for name in field_names
+                    for line in (f"value = entity.{name}", "if value is not None:", f"    model.{name} = value")
+                ),
+                "return model",
+            ],
+            model_type=model_type,
+        )
+        self._model_to_entity = _generate_function(
+            "model_to_entity",
+            "model",
+            [f"return entity_type({', '.join(f'{name}=model.{name}' for name in column_names)})"],
+            entity_type=entity_type,
+        )
+        self._row_to_entity = _generate_function(
+            "row_to_entity",
+            "row",
+            [f"return entity_type({', '.join(f'{name}=row[{i}]' for i, name in enumerate(column_names))})"],
+            entity_type=entity_type,
+        )
 
-        return model
+    @property
+    def columns(self) -> list[Column]:
+        return self._columns
+
+    def entity_to_model(self, entity: TEntity) -> TModel:
+        return self._entity_to_model(entity)
 
     def model_to_entity(self, model: TModel) -> TEntity:
-        entity_kwargs = {}
+        return self._model_to_entity(model)
+
+    def row_to_entity(self, row: Sequence[Any]) -> TEntity:
+        return self._row_to_entity(row)
 
-        for column in model.__table__.columns:
-            entity_kwargs[column.name] = getattr(model, column.name)
 
-        return self._entity_type(**entity_kwargs)
+def _generate_function(name: str, argument: str, body: list[str], **namespace: Any) -> Callable[[Any], Any]:
+    source = "\n".join([f"def {name}({argument}):", *(f"    {line}" for line in body)])
+    exec(source, namespace)
+    return namespace[name]
@@ -0,0 +1,86 @@
+import asyncio
+import itertools
+import logging
+from typing import Any, Final
+
+from sqlalchemy import text
+from sqlalchemy.engine import Result
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.sql import Executable
+
+LOGGER: Final = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    # NOTE: reads are spread round-robin over replicas that passed last health check,
+    # primary serves reads while no replica is healthy, including time before first check
+
+    def __init__(self, primary: AsyncEngine, replicas: list[AsyncEngine], health_check_timeout: float) -> None:
+        self._primary = primary
+        self._replicas = replicas
+        self._health_check_timeout = health_check_timeout
+        self._healthy_replicas: list[AsyncEngine] = []
+        self._counter = itertools.count()
+
+    @property
+    def replicas(self) -> list[AsyncEngine]:
+        return self._replicas
+
+    def get_read_engine(self) -> AsyncEngine:
+        healthy_replicas = self._healthy_replicas
+        if not healthy_replicas:
+            return self._primary
+        return healthy_replicas[next(self._counter) % len(healthy_replicas)]
+
+    async def check_health(self) -> None:
+        healthy = await asyncio.gather(*(self._is_healthy(replica) for replica in self._replicas))
+        healthy_replicas = [replica for replica, is_healthy in zip(self._replicas, healthy) if is_healthy]
+
+        if len(healthy_replicas) != len(self._healthy_replicas):
+            LOGGER.warning("%d of %d read replicas are healthy", len(healthy_replicas), len(self._replicas))
+        self._healthy_replicas = healthy_replicas
+
+    async def _is_healthy(self, replica: AsyncEngine) -> bool:
+        # timeout covers connecting too, asyncpg waits up to a minute for unreachable host otherwise
+        try:
+            await asyncio.wait_for(self._ping(replica), self._health_check_timeout)
+        except Exception:
+            LOGGER.debug("Read replica %s failed health check", replica.url.host, exc_info=True)
+            return False
+        return True
+
+    @staticmethod
+    async def _ping(replica: AsyncEngine) -> None:
+        async with replica.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+
+async def execute_read(
+    session: AsyncSession, read_session: AsyncSession, statement: Executable, parameters: dict[str, Any]
+) -> Result:
+    """Execute statement on read session, repeat it on primary session if replica could not be reached"""
+    if read_session is session:
+        return await session.execute(statement, parameters)
+
+    # NOTE: replica may go down between health checks, queries that merely find nothing are not repeated
+    try:
+        return await read_session.execute(statement, parameters)
+    except (DBAPIError, OSError, asyncio.TimeoutError) as e:
+        if not _is_replica_failure(e):
+            raise
+        LOGGER.warning("Read replica failed, reading from primary", exc_info=True)
+
+    return await session.execute(statement, parameters)
+
+
+def _is_replica_failure(exception: Exception) -> bool:
+    if isinstance(exception, DBAPIError):
+        return isinstance(exception, (OperationalError, InterfaceError)) or exception.connection_invalidated
+    return True
+
+
+async def check_replica_health_periodically(replica_set: ReplicaSet, interval: float) -> None:
+    while True:
+        await replica_set.check_health()
+        await asyncio.sleep(interval)
@@ -1,20 +1,38 @@
-from sqlalchemy.orm import Session
+from typing import Final
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from author1zd.database.abstract.repositories.client_repository import ClientRepository
-from author1zd.database.sqlalchemy.models import ClientAppModel
+from author1zd.database.sqlalchemy.models import ClientAppModel, RedirectUriModel
+from author1zd.database.sqlalchemy.replica_set import execute_read
 from author1zd.entities.client import Client
 
+# NOTE: client comes with its redirect uris in one query, one row per redirect uri,
+# statement is built once so SQLAlchemy compiles it once and asyncpg reuses prepared statement on server
+GET_BY_CLIENT_ID_STATEMENT: Final = (
+    select(ClientAppModel.id, ClientAppModel.client_id, ClientAppModel.client_secret, RedirectUriModel.uri)
+    .outerjoin(ClientAppModel.redirect_uris)
+    .where(ClientAppModel.client_id == bindparam("client_id"))
+    .order_by(RedirectUriModel.id)
+)
+
 
 class SqlAlchemyClientRepository(ClientRepository):
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None) -> None:
         self._session = session
+        self._read_session = read_session if read_session is not None else session
 
-    def get_by_client_id(self, client_id: str) -> Client | None:
-        with self._session:
-            client_model = self._session.query(ClientAppModel).filter(ClientAppModel.client_id == client_id).first()
-            return Client(
-                id=client_model.id,
-                client_id=client_model.client_id,
-                client_secret=client_model.client_secret,
-                redirect_uris=[redirect_uri_model.uri for redirect_uri_model in client_model.redirect_uris],
-            )
+    async def get_by_client_id(self, client_id: str) -> Client | None:
+        parameters = {"client_id": client_id}
+        # NOTE: unknown client ids come from requests and are not repeated on primary, client registered moments ago
+        # is found on replica once it catches up
+        rows = (await execute_read(self._session, self._read_session, GET_BY_CLIENT_ID_STATEMENT, parameters)).all()
+        if not rows:
+            return None
+        return Client(
+            id=rows[0].id,
+            client_id=rows[0].client_id,
+            client_secret=rows[0].client_secret,
+            redirect_uris=[row.uri for row in rows if row.uri is not None],
+        )
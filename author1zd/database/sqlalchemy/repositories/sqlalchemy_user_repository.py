@@ -1,43 +1,175 @@
+import functools
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
 
 from author1zd.database.abstract.repositories.user_repository import UserRepository
 from author1zd.database.exceptions import NonUniqueUserDataException
 from author1zd.database.sqlalchemy.models import UserModel
+from author1zd.database.sqlalchemy.replica_set import execute_read
 from author1zd.database.sqlalchemy.converters.converter import Converter
 from author1zd.database.sqlalchemy.converters.default_converter import DefaultConverter
 from author1zd.entities.user import User
 
 
+@dataclass(frozen=True)
+class _LookupStatements:
+    get_by_username: Select
+    get_by_id: Select
+    get_many_by_ids: Select
+    get_id_by_username: Select
+    get_id_by_email: Select
+
+
+@functools.lru_cache(maxsize=None)
+def _create_lookup_statements(converter: Converter[User, UserModel]) -> _LookupStatements:
+    # NOTE: statements are built once per converter and take values as bound parameters,
+    # so SQLAlchemy compiles each of them once and asyncpg reuses prepared statements on server
+    columns_select = select(*converter.columns)
+    return _LookupStatements(
+        get_by_username=columns_select.where(UserModel.username == bindparam("username")),
+        get_by_id=columns_select.where(UserModel.id == bindparam("user_id")),
+        get_many_by_ids=columns_select.where(UserModel.id.in_(bindparam("user_ids", expanding=True))),
+        get_id_by_username=select(UserModel.id).where(UserModel.username == bindparam("username")),
+        get_id_by_email=select(UserModel.id).where(UserModel.email == bindparam("email")),
+    )
+
+
 class SqlAlchemyUserRepository(UserRepository):
+    # NOTE: reads go to read session, which is bound to replica when there are any, and are repeated on primary
+    # when replica can't be reached. Lookups by id that find nothing on replica are repeated on primary too,
+    # ids come from codes and tokens issued after write that may not be replicated yet, e.g. signup moments ago,
+    # while missing usernames and emails are ordinary and stay on replica
+
     def __init__(
-        self, session: Session, converter: Converter[User, UserModel] = DefaultConverter(User, UserModel)
+        self,
+        session: AsyncSession,
+        read_session: AsyncSession | None = None,
+        converter: Converter[User, UserModel] = DefaultConverter(User, UserModel),
     ) -> None:
         self._session = session
+        self._read_session = read_session if read_session is not None else session
         self._converter = converter
+        self._lookup_statements = _create_lookup_statements(converter)
 
-    def save(self, user_entity: User) -> User:
-        try:
-            with self._session:
-                user_model = self._converter.entity_to_model(user_entity)
-                self._session.add(user_model)
-                self._session.commit()
+    async def save(self, user_entity: User) -> User:
+        user_model = self._converter.entity_to_model(user_entity)
+        self._session.add(user_model)
 
-                self._session.refresh(user_model)
-                return self._converter.model_to_entity(user_model)
+        try:
+            await self._session.commit()
         except IntegrityError:
+            await self._session.rollback()
             raise NonUniqueUserDataException("Username and email should be unique")
 
-    def get_by_username(self, username: str) -> User | None:
-        with self._session:
-            user_model = self._session.query(UserModel).filter(UserModel.username == username).first()
-            if user_model is None:
-                return None
-            return self._converter.model_to_entity(user_model)
-
-    def get_by_id(self, user_id: int) -> User | None:
-        with self._session:
-            user_model = self._session.get(UserModel, user_id)
-            if user_model is None:
-                return None
-            return self._converter.model_to_entity(user_model)
+        await self._session.refresh(user_model)
+        return self._converter.model_to_entity(user_model)
+
+    # NOTE: lookups select columns only and build entities from rows, skipping ORM identity map
+
+    async def get_by_username(self, username: str) -> User | None:
+        return await self._get_one(self._lookup_statements.get_by_username, {"username": username})
+
+    async def get_by_id(self, user_id: int) -> User | None:
+        return await self._get_one(self._lookup_statements.get_by_id, {"user_id": user_id}, repeat_missing=True)
+
+    async def is_username_taken(self, username: str) -> bool:
+        return await self._get_one_row(self._lookup_statements.get_id_by_username, {"username": username}) is not None
+
+    async def is_email_taken(self, email: str) -> bool:
+        return await self._get_one_row(self._lookup_statements.get_id_by_email, {"email": email}) is not None
+
+    async def get_many_by_ids(self, user_ids: list[int]) -> list[User | None]:
+        if not user_ids:
+            return []
+
+        users = await self._get_many_by_ids(self._read_session, set(user_ids))
+        missing_user_ids = set(user_ids) - users.keys()
+        if missing_user_ids and self._read_session is not self._session:
+            users |= await self._get_many_by_ids(self._session, missing_user_ids)
+        return [users.get(user_id) for user_id in user_ids]
+
+    async def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        await self._session.execute(
+            update(UserModel).where(UserModel.id == user_id).values(password_hash=password_hash)
+        )
+        await self._session.commit()
+
+    async def save_many(self, users: list[User]) -> list[User | None]:
+        if not users:
+            return []
+
+        # NOTE: conflicting rows are skipped by database instead of failing the whole statement,
+        # only inserted rows are returned, so they are matched back to users by username
+        statement = (
+            insert(UserModel)
+            .values(
+                [
+                    {
+                        "username": user.username,
+                        "email": user.email,
+                        "password_hash": user.password_hash,
+                        "registration_date": user.registration_date or func.now(),
+                    }
+                    for user in users
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(UserModel.id, UserModel.username, UserModel.registration_date)
+        )
+        inserted_rows = {row.username: row for row in await self._session.execute(statement)}
+        await self._session.commit()
+
+        saved_users: list[User | None] = []
+        for user in users:
+            row = inserted_rows.pop(user.username, None)
+            if row is None:
+                saved_users.append(None)
+                continue
+            saved_users.append(
+                User(
+                    id=row.id,
+                    username=user.username,
+                    email=user.email,
+                    password_hash=user.password_hash,
+                    registration_date=row.registration_date,
+                )
+            )
+        return saved_users
+
+    async def iterate_all(self, batch_size: int) -> AsyncIterator[User]:
+        # server-side cursor keeps memory constant no matter how many users there are
+        result = await self._read_session.stream(
+            select(*self._converter.columns).order_by(UserModel.id).execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            for row in rows:
+                yield self._converter.row_to_entity(row)
+
+    async def _get_one(
+        self, statement: Select, parameters: dict[str, Any], repeat_missing: bool = False
+    ) -> User | None:
+        row = await self._get_one_row(statement, parameters, repeat_missing)
+        if row is None:
+            return None
+        return self._converter.row_to_entity(row)
+
+    async def _get_one_row(
+        self, statement: Select, parameters: dict[str, Any], repeat_missing: bool = False
+    ) -> Row | None:
+        row = (await execute_read(self._session, self._read_session, statement, parameters)).first()
+        if row is None and repeat_missing and self._read_session is not self._session:
+            row = (await self._session.execute(statement, parameters)).first()
+        return row
+
+    async def _get_many_by_ids(self, session: AsyncSession, user_ids: set[int]) -> dict[int, User]:
+        result = await execute_read(
+            self._session, session, self._lookup_statements.get_many_by_ids, {"user_ids": list(user_ids)}
+        )
+        return {user.id: user for user in map(self._converter.row_to_entity, result)}
@@ -0,0 +1,40 @@
+import asyncio
+
+from author1zd.key_value_storage.redis.errors import RETRYABLE_REDIS_EXCEPTIONS
+from author1zd.objects.auth_info import AuthInfo
+from author1zd.settings import AuthInfoStorageSettings
+from author1zd.utility.circuit_breaker import CircuitBreaker
+from author1zd.utility.ttl_lru_cache import TtlLruCache
+
+_AUTH_INFO_CACHE: TtlLruCache[str, AuthInfo] | None = None
+_AUTH_INFO_CIRCUIT_BREAKER: CircuitBreaker | None = None
+
+
+def open_auth_info_storage(auth_info_storage_settings: AuthInfoStorageSettings) -> None:
+    # NOTE: cache and circuit breaker are shared by all requests of worker, so they live as long as worker does
+    global _AUTH_INFO_CACHE, _AUTH_INFO_CIRCUIT_BREAKER
+
+    if auth_info_storage_settings.local_cache_enabled:
+        _AUTH_INFO_CACHE = TtlLruCache(auth_info_storage_settings.local_cache_max_size)
+
+    if auth_info_storage_settings.circuit_failure_threshold is not None:
+        _AUTH_INFO_CIRCUIT_BREAKER = CircuitBreaker(
+            failure_threshold=auth_info_storage_settings.circuit_failure_threshold,
+            reset_timeout=auth_info_storage_settings.circuit_reset_timeout,
+            failure_exceptions=(*RETRYABLE_REDIS_EXCEPTIONS, asyncio.TimeoutError),
+        )
+
+
+def close_auth_info_storage() -> None:
+    global _AUTH_INFO_CACHE, _AUTH_INFO_CIRCUIT_BREAKER
+
+    _AUTH_INFO_CACHE = None
+    _AUTH_INFO_CIRCUIT_BREAKER = None
+
+
+def get_auth_info_cache() -> TtlLruCache[str, AuthInfo] | None:
+    return _AUTH_INFO_CACHE
+
+
+def get_auth_info_circuit_breaker() -> CircuitBreaker | None:
+    return _AUTH_INFO_CIRCUIT_BREAKER
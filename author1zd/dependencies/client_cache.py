@@ -0,0 +1,53 @@
+import asyncio
+
+from redis.asyncio import Redis
+
+from author1zd.database.cached.repositories.cached_client_repository import ClientCache
+from author1zd.key_value_storage.redis.invalidation import CLIENT_INVALIDATION_CHANNEL, listen_for_invalidations
+from author1zd.settings import ClientCacheSettings
+
+_CLIENT_CACHE: ClientCache | None = None
+_INVALIDATION_LISTENER: asyncio.Task | None = None
+
+
+def open_client_cache(client_cache_settings: ClientCacheSettings, redis_client: Redis | None) -> None:
+    # NOTE: without Redis there are no other workers to receive invalidations from
+    global _CLIENT_CACHE, _INVALIDATION_LISTENER
+
+    if not client_cache_settings.enabled:
+        return
+
+    _CLIENT_CACHE = ClientCache(
+        max_size=client_cache_settings.max_size,
+        ttl=client_cache_settings.ttl,
+        negative_ttl=client_cache_settings.negative_ttl,
+    )
+    if redis_client is None:
+        return
+
+    _INVALIDATION_LISTENER = asyncio.create_task(
+        listen_for_invalidations(
+            redis_client,
+            CLIENT_INVALIDATION_CHANNEL,
+            invalidate=_CLIENT_CACHE.invalidate,
+            invalidate_all=_CLIENT_CACHE.invalidate_all,
+        )
+    )
+
+
+async def close_client_cache() -> None:
+    global _CLIENT_CACHE, _INVALIDATION_LISTENER
+
+    if _INVALIDATION_LISTENER is not None:
+        _INVALIDATION_LISTENER.cancel()
+        try:
+            await _INVALIDATION_LISTENER
+        except asyncio.CancelledError:
+            pass
+
+    _CLIENT_CACHE = None
+    _INVALIDATION_LISTENER = None
+
+
+def get_client_cache() -> ClientCache | None:
+    return _CLIENT_CACHE
@@ -1,34 +1,167 @@
-from typing import Final
+import asyncio
+from typing import AsyncIterator
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from fastapi import Depends
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from author1zd.database.abstract.repositories.client_repository import ClientRepository
 from author1zd.database.abstract.repositories.user_repository import UserRepository
+from author1zd.database.cached.repositories.cached_client_repository import CachedClientRepository, ClientCache
+from author1zd.database.cached.repositories.cached_user_repository import CachedUserRepository, UserCache
+from author1zd.database.filtered.repositories.filtered_user_repository import FilteredUserRepository
+from author1zd.database.instrumented.repositories.instrumented_client_repository import InstrumentedClientRepository
+from author1zd.database.instrumented.repositories.instrumented_user_repository import InstrumentedUserRepository
 from author1zd.database.sqlalchemy.models import BaseModel
+from author1zd.database.sqlalchemy.replica_set import ReplicaSet, check_replica_health_periodically
 from author1zd.database.sqlalchemy.repositories.sqlalchemy_client_repository import SqlAlchemyClientRepository
 from author1zd.database.sqlalchemy.repositories.sqlalchemy_user_repository import SqlAlchemyUserRepository
+from author1zd.dependencies.client_cache import get_client_cache
+from author1zd.dependencies.key_value_storage import get_user_filter, mark_user_filter_stale
+from author1zd.dependencies.user_cache import get_user_cache
+from author1zd.key_value_storage.abstract.collections.bloom_filter import BloomFilter
 from author1zd.settings import PostgresSettings
 
 
-def _get_connection_string() -> str:
-    postgres_settings = PostgresSettings()
-    return (
-        f"postgresql+psycopg2://{postgres_settings.user}:{postgres_settings.password}"
-        f"@{postgres_settings.host}/{postgres_settings.database}"
+def _create_engine(postgres_settings: PostgresSettings, host: str | None = None) -> AsyncEngine:
+    return create_async_engine(
+        f"postgresql+asyncpg://{postgres_settings.user}:{postgres_settings.password}"
+        f"@{host or postgres_settings.host}/{postgres_settings.database}"
+        f"?prepared_statement_cache_size={postgres_settings.prepared_statement_cache_size}",
+        pool_size=postgres_settings.pool_size,
+        max_overflow=postgres_settings.max_overflow,
+        pool_timeout=postgres_settings.pool_timeout,
+        pool_recycle=postgres_settings.pool_recycle,
+        pool_pre_ping=postgres_settings.pool_pre_ping,
     )
 
 
-ENGINE: Final[Engine] = create_engine(_get_connection_string())
-BaseModel.metadata.create_all(ENGINE)
+_ENGINE: AsyncEngine | None = None
+_SESSION_MAKER: sessionmaker | None = None
+_REPLICA_SET: ReplicaSet | None = None
+_REPLICA_HEALTH_CHECKER: asyncio.Task | None = None
 
-Session = sessionmaker(ENGINE)
 
+def open_engine(postgres_settings: PostgresSettings) -> None:
+    # NOTE: engine connects lazily, so opening it does not wait for database
+    global _ENGINE, _SESSION_MAKER
 
-def create_user_repository() -> UserRepository:
-    return SqlAlchemyUserRepository(Session())
+    _ENGINE = _create_engine(postgres_settings)
+    _SESSION_MAKER = sessionmaker(_ENGINE, class_=AsyncSession, expire_on_commit=False)
 
 
-def create_client_repository() -> ClientRepository:
-    return SqlAlchemyClientRepository(Session())
+async def dispose_engine() -> None:
+    global _ENGINE, _SESSION_MAKER
+
+    if _ENGINE is not None:
+        await _ENGINE.dispose()
+        _ENGINE = None
+        _SESSION_MAKER = None
+
+
+def get_engine() -> AsyncEngine:
+    if _ENGINE is None:
+        raise RuntimeError("Database engine is not open")
+    return _ENGINE
+
+
+def open_session() -> AsyncSession:
+    if _SESSION_MAKER is None:
+        raise RuntimeError("Database engine is not open")
+    return _SESSION_MAKER()
+
+
+async def create_database_schema() -> None:
+    async with get_engine().begin() as connection:
+        await connection.run_sync(BaseModel.metadata.create_all)
+
+
+async def warm_up_engine(connections: int) -> None:
+    # NOTE: connections are held open together, so pool keeps all of them once they are returned
+    results = await asyncio.gather(
+        *(get_engine().connect().start() for _ in range(connections)), return_exceptions=True
+    )
+    opened = [result for result in results if isinstance(result, AsyncConnection)]
+
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        await asyncio.gather(*(connection.execute(text("SELECT 1")) for connection in opened))
+    finally:
+        await asyncio.gather(*(connection.close() for connection in opened))
+
+
+def open_read_replicas(postgres_settings: PostgresSettings) -> None:
+    global _REPLICA_SET, _REPLICA_HEALTH_CHECKER
+
+    if not postgres_settings.replica_hosts:
+        return
+
+    _REPLICA_SET = ReplicaSet(
+        get_engine(),
+        [_create_engine(postgres_settings, host) for host in postgres_settings.replica_hosts],
+        health_check_timeout=postgres_settings.replica_health_check_timeout,
+    )
+    _REPLICA_HEALTH_CHECKER = asyncio.create_task(
+        check_replica_health_periodically(_REPLICA_SET, postgres_settings.replica_health_check_interval)
+    )
+
+
+async def close_read_replicas() -> None:
+    global _REPLICA_SET, _REPLICA_HEALTH_CHECKER
+
+    if _REPLICA_HEALTH_CHECKER is not None:
+        _REPLICA_HEALTH_CHECKER.cancel()
+        try:
+            await _REPLICA_HEALTH_CHECKER
+        except asyncio.CancelledError:
+            pass
+        _REPLICA_HEALTH_CHECKER = None
+
+    if _REPLICA_SET is not None:
+        await asyncio.gather(*(replica.dispose() for replica in _REPLICA_SET.replicas))
+        _REPLICA_SET = None
+
+
+async def create_session() -> AsyncIterator[AsyncSession]:
+    # FastAPI caches dependency results per request,
+    # so every repository used by a request shares this session
+    async with open_session() as session:
+        yield session
+
+
+async def create_read_session(session: AsyncSession = Depends(create_session)) -> AsyncIterator[AsyncSession]:
+    # NOTE: without replicas reads share primary session of request
+    if _REPLICA_SET is None:
+        yield session
+        return
+
+    async with AsyncSession(_REPLICA_SET.get_read_engine(), expire_on_commit=False) as read_session:
+        yield read_session
+
+
+def create_user_repository(
+    session: AsyncSession = Depends(create_session),
+    read_session: AsyncSession = Depends(create_read_session),
+    user_cache: UserCache | None = Depends(get_user_cache),
+    user_filter: BloomFilter | None = Depends(get_user_filter),
+) -> UserRepository:
+    user_repository: UserRepository = InstrumentedUserRepository(SqlAlchemyUserRepository(session, read_session))
+    if user_cache is not None:
+        user_repository = CachedUserRepository(user_repository, user_cache)
+    if user_filter is not None:
+        user_repository = FilteredUserRepository(user_repository, user_filter, on_add_failure=mark_user_filter_stale)
+    return user_repository
+
+
+def create_client_repository(
+    session: AsyncSession = Depends(create_session),
+    read_session: AsyncSession = Depends(create_read_session),
+    client_cache: ClientCache | None = Depends(get_client_cache),
+) -> ClientRepository:
+    client_repository = InstrumentedClientRepository(SqlAlchemyClientRepository(session, read_session))
+    if client_cache is None:
+        return client_repository
+    return CachedClientRepository(client_repository, client_cache)
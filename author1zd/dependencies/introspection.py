@@ -0,0 +1,22 @@
+from author1zd.services.introspection import VerifiedTokenCache
+from author1zd.settings import IntrospectionSettings
+
+_VERIFIED_TOKEN_CACHE: VerifiedTokenCache | None = None
+
+
+def open_verified_token_cache(introspection_settings: IntrospectionSettings) -> None:
+    global _VERIFIED_TOKEN_CACHE
+
+    _VERIFIED_TOKEN_CACHE = VerifiedTokenCache(max_size=introspection_settings.verified_token_cache_max_size)
+
+
+def close_verified_token_cache() -> None:
+    global _VERIFIED_TOKEN_CACHE
+
+    _VERIFIED_TOKEN_CACHE = None
+
+
+def get_verified_token_cache() -> VerifiedTokenCache:
+    if _VERIFIED_TOKEN_CACHE is None:
+        raise RuntimeError("Verified token cache is not open")
+    return _VERIFIED_TOKEN_CACHE
@@ -1,56 +1,322 @@
+import asyncio
 import datetime
 
 from fastapi import Depends
-from redis.client import Redis
+from redis.asyncio import Redis, RedisCluster
+from redis.asyncio.cluster import ClusterNode
+from redis.asyncio.connection import UnixDomainSocketConnection
 
+from author1zd.dependencies.auth_info_storage import get_auth_info_cache, get_auth_info_circuit_breaker
 from author1zd.objects.auth_code_data import AuthCodeData
 from author1zd.objects.auth_info import AuthInfo
+from author1zd.key_value_storage.abstract.collections.bloom_filter import BloomFilter
+from author1zd.key_value_storage.abstract.collections.indexed_string_set import IndexedStringSet
+from author1zd.key_value_storage.abstract.collections.sliding_window_counter import SlidingWindowCounter
 from author1zd.key_value_storage.abstract.collections.string_set import StringSet
 from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.key_value_storage.cached.collections.cached_string_to_dataclass_map import CachedStringToDataclassMap
+from author1zd.key_value_storage.memory.collections.factory_functions import (
+    create_memory_auth_code_collection,
+    create_memory_auth_info_collection,
+    create_memory_login_rate_limit_collection,
+    create_memory_refresh_token_collection,
+    create_memory_signup_rate_limit_collection,
+    create_memory_revoked_access_token_collection,
+    create_memory_user_filter,
+)
+from author1zd.key_value_storage.memory.expiring_store import ExpiringStore
+from author1zd.key_value_storage.redis.cluster import RedisClient
+from author1zd.key_value_storage.redis.errors import RETRYABLE_REDIS_EXCEPTIONS
+from author1zd.key_value_storage.redis.connection_pool import ConnectionPoolStats, InstrumentedConnectionPool
 from author1zd.key_value_storage.redis.collections.factory_functions import (
     create_redis_auth_code_collection,
     create_redis_auth_info_collection,
+    create_redis_login_rate_limit_collection,
     create_redis_refresh_token_collection,
+    create_redis_signup_rate_limit_collection,
+    create_redis_revoked_access_token_collection,
+    create_redis_user_filter,
+)
+from author1zd.key_value_storage.resilient.collections.resilient_string_to_dataclass_map import (
+    ResilientStringToDataclassMap,
+)
+from author1zd.services.token import REFRESH_TOKEN_ID_SEPARATOR, prune_refresh_token_indexes_periodically
+from author1zd.settings import (
+    KeyValueStorageSettings,
+    RedisSettings,
+    AuthSettings,
+    AuthInfoStorageSettings,
+    JwtSettings,
+    RateLimitSettings,
+    UserFilterSettings,
+    settings_provider,
 )
-from author1zd.settings import RedisSettings, AuthSettings, JwtSettings, settings_provider
+from author1zd.utility.bloom import BloomFilterLayout
 
 
-def create_redis_client(
-    redis_settings: RedisSettings = Depends(settings_provider(RedisSettings)),
-) -> Redis:
-    return Redis(
-        host=redis_settings.host,
-        port=redis_settings.port,
+_REDIS_CONNECTION_POOL: InstrumentedConnectionPool | None = None
+_REDIS_CLUSTER: RedisCluster | None = None
+_MEMORY_STORE: ExpiringStore | None = None
+_REFRESH_TOKEN_INDEX_PRUNER: asyncio.Task | None = None
+_USER_FILTER: BloomFilter | None = None
+_USER_FILTER_STALE: asyncio.Event | None = None
+
+
+def open_key_value_storage(key_value_storage_settings: KeyValueStorageSettings, redis_settings: RedisSettings) -> None:
+    global _MEMORY_STORE
+
+    if key_value_storage_settings.backend == "memory":
+        _MEMORY_STORE = ExpiringStore(max_entries=key_value_storage_settings.memory_max_entries)
+    else:
+        open_redis_connection_pool(redis_settings)
+
+
+async def close_key_value_storage() -> None:
+    global _MEMORY_STORE
+
+    _MEMORY_STORE = None
+    await close_redis_connection_pool()
+
+
+def open_redis_connection_pool(redis_settings: RedisSettings) -> None:
+    global _REDIS_CONNECTION_POOL, _REDIS_CLUSTER
+
+    connection_kwargs = dict(
         password=redis_settings.password,
-        decode_responses=True,
+        socket_timeout=redis_settings.socket_timeout,
+        socket_connect_timeout=redis_settings.socket_connect_timeout,
+        health_check_interval=redis_settings.health_check_interval,
+    )
+
+    if redis_settings.cluster:
+        if redis_settings.unix_socket_path is not None:
+            raise RuntimeError("Redis Cluster nodes cannot be reached through unix socket")
+        if redis_settings.dataclass_encoding == "hash":
+            # NOTE: hash encoding relies on MULTI transactions, which cluster client does not support
+            raise RuntimeError("Redis Cluster requires 'msgpack' dataclass encoding")
+
+        # NOTE: cluster client keeps connection pool per node and fails instead of waiting when it is exhausted
+        _REDIS_CLUSTER = RedisCluster(
+            startup_nodes=[
+                ClusterNode(redis_settings.host, redis_settings.port),
+                *(_create_cluster_node(node) for node in redis_settings.cluster_nodes),
+            ],
+            read_from_replicas=redis_settings.read_from_replicas,
+            max_connections=redis_settings.max_connections,
+            **connection_kwargs,
+        )
+        # pub/sub messages are broadcast to every cluster node, so connections to single node are enough for them
+        connection_kwargs.update(host=redis_settings.host, port=redis_settings.port)
+    elif redis_settings.unix_socket_path is not None:
+        connection_kwargs.update(connection_class=UnixDomainSocketConnection, path=redis_settings.unix_socket_path)
+    else:
+        connection_kwargs.update(host=redis_settings.host, port=redis_settings.port)
+
+    _REDIS_CONNECTION_POOL = InstrumentedConnectionPool(
+        max_connections=redis_settings.max_connections,
+        timeout=redis_settings.pool_timeout,
+        **connection_kwargs,
     )
 
 
+def _create_cluster_node(node: str) -> ClusterNode:
+    host, _, port = node.rpartition(":")
+    if not host or not port.isdigit():
+        raise RuntimeError(f"Redis Cluster node '{node}' is not in 'host:port' format")
+    return ClusterNode(host, int(port))
+
+
+async def close_redis_connection_pool() -> None:
+    global _REDIS_CONNECTION_POOL, _REDIS_CLUSTER
+
+    if _REDIS_CLUSTER is not None:
+        await _REDIS_CLUSTER.close()
+        _REDIS_CLUSTER = None
+
+    if _REDIS_CONNECTION_POOL is not None:
+        await _REDIS_CONNECTION_POOL.disconnect()
+        _REDIS_CONNECTION_POOL = None
+
+
+def get_redis_connection_pool_stats() -> ConnectionPoolStats | None:
+    # NOTE: with Redis Cluster only pub/sub connections go through this pool
+    if _REDIS_CONNECTION_POOL is None:
+        return None
+    return _REDIS_CONNECTION_POOL.get_stats()
+
+
+def create_redis_client() -> RedisClient:
+    if _REDIS_CLUSTER is not None:
+        return _REDIS_CLUSTER
+    return create_redis_pubsub_client()
+
+
+def create_redis_pubsub_client() -> Redis:
+    if _REDIS_CONNECTION_POOL is None:
+        raise RuntimeError("Redis connection pool is not open")
+    return Redis(connection_pool=_REDIS_CONNECTION_POOL)
+
+
+async def warm_up_redis_connection_pool(connections: int) -> None:
+    # NOTE: concurrent commands take separate connections, which stay in pool once released
+    if _REDIS_CONNECTION_POOL is None:
+        return
+
+    if _REDIS_CLUSTER is not None:
+        await _REDIS_CLUSTER.initialize()
+        await asyncio.gather(*(_REDIS_CLUSTER.ping(target_nodes=RedisCluster.ALL_NODES) for _ in range(connections)))
+        return
+
+    redis_client = create_redis_client()
+    await asyncio.gather(*(redis_client.ping() for _ in range(connections)))
+
+
 def create_auth_info_collection(
-    redis_client: Redis = Depends(create_redis_client),
+    redis_settings: RedisSettings = Depends(settings_provider(RedisSettings)),
     auth_settings: AuthSettings = Depends(settings_provider(AuthSettings)),
+    auth_info_storage_settings: AuthInfoStorageSettings = Depends(settings_provider(AuthInfoStorageSettings)),
 ) -> StringToDataclassMap[AuthInfo]:
-    return create_redis_auth_info_collection(
-        redis_client,
-        default_ttl=datetime.timedelta(seconds=auth_settings.auth_expiration_time),
+    default_ttl = datetime.timedelta(seconds=auth_settings.auth_expiration_time)
+    if _MEMORY_STORE is not None:
+        return create_memory_auth_info_collection(_MEMORY_STORE, default_ttl)
+
+    collection: StringToDataclassMap[AuthInfo] = ResilientStringToDataclassMap(
+        create_redis_auth_info_collection(
+            create_redis_client(),
+            default_ttl=default_ttl,
+            encoding=redis_settings.dataclass_encoding,
+        ),
+        collection_name="auth_info",
+        retryable_exceptions=RETRYABLE_REDIS_EXCEPTIONS,
+        timeout=auth_info_storage_settings.timeout,
+        retries=auth_info_storage_settings.retries,
+        retry_base_delay=auth_info_storage_settings.retry_base_delay,
+        retry_max_delay=auth_info_storage_settings.retry_max_delay,
+        circuit_breaker=get_auth_info_circuit_breaker(),
     )
 
+    auth_info_cache = get_auth_info_cache()
+    if auth_info_cache is not None:
+        collection = CachedStringToDataclassMap(
+            collection,
+            auth_info_cache,
+            ttl=min(auth_info_storage_settings.local_cache_ttl, auth_settings.auth_expiration_time),
+        )
+    return collection
+
 
 def create_auth_code_collection(
-    redis_client: Redis = Depends(create_redis_client),
+    redis_settings: RedisSettings = Depends(settings_provider(RedisSettings)),
     auth_settings: AuthSettings = Depends(settings_provider(AuthSettings)),
 ) -> StringToDataclassMap[AuthCodeData]:
+    default_ttl = datetime.timedelta(seconds=auth_settings.auth_code_ttl)
+    if _MEMORY_STORE is not None:
+        return create_memory_auth_code_collection(_MEMORY_STORE, default_ttl)
     return create_redis_auth_code_collection(
-        redis_client,
-        default_ttl=datetime.timedelta(seconds=auth_settings.auth_code_ttl),
+        create_redis_client(),
+        default_ttl=default_ttl,
+        encoding=redis_settings.dataclass_encoding,
     )
 
 
 def create_refresh_token_collection(
-    redis_client: Redis = Depends(create_redis_client),
     jwt_settings: JwtSettings = Depends(settings_provider(JwtSettings)),
-) -> StringSet:
+) -> IndexedStringSet:
+    default_ttl = datetime.timedelta(seconds=jwt_settings.refresh_token_ttl)
+    if _MEMORY_STORE is not None:
+        return create_memory_refresh_token_collection(_MEMORY_STORE, default_ttl)
     return create_redis_refresh_token_collection(
-        redis_client,
-        default_ttl=datetime.timedelta(seconds=jwt_settings.refresh_token_ttl),
+        create_redis_client(), default_ttl=default_ttl, key_group_separator=REFRESH_TOKEN_ID_SEPARATOR
+    )
+
+
+def create_revoked_access_token_collection(
+    jwt_settings: JwtSettings = Depends(settings_provider(JwtSettings)),
+) -> StringSet:
+    # access token can not outlive its ttl, so revocation does not have to be kept any longer
+    default_ttl = datetime.timedelta(seconds=jwt_settings.access_token_ttl)
+    if _MEMORY_STORE is not None:
+        return create_memory_revoked_access_token_collection(_MEMORY_STORE, default_ttl)
+    return create_redis_revoked_access_token_collection(create_redis_client(), default_ttl=default_ttl)
+
+
+def create_login_rate_limit_collection(
+    rate_limit_settings: RateLimitSettings = Depends(settings_provider(RateLimitSettings)),
+) -> SlidingWindowCounter:
+    window = datetime.timedelta(seconds=rate_limit_settings.window)
+    if _MEMORY_STORE is not None:
+        return create_memory_login_rate_limit_collection(_MEMORY_STORE, window)
+    return create_redis_login_rate_limit_collection(create_redis_client(), window=window)
+
+
+def create_signup_rate_limit_collection(
+    rate_limit_settings: RateLimitSettings = Depends(settings_provider(RateLimitSettings)),
+) -> SlidingWindowCounter:
+    window = datetime.timedelta(seconds=rate_limit_settings.window)
+    if _MEMORY_STORE is not None:
+        return create_memory_signup_rate_limit_collection(_MEMORY_STORE, window)
+    return create_redis_signup_rate_limit_collection(create_redis_client(), window=window)
+
+
+def create_user_filter(
+    user_filter_settings: UserFilterSettings = Depends(settings_provider(UserFilterSettings)),
+) -> BloomFilter:
+    layout = BloomFilterLayout.for_capacity(user_filter_settings.capacity, user_filter_settings.false_positive_rate)
+    if _MEMORY_STORE is not None:
+        return create_memory_user_filter(layout)
+    return create_redis_user_filter(
+        create_redis_client(), layout=layout, rebuild_batch_size=user_filter_settings.build_batch_size
+    )
+
+
+def open_user_filter(user_filter_settings: UserFilterSettings) -> None:
+    # NOTE: filter is created once per worker, in-memory filter keeps its bitmap for as long as worker runs
+    global _USER_FILTER, _USER_FILTER_STALE
+
+    if user_filter_settings.enabled:
+        _USER_FILTER = create_user_filter(user_filter_settings)
+        _USER_FILTER_STALE = asyncio.Event()
+
+
+def close_user_filter() -> None:
+    global _USER_FILTER, _USER_FILTER_STALE
+
+    _USER_FILTER = None
+    _USER_FILTER_STALE = None
+
+
+def get_user_filter() -> BloomFilter | None:
+    return _USER_FILTER
+
+
+def get_user_filter_stale_event() -> asyncio.Event | None:
+    return _USER_FILTER_STALE
+
+
+def mark_user_filter_stale() -> None:
+    """Report that filter misses saved users, worker's filter builder clears and rebuilds it"""
+    if _USER_FILTER_STALE is not None:
+        _USER_FILTER_STALE.set()
+
+
+def start_refresh_token_index_pruner(jwt_settings: JwtSettings) -> None:
+    global _REFRESH_TOKEN_INDEX_PRUNER
+
+    _REFRESH_TOKEN_INDEX_PRUNER = asyncio.create_task(
+        prune_refresh_token_indexes_periodically(
+            create_refresh_token_collection(jwt_settings),
+            interval=jwt_settings.refresh_token_index_prune_interval,
+        )
     )
+
+
+async def stop_refresh_token_index_pruner() -> None:
+    global _REFRESH_TOKEN_INDEX_PRUNER
+
+    if _REFRESH_TOKEN_INDEX_PRUNER is not None:
+        _REFRESH_TOKEN_INDEX_PRUNER.cancel()
+        try:
+            await _REFRESH_TOKEN_INDEX_PRUNER
+        except asyncio.CancelledError:
+            pass
+        _REFRESH_TOKEN_INDEX_PRUNER = None
@@ -0,0 +1,34 @@
+from author1zd.settings import PasswordHashingSettings
+from author1zd.utility.password import PasswordHasher, create_password_context
+
+_PASSWORD_HASHER: PasswordHasher | None = None
+
+
+def open_password_hasher(password_hashing_settings: PasswordHashingSettings) -> None:
+    global _PASSWORD_HASHER
+
+    _PASSWORD_HASHER = PasswordHasher(
+        max_workers=password_hashing_settings.max_workers,
+        max_queue_depth=password_hashing_settings.max_queue_depth,
+        context=create_password_context(
+            scheme=password_hashing_settings.scheme,
+            bcrypt_rounds=password_hashing_settings.bcrypt_rounds,
+            argon2_time_cost=password_hashing_settings.argon2_time_cost,
+            argon2_memory_cost=password_hashing_settings.argon2_memory_cost,
+            argon2_parallelism=password_hashing_settings.argon2_parallelism,
+        ),
+    )
+
+
+def close_password_hasher() -> None:
+    global _PASSWORD_HASHER
+
+    if _PASSWORD_HASHER is not None:
+        _PASSWORD_HASHER.shutdown()
+        _PASSWORD_HASHER = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    if _PASSWORD_HASHER is None:
+        raise RuntimeError("Password hasher is not open")
+    return _PASSWORD_HASHER
@@ -0,0 +1,46 @@
+from fastapi import Depends, Request
+
+from author1zd.settings import RateLimitSettings, settings_provider
+from author1zd.utility.token_bucket import TokenBucketLimiter
+
+_LOCAL_RATE_LIMITER: TokenBucketLimiter | None = None
+
+
+def open_local_rate_limiter(rate_limit_settings: RateLimitSettings) -> None:
+    global _LOCAL_RATE_LIMITER
+
+    if not rate_limit_settings.local_enabled:
+        return
+
+    _LOCAL_RATE_LIMITER = TokenBucketLimiter(
+        rate=rate_limit_settings.local_rate,
+        burst=rate_limit_settings.local_burst,
+        max_keys=rate_limit_settings.local_max_addresses,
+    )
+
+
+def close_local_rate_limiter() -> None:
+    global _LOCAL_RATE_LIMITER
+
+    _LOCAL_RATE_LIMITER = None
+
+
+def get_local_rate_limiter() -> TokenBucketLimiter | None:
+    return _LOCAL_RATE_LIMITER
+
+
+def get_client_address(
+    request: Request,
+    rate_limit_settings: RateLimitSettings = Depends(settings_provider(RateLimitSettings)),
+) -> str:
+    if rate_limit_settings.trust_forwarded_for:
+        # NOTE: header may be repeated, proxies append to the last one
+        forwarded_for = [
+            address.strip() for header in request.headers.getlist("x-forwarded-for") for address in header.split(",")
+        ]
+        trusted_proxies = rate_limit_settings.forwarded_for_trusted_proxies
+        # header with fewer entries than trusted proxies did not pass all of them, so none of its entries is trusted
+        if 0 < trusted_proxies <= len(forwarded_for) and forwarded_for[-trusted_proxies]:
+            return forwarded_for[-trusted_proxies]
+
+    return request.client.host if request.client is not None else "unknown"
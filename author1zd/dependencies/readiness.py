@@ -0,0 +1,59 @@
+import asyncio
+import logging
+import time
+from typing import Final
+
+from author1zd.dependencies.database import warm_up_engine
+from author1zd.dependencies.key_value_storage import warm_up_redis_connection_pool
+from author1zd.monitoring.metrics import WARM_UP_DURATION_SECONDS
+from author1zd.settings import PostgresSettings, StartupSettings
+
+LOGGER: Final = logging.getLogger(__name__)
+
+_WARM_UP: asyncio.Task | None = None
+
+
+def start_warm_up(startup_settings: StartupSettings, postgres_settings: PostgresSettings) -> None:
+    # NOTE: worker accepts requests right away, readiness probe keeps traffic away until pools are warm
+    global _WARM_UP
+
+    _WARM_UP = asyncio.create_task(
+        _warm_up(
+            database_connections=min(startup_settings.warm_up_database_connections, postgres_settings.pool_size),
+            redis_connections=startup_settings.warm_up_redis_connections,
+            retry_interval=startup_settings.warm_up_retry_interval,
+        )
+    )
+
+
+async def stop_warm_up() -> None:
+    global _WARM_UP
+
+    if _WARM_UP is not None:
+        _WARM_UP.cancel()
+        try:
+            await _WARM_UP
+        except asyncio.CancelledError:
+            pass
+        _WARM_UP = None
+
+
+def is_ready() -> bool:
+    return _WARM_UP is not None and _WARM_UP.done() and not _WARM_UP.cancelled()
+
+
+async def _warm_up(database_connections: int, redis_connections: int, retry_interval: float) -> None:
+    start = time.perf_counter()
+
+    while True:
+        try:
+            await asyncio.gather(warm_up_engine(database_connections), warm_up_redis_connection_pool(redis_connections))
+        except Exception:
+            LOGGER.warning("Failed to warm up connection pools, retrying", exc_info=True)
+            await asyncio.sleep(retry_interval)
+        else:
+            break
+
+    elapsed = time.perf_counter() - start
+    WARM_UP_DURATION_SECONDS.set(elapsed)
+    LOGGER.info("Connection pools warmed up in %.3f s", elapsed)
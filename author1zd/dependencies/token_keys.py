@@ -0,0 +1,34 @@
+from jose.constants import ALGORITHMS
+
+from author1zd.services.key_ring import KeyRing, TokenKeyRings
+from author1zd.settings import JwtSettings
+
+_TOKEN_KEY_RINGS: TokenKeyRings | None = None
+
+
+def open_token_key_rings(jwt_settings: JwtSettings) -> None:
+    global _TOKEN_KEY_RINGS
+
+    if jwt_settings.algorithm in ALGORITHMS.HMAC:
+        if jwt_settings.access_token_secret_key is None:
+            raise ValueError(f"Access token secret key is required for '{jwt_settings.algorithm}' algorithm")
+        access_token_key_ring = KeyRing.from_secret(jwt_settings.access_token_secret_key, jwt_settings.algorithm)
+    else:
+        access_token_key_ring = KeyRing.from_pem_files(
+            jwt_settings.access_token_private_key_files, jwt_settings.algorithm
+        )
+
+    refresh_token_algorithm = jwt_settings.refresh_token_algorithm
+    if refresh_token_algorithm is None:
+        refresh_token_algorithm = jwt_settings.algorithm if jwt_settings.algorithm in ALGORITHMS.HMAC else "HS256"
+
+    _TOKEN_KEY_RINGS = TokenKeyRings(
+        access_token=access_token_key_ring,
+        refresh_token=KeyRing.from_secret(jwt_settings.refresh_token_secret_key, refresh_token_algorithm),
+    )
+
+
+def get_token_key_rings() -> TokenKeyRings:
+    if _TOKEN_KEY_RINGS is None:
+        raise RuntimeError("Token key rings are not open")
+    return _TOKEN_KEY_RINGS
@@ -0,0 +1,72 @@
+import asyncio
+import datetime
+import functools
+
+from redis.asyncio import Redis
+
+from author1zd.database.cached.repositories.cached_user_repository import UserCache
+from author1zd.key_value_storage.redis.cluster import RedisClient
+from author1zd.key_value_storage.redis.collections.factory_functions import create_redis_user_collection
+from author1zd.key_value_storage.redis.invalidation import (
+    USER_INVALIDATION_CHANNEL,
+    listen_for_invalidations,
+    publish_invalidation,
+)
+from author1zd.settings import UserCacheSettings
+
+_USER_CACHE: UserCache | None = None
+_INVALIDATION_LISTENER: asyncio.Task | None = None
+
+
+def open_user_cache(
+    user_cache_settings: UserCacheSettings, redis_client: RedisClient | None, redis_pubsub_client: Redis | None
+) -> None:
+    # NOTE: without Redis there is neither shared tier nor other workers to invalidate
+    global _USER_CACHE, _INVALIDATION_LISTENER
+
+    if not user_cache_settings.enabled:
+        return
+
+    if redis_client is None or redis_pubsub_client is None:
+        _USER_CACHE = UserCache(
+            max_size=user_cache_settings.max_size,
+            ttl=user_cache_settings.ttl,
+            shared_collection=None,
+            publish_invalidation=None,
+        )
+        return
+
+    _USER_CACHE = UserCache(
+        max_size=user_cache_settings.max_size,
+        ttl=user_cache_settings.ttl,
+        shared_collection=create_redis_user_collection(
+            redis_client, default_ttl=datetime.timedelta(seconds=user_cache_settings.shared_ttl)
+        ),
+        publish_invalidation=functools.partial(publish_invalidation, redis_pubsub_client, USER_INVALIDATION_CHANNEL),
+    )
+    _INVALIDATION_LISTENER = asyncio.create_task(
+        listen_for_invalidations(
+            redis_pubsub_client,
+            USER_INVALIDATION_CHANNEL,
+            invalidate=_USER_CACHE.drop,
+            invalidate_all=_USER_CACHE.drop_all,
+        )
+    )
+
+
+async def close_user_cache() -> None:
+    global _USER_CACHE, _INVALIDATION_LISTENER
+
+    if _INVALIDATION_LISTENER is not None:
+        _INVALIDATION_LISTENER.cancel()
+        try:
+            await _INVALIDATION_LISTENER
+        except asyncio.CancelledError:
+            pass
+
+    _USER_CACHE = None
+    _INVALIDATION_LISTENER = None
+
+
+def get_user_cache() -> UserCache | None:
+    return _USER_CACHE
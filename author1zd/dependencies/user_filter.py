@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from typing import Final
+
+from author1zd.database.filtered.repositories.filtered_user_repository import iterate_user_filter_values
+from author1zd.database.sqlalchemy.repositories.sqlalchemy_user_repository import SqlAlchemyUserRepository
+from author1zd.dependencies.database import open_session
+from author1zd.dependencies.key_value_storage import get_user_filter, get_user_filter_stale_event
+from author1zd.key_value_storage.abstract.collections.bloom_filter import BloomFilter
+from author1zd.settings import UserFilterSettings
+
+LOGGER: Final = logging.getLogger(__name__)
+
+_USER_FILTER_BUILDER: asyncio.Task | None = None
+
+
+def start_user_filter_builder(user_filter_settings: UserFilterSettings) -> None:
+    # NOTE: filter shared through Redis is built once by whichever worker gets to it first,
+    # signups check every username and email in database until it is built
+    global _USER_FILTER_BUILDER
+
+    user_filter = get_user_filter()
+    stale_event = get_user_filter_stale_event()
+    if user_filter is None or stale_event is None:
+        return
+
+    _USER_FILTER_BUILDER = asyncio.create_task(
+        maintain_user_filter(
+            user_filter,
+            stale_event,
+            batch_size=user_filter_settings.build_batch_size,
+            retry_interval=user_filter_settings.build_retry_interval,
+        )
+    )
+
+
+async def stop_user_filter_builder() -> None:
+    global _USER_FILTER_BUILDER
+
+    if _USER_FILTER_BUILDER is not None:
+        _USER_FILTER_BUILDER.cancel()
+        try:
+            await _USER_FILTER_BUILDER
+        except asyncio.CancelledError:
+            pass
+        _USER_FILTER_BUILDER = None
+
+
+async def maintain_user_filter(
+    user_filter: BloomFilter, stale_event: asyncio.Event, batch_size: int, retry_interval: float
+) -> None:
+    """Build filter unless it was built already, then clear and rebuild it every time it is reported stale"""
+    await build_user_filter(user_filter, batch_size=batch_size, retry_interval=retry_interval)
+    while True:
+        await stale_event.wait()
+        stale_event.clear()
+        # cleared filter sends every check to database, so it is safe to use while it is rebuilt
+        await clear_user_filter(user_filter, retry_interval=retry_interval)
+        await build_user_filter(user_filter, batch_size=batch_size, retry_interval=retry_interval)
+
+
+async def clear_user_filter(user_filter: BloomFilter, retry_interval: float) -> None:
+    while True:
+        try:
+            await user_filter.clear()
+            LOGGER.info("Stale user filter was cleared")
+            return
+        except Exception:
+            LOGGER.warning("Failed to clear stale user filter, retrying", exc_info=True)
+
+        await asyncio.sleep(retry_interval)
+
+
+async def build_user_filter(
+    user_filter: BloomFilter, batch_size: int, retry_interval: float, force: bool = False
+) -> None:
+    """Fill filter with usernames and emails of all users unless it was built already,
+    wait for it if other process builds it at the moment"""
+    while True:
+        try:
+            if not force and await user_filter.is_built():
+                return
+
+            async with open_session() as session:
+                users = SqlAlchemyUserRepository(session).iterate_all(batch_size)
+                if await user_filter.rebuild(iterate_user_filter_values(users)):
+                    LOGGER.info("User filter was built")
+                    return
+        except Exception:
+            LOGGER.warning("Failed to build user filter, retrying", exc_info=True)
+
+        force = False
+        await asyncio.sleep(retry_interval)
@@ -0,0 +1,18 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class TokenIntrospection(BaseModel):
+    active: bool
+    token_type: Literal["access_token", "refresh_token"] | None = None
+    client_id: str | None = None
+    username: str | None = None
+    email: str | None = None
+    sub: str | None = None
+    exp: int | None = None
+    jti: str | None = None
+
+
+class TokenIntrospectionBatch(BaseModel):
+    tokens: list[TokenIntrospection]
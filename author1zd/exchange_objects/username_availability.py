@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class UsernameAvailability(BaseModel):
+    username: str
+    taken: bool
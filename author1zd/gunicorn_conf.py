@@ -0,0 +1,47 @@
+"""Gunicorn configuration for running several worker processes on one host
+
+Run with: gunicorn -c python:author1zd.gunicorn_conf author1zd.app:app
+
+Application is imported once by master and forked into workers. Database engines, Redis pools, executors and
+background tasks are created by startup hooks, so every worker opens its own connections after fork.
+Send HUP to master to reload: new workers are started and old ones finish in-flight requests before exiting.
+"""
+import glob
+import os
+import tempfile
+
+from author1zd.settings import KeyValueStorageSettings, ServerSettings
+from author1zd.utility.cpu import get_available_cpu_count
+
+_server_settings = ServerSettings()
+_cpu_count = get_available_cpu_count()
+
+bind = _server_settings.bind
+workers = _server_settings.workers or _cpu_count
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+graceful_timeout = _server_settings.graceful_timeout
+keepalive = _server_settings.keepalive
+max_requests = _server_settings.max_requests
+max_requests_jitter = _server_settings.max_requests_jitter
+
+if workers > 1 and KeyValueStorageSettings().backend == "memory":
+    raise RuntimeError("In-memory key-value storage is not shared between workers, use Redis or run single worker")
+
+# password hashing threads of all workers together should not outnumber CPUs
+os.environ.setdefault("PASSWORD_HASHING_MAX_WORKERS", str(max(1, _cpu_count // workers)))
+
+# metrics of all workers are merged through files, directory has to be set before application is imported
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", tempfile.mkdtemp(prefix="author1zd-metrics-"))
+
+
+def on_starting(server) -> None:
+    # files left by previous run would be merged into metrics of this one
+    for path in glob.glob(os.path.join(os.environ["PROMETHEUS_MULTIPROC_DIR"], "*.db")):
+        os.remove(path)
+
+
+def child_exit(server, worker) -> None:
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
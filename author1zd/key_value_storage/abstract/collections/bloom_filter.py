@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+
+class BloomFilter(ABC):
+    # NOTE: filter never reports added value as missing, but may report value that was never added as present,
+    # filter that was not built yet reports every value as present
+
+    @abstractmethod
+    async def add(self, values: list[str]) -> None:
+        """Add values to filter and to filter being rebuilt at the moment"""
+
+    @abstractmethod
+    async def might_contain(self, value: str) -> bool:
+        """Check whether value could have been added to filter"""
+
+    @abstractmethod
+    async def is_built(self) -> bool:
+        """Check whether filter was built"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop filter, so that it reports every value as present until it is rebuilt"""
+
+    @abstractmethod
+    async def rebuild(self, values: AsyncIterator[str]) -> bool:
+        """Build new filter from values and replace current one with it,
+        return False without building if filter is already being rebuilt"""
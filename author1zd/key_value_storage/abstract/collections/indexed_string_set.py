@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+
+
+class IndexedStringSet(ABC):
+    # NOTE: every key is added to one or more indexes when it is saved,
+    # so all keys of an index can be removed at once
+
+    @abstractmethod
+    async def save(self, key: str, indexes: list[str]) -> None:
+        """Save key to set and add it to indexes"""
+
+    @abstractmethod
+    async def contains(self, key: str) -> bool:
+        """Check if set contains key"""
+
+    @abstractmethod
+    async def contains_many(self, keys: list[str]) -> list[bool]:
+        """Check if set contains each of keys"""
+
+    @abstractmethod
+    async def remove(self, key: str) -> None:
+        """Remove key from set"""
+
+    @abstractmethod
+    async def replace(self, old_key: str, new_key: str, indexes: list[str]) -> bool:
+        """Atomically replace old key with new key in set and indexes,
+        return False and keep set unchanged if set did not contain old key"""
+
+    @abstractmethod
+    async def remove_by_index(self, index: str) -> int:
+        """Remove all keys added to index before removal started, keys added while removal runs may be left,
+        return number of removed keys"""
+
+    @abstractmethod
+    async def prune_indexes(self, interval: float) -> bool:
+        """Remove expired keys from indexes unless any worker sharing collection did so within last interval seconds,
+        return whether indexes were pruned"""
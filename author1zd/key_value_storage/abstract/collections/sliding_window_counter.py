@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class SlidingWindowCounter(ABC):
+    # NOTE: hits are counted in fixed windows, count of previous window is weighted
+    # by the part of it that still overlaps sliding window ending now
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int) -> float:
+        """Atomically count hit of key if key was hit less than limit times within window,
+        return 0 if hit was counted or number of seconds until it can be counted otherwise"""
@@ -3,13 +3,17 @@ from abc import ABC, abstractmethod
 
 class StringSet(ABC):
     @abstractmethod
-    def save(self, key: str) -> None:
+    async def save(self, key: str) -> None:
         """Save key to set"""
 
     @abstractmethod
-    def contains(self, key: str) -> bool:
+    async def contains(self, key: str) -> bool:
         """Check if set contains key"""
 
     @abstractmethod
-    def remove(self, key: str) -> None:
+    async def contains_many(self, keys: list[str]) -> list[bool]:
+        """Check if set contains each of keys"""
+
+    @abstractmethod
+    async def remove(self, key: str) -> None:
         """Remove key from set"""
@@ -7,13 +7,17 @@ TObject = TypeVar("TObject")
 
 class StringToDataclassMap(ABC, Generic[TObject]):
     @abstractmethod
-    def save(self, key: str, obj: TObject) -> None:
+    async def save(self, key: str, obj: TObject) -> None:
         """Save key:object pair to map"""
 
     @abstractmethod
-    def get(self, key: str) -> TObject | None:
+    async def get(self, key: str) -> TObject | None:
         """Get object by key"""
 
     @abstractmethod
-    def remove(self, key: str) -> None:
+    async def remove(self, key: str) -> None:
         """Remove key:object pair from map"""
+
+    @abstractmethod
+    async def pop(self, key: str) -> TObject | None:
+        """Atomically remove key:object pair from map and return object"""
@@ -0,0 +1,40 @@
+from typing import TypeVar
+
+from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.utility.ttl_lru_cache import TtlLruCache
+
+TObject = TypeVar("TObject")
+
+
+class CachedStringToDataclassMap(StringToDataclassMap[TObject]):
+    # NOTE: objects are written through to shared collection and kept in worker local cache for a short time, so
+    # peeks at objects read them back without round trip, shared collection alone decides whether object still
+    # exists when it is consumed, so local copy that outlived object elsewhere can never be popped
+
+    def __init__(self, collection: StringToDataclassMap[TObject], cache: TtlLruCache[str, TObject], ttl: float) -> None:
+        self._collection = collection
+        self._cache = cache
+        self._ttl = ttl
+
+    async def save(self, key: str, obj: TObject) -> None:
+        # cached only once shared collection has it, failed save leaves nothing behind
+        await self._collection.save(key, obj)
+        self._cache.set(key, obj, ttl=self._ttl)
+
+    async def get(self, key: str) -> TObject | None:
+        obj = self._cache.get(key)
+        if obj is not None:
+            return obj
+
+        obj = await self._collection.get(key)
+        if obj is not None:
+            self._cache.set(key, obj, ttl=self._ttl)
+        return obj
+
+    async def remove(self, key: str) -> None:
+        self._cache.remove(key)
+        await self._collection.remove(key)
+
+    async def pop(self, key: str) -> TObject | None:
+        self._cache.remove(key)
+        return await self._collection.pop(key)
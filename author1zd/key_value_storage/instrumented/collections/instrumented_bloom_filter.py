@@ -0,0 +1,50 @@
+from typing import AsyncIterator
+
+from author1zd.key_value_storage.abstract.collections.bloom_filter import BloomFilter
+from author1zd.monitoring.instrumentation import timed
+from author1zd.monitoring.metrics import KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS
+
+
+class InstrumentedBloomFilter(BloomFilter):
+    def __init__(self, collection: BloomFilter, collection_name: str) -> None:
+        self._collection = collection
+        self._collection_name = collection_name
+
+    async def add(self, values: list[str]) -> None:
+        with timed(
+            "key_value_storage.operation",
+            KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS,
+            collection=self._collection_name,
+            operation="add",
+        ):
+            await self._collection.add(values)
+
+    async def might_contain(self, value: str) -> bool:
+        with timed(
+            "key_value_storage.operation",
+            KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS,
+            collection=self._collection_name,
+            operation="might_contain",
+        ):
+            return await self._collection.might_contain(value)
+
+    async def is_built(self) -> bool:
+        with timed(
+            "key_value_storage.operation",
+            KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS,
+            collection=self._collection_name,
+            operation="is_built",
+        ):
+            return await self._collection.is_built()
+
+    async def clear(self) -> None:
+        with timed(
+            "key_value_storage.operation",
+            KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS,
+            collection=self._collection_name,
+            operation="clear",
+        ):
+            await self._collection.clear()
+
+    async def rebuild(self, values: AsyncIterator[str]) -> bool:
+        return await self._collection.rebuild(values)
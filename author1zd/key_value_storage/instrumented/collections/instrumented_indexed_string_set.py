@@ -0,0 +1,45 @@
+from author1zd.key_value_storage.abstract.collections.indexed_string_set import IndexedStringSet
+from author1zd.monitoring.instrumentation import timed
+from author1zd.monitoring.metrics import KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS
+
+
+class InstrumentedIndexedStringSet(IndexedStringSet):
+    def __init__(self, collection: IndexedStringSet, collection_name: str) -> None:
+        self._collection = collection
+        self._collection_name = collection_name
+
+    async def save(self, key: str, indexes: list[str]) -> None:
+        with self._timed("save"):
+            await self._collection.save(key, indexes)
+
+    async def contains(self, key: str) -> bool:
+        with self._timed("contains"):
+            return await self._collection.contains(key)
+
+    async def contains_many(self, keys: list[str]) -> list[bool]:
+        with self._timed("contains_many"):
+            return await self._collection.contains_many(keys)
+
+    async def remove(self, key: str) -> None:
+        with self._timed("remove"):
+            await self._collection.remove(key)
+
+    async def replace(self, old_key: str, new_key: str, indexes: list[str]) -> bool:
+        with self._timed("replace"):
+            return await self._collection.replace(old_key, new_key, indexes)
+
+    async def remove_by_index(self, index: str) -> int:
+        with self._timed("remove_by_index"):
+            return await self._collection.remove_by_index(index)
+
+    async def prune_indexes(self, interval: float) -> bool:
+        with self._timed("prune_indexes"):
+            return await self._collection.prune_indexes(interval)
+
+    def _timed(self, operation: str):
+        return timed(
+            "key_value_storage.operation",
+            KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS,
+            collection=self._collection_name,
+            operation=operation,
+        )
@@ -0,0 +1,18 @@
+from author1zd.key_value_storage.abstract.collections.sliding_window_counter import SlidingWindowCounter
+from author1zd.monitoring.instrumentation import timed
+from author1zd.monitoring.metrics import KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS
+
+
+class InstrumentedSlidingWindowCounter(SlidingWindowCounter):
+    def __init__(self, collection: SlidingWindowCounter, collection_name: str) -> None:
+        self._collection = collection
+        self._collection_name = collection_name
+
+    async def hit(self, key: str, limit: int) -> float:
+        with timed(
+            "key_value_storage.operation",
+            KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS,
+            collection=self._collection_name,
+            operation="hit",
+        ):
+            return await self._collection.hit(key, limit)
@@ -0,0 +1,33 @@
+from author1zd.key_value_storage.abstract.collections.string_set import StringSet
+from author1zd.monitoring.instrumentation import timed
+from author1zd.monitoring.metrics import KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS
+
+
+class InstrumentedStringSet(StringSet):
+    def __init__(self, collection: StringSet, collection_name: str) -> None:
+        self._collection = collection
+        self._collection_name = collection_name
+
+    async def save(self, key: str) -> None:
+        with self._timed("save"):
+            await self._collection.save(key)
+
+    async def contains(self, key: str) -> bool:
+        with self._timed("contains"):
+            return await self._collection.contains(key)
+
+    async def contains_many(self, keys: list[str]) -> list[bool]:
+        with self._timed("contains_many"):
+            return await self._collection.contains_many(keys)
+
+    async def remove(self, key: str) -> None:
+        with self._timed("remove"):
+            await self._collection.remove(key)
+
+    def _timed(self, operation: str):
+        return timed(
+            "key_value_storage.operation",
+            KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS,
+            collection=self._collection_name,
+            operation=operation,
+        )
@@ -0,0 +1,37 @@
+from typing import TypeVar
+
+from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.monitoring.instrumentation import timed
+from author1zd.monitoring.metrics import KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS
+
+TObject = TypeVar("TObject")
+
+
+class InstrumentedStringToDataclassMap(StringToDataclassMap[TObject]):
+    def __init__(self, collection: StringToDataclassMap[TObject], collection_name: str) -> None:
+        self._collection = collection
+        self._collection_name = collection_name
+
+    async def save(self, key: str, obj: TObject) -> None:
+        with self._timed("save"):
+            await self._collection.save(key, obj)
+
+    async def get(self, key: str) -> TObject | None:
+        with self._timed("get"):
+            return await self._collection.get(key)
+
+    async def remove(self, key: str) -> None:
+        with self._timed("remove"):
+            await self._collection.remove(key)
+
+    async def pop(self, key: str) -> TObject | None:
+        with self._timed("pop"):
+            return await self._collection.pop(key)
+
+    def _timed(self, operation: str):
+        return timed(
+            "key_value_storage.operation",
+            KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS,
+            collection=self._collection_name,
+            operation=operation,
+        )
@@ -0,0 +1,51 @@
+import datetime
+
+from author1zd.objects.auth_code_data import AuthCodeData
+from author1zd.objects.auth_info import AuthInfo
+from author1zd.key_value_storage.memory.collections.memory_bloom_filter import MemoryBloomFilter
+from author1zd.key_value_storage.memory.collections.memory_indexed_string_set import MemoryIndexedStringSet
+from author1zd.key_value_storage.memory.collections.memory_sliding_window_counter import MemorySlidingWindowCounter
+from author1zd.key_value_storage.memory.collections.memory_string_set import MemoryStringSet
+from author1zd.key_value_storage.memory.collections.memory_string_to_dataclass_map import MemoryStringToDataclassMap
+from author1zd.key_value_storage.memory.expiring_store import ExpiringStore
+from author1zd.utility.bloom import BloomFilterLayout
+
+
+def create_memory_auth_code_collection(
+    store: ExpiringStore, default_ttl: datetime.timedelta
+) -> MemoryStringToDataclassMap[AuthCodeData]:
+    return MemoryStringToDataclassMap(store, collection_prefix="auth_code", ttl=default_ttl)
+
+
+def create_memory_auth_info_collection(
+    store: ExpiringStore, default_ttl: datetime.timedelta
+) -> MemoryStringToDataclassMap[AuthInfo]:
+    return MemoryStringToDataclassMap(store, collection_prefix="auth_info", ttl=default_ttl)
+
+
+def create_memory_refresh_token_collection(
+    store: ExpiringStore, default_ttl: datetime.timedelta
+) -> MemoryIndexedStringSet:
+    return MemoryIndexedStringSet(store, collection_prefix="refresh_token", ttl=default_ttl)
+
+
+def create_memory_revoked_access_token_collection(
+    store: ExpiringStore, default_ttl: datetime.timedelta
+) -> MemoryStringSet:
+    return MemoryStringSet(store, collection_prefix="revoked_access_token", ttl=default_ttl)
+
+
+def create_memory_login_rate_limit_collection(
+    store: ExpiringStore, window: datetime.timedelta
+) -> MemorySlidingWindowCounter:
+    return MemorySlidingWindowCounter(store, collection_prefix="rate_limit:login", window=window)
+
+
+def create_memory_signup_rate_limit_collection(
+    store: ExpiringStore, window: datetime.timedelta
+) -> MemorySlidingWindowCounter:
+    return MemorySlidingWindowCounter(store, collection_prefix="rate_limit:signup", window=window)
+
+
+def create_memory_user_filter(layout: BloomFilterLayout) -> MemoryBloomFilter:
+    return MemoryBloomFilter(layout)
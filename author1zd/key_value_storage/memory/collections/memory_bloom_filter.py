@@ -0,0 +1,51 @@
+from typing import AsyncIterator
+
+from author1zd.key_value_storage.abstract.collections.bloom_filter import BloomFilter
+from author1zd.utility.bloom import BloomFilterLayout
+
+
+class MemoryBloomFilter(BloomFilter):
+    # NOTE: bitmaps are kept by filter itself instead of expiring store, so store limits can never drop them
+    # and filter has to be created once per worker
+
+    def __init__(self, layout: BloomFilterLayout) -> None:
+        self._layout = layout
+        self._bits: bytearray | None = None
+        self._rebuilding_bits: bytearray | None = None
+
+    async def add(self, values: list[str]) -> None:
+        for bits in (self._bits, self._rebuilding_bits):
+            if bits is not None:
+                self._set_bits(bits, values)
+
+    async def might_contain(self, value: str) -> bool:
+        bits = self._bits
+        if bits is None:
+            return True
+        return all(bits[offset >> 3] & (1 << (offset & 7)) for offset in self._layout.get_bit_offsets(value))
+
+    async def is_built(self) -> bool:
+        return self._bits is not None
+
+    async def clear(self) -> None:
+        self._bits = None
+
+    async def rebuild(self, values: AsyncIterator[str]) -> bool:
+        if self._rebuilding_bits is not None:
+            return False
+
+        bits = bytearray((self._layout.bits + 7) // 8)
+        self._rebuilding_bits = bits
+        try:
+            async for value in values:
+                self._set_bits(bits, [value])
+        finally:
+            self._rebuilding_bits = None
+
+        self._bits = bits
+        return True
+
+    def _set_bits(self, bits: bytearray, values: list[str]) -> None:
+        for value in values:
+            for offset in self._layout.get_bit_offsets(value):
+                bits[offset >> 3] |= 1 << (offset & 7)
@@ -0,0 +1,108 @@
+import datetime
+import time
+from typing import Final
+
+from author1zd.key_value_storage.abstract.collections.indexed_string_set import IndexedStringSet
+from author1zd.key_value_storage.memory.expiring_store import ExpiringStore
+
+EMPTY_VALUE: Final[str] = ""
+
+
+class MemoryIndexedStringSet(IndexedStringSet):
+    # NOTE: every index is dict of keys to their expiration time stored in the same store as keys,
+    # removed keys stay in indexes until they expire and get pruned,
+    # key is never left stored without its index entries, so removal by index always finds it
+
+    def __init__(self, store: ExpiringStore, collection_prefix: str, ttl: datetime.timedelta) -> None:
+        self._store = store
+        self._collection_prefix = collection_prefix
+        self._ttl = ttl.total_seconds()
+
+    async def save(self, key: str, indexes: list[str]) -> None:
+        self._ensure_room(key, indexes)
+        self._save(key, indexes)
+
+    async def contains(self, key: str) -> bool:
+        return self._store.contains(self._add_key_prefix(key))
+
+    async def contains_many(self, keys: list[str]) -> list[bool]:
+        return [self._store.contains(self._add_key_prefix(key)) for key in keys]
+
+    async def remove(self, key: str) -> None:
+        self._store.pop(self._add_key_prefix(key))
+
+    async def replace(self, old_key: str, new_key: str, indexes: list[str]) -> bool:
+        if not self._store.contains(self._add_key_prefix(old_key)):
+            return False
+
+        self._ensure_room(new_key, indexes, replaced_key=old_key)
+        self._store.pop(self._add_key_prefix(old_key))
+
+        for index in indexes:
+            index_keys = self._store.get(self._get_index_key(index))
+            if index_keys is not None:
+                index_keys.pop(old_key, None)
+
+        self._save(new_key, indexes)
+        return True
+
+    async def remove_by_index(self, index: str) -> int:
+        index_keys = self._store.pop(self._get_index_key(index), {})
+        return sum(self._store.pop(self._add_key_prefix(key)) is not None for key in index_keys)
+
+    async def prune_indexes(self, interval: float) -> bool:
+        # collection is not shared with other workers, so there is nobody else to prune it within interval
+        now = time.time()
+        registry = self._store.get(self._get_index_registry_key(), set())
+
+        for index in list(registry):
+            index_keys = self._store.get(self._get_index_key(index))
+            if index_keys is None:
+                registry.discard(index)
+                continue
+
+            for key in [key for key, expires_at in index_keys.items() if expires_at <= now]:
+                del index_keys[key]
+        return True
+
+    def _ensure_room(self, key: str, indexes: list[str], replaced_key: str | None = None) -> None:
+        self._store.ensure_room(
+            [
+                self._add_key_prefix(key),
+                self._get_index_registry_key(),
+                *(self._get_index_key(index) for index in indexes),
+            ],
+            removed_keys=None if replaced_key is None else [self._add_key_prefix(replaced_key)],
+        )
+
+    def _save(self, key: str, indexes: list[str]) -> None:
+        self._store.set(self._add_key_prefix(key), EMPTY_VALUE, ttl=self._ttl)
+        try:
+            self._add_to_indexes(key, indexes)
+        except BaseException:
+            self._store.pop(self._add_key_prefix(key))
+            raise
+
+    def _add_to_indexes(self, key: str, indexes: list[str]) -> None:
+        expires_at = time.time() + self._ttl
+
+        registry = self._store.get(self._get_index_registry_key())
+        if registry is None:
+            registry = set()
+            self._store.set(self._get_index_registry_key(), registry)
+
+        for index in indexes:
+            index_keys = self._store.get(self._get_index_key(index), {})
+            index_keys[key] = expires_at
+            # re-setting index extends its lifetime to lifetime of its latest key
+            self._store.set(self._get_index_key(index), index_keys, ttl=self._ttl)
+            registry.add(index)
+
+    def _add_key_prefix(self, key: str) -> str:
+        return f"{self._collection_prefix}:{key}"
+
+    def _get_index_key(self, index: str) -> str:
+        return f"{self._collection_prefix}:index:{index}"
+
+    def _get_index_registry_key(self) -> str:
+        return f"{self._collection_prefix}:indexes"
@@ -0,0 +1,35 @@
+import datetime
+import time
+
+from author1zd.key_value_storage.abstract.collections.sliding_window_counter import SlidingWindowCounter
+from author1zd.key_value_storage.memory.expiring_store import ExpiringStore
+
+
+class MemorySlidingWindowCounter(SlidingWindowCounter):
+    def __init__(self, store: ExpiringStore, collection_prefix: str, window: datetime.timedelta) -> None:
+        self._store = store
+        self._collection_prefix = collection_prefix
+        self._window = window.total_seconds()
+
+    async def hit(self, key: str, limit: int) -> float:
+        now = time.time()
+        current_window = int(now // self._window)
+        elapsed = now / self._window - current_window
+
+        # value is tuple of window number and its hit count, and hit count of window before it
+        window, current, previous = self._store.get(self._add_key_prefix(key), (current_window, 0, 0))
+        if window == current_window - 1:
+            current, previous = 0, current
+        elif window != current_window:
+            current, previous = 0, 0
+
+        if current + 1 > limit:
+            return (1 - elapsed) * self._window
+        if previous * (1 - elapsed) + current + 1 > limit:
+            return (1 - (limit - current - 1) / previous - elapsed) * self._window
+
+        self._store.set(self._add_key_prefix(key), (current_window, current + 1, previous), ttl=2 * self._window)
+        return 0.0
+
+    def _add_key_prefix(self, key: str) -> str:
+        return f"{self._collection_prefix}:{key}"
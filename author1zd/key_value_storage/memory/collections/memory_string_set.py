@@ -0,0 +1,34 @@
+import datetime
+from typing import Final
+
+from author1zd.key_value_storage.abstract.collections.string_set import StringSet
+from author1zd.key_value_storage.memory.expiring_store import ExpiringStore
+
+EMPTY_VALUE: Final[str] = ""
+
+
+class MemoryStringSet(StringSet):
+    def __init__(
+        self,
+        store: ExpiringStore,
+        collection_prefix: str,
+        ttl: datetime.timedelta | None = None,
+    ) -> None:
+        self._store = store
+        self._collection_prefix = collection_prefix
+        self._ttl = None if ttl is None else ttl.total_seconds()
+
+    async def save(self, key: str) -> None:
+        self._store.set(self._add_key_prefix(key), EMPTY_VALUE, ttl=self._ttl)
+
+    async def contains(self, key: str) -> bool:
+        return self._store.contains(self._add_key_prefix(key))
+
+    async def contains_many(self, keys: list[str]) -> list[bool]:
+        return [self._store.contains(self._add_key_prefix(key)) for key in keys]
+
+    async def remove(self, key: str) -> None:
+        self._store.pop(self._add_key_prefix(key))
+
+    def _add_key_prefix(self, key: str) -> str:
+        return f"{self._collection_prefix}:{key}"
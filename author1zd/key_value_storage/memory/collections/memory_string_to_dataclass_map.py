@@ -0,0 +1,38 @@
+import dataclasses
+import datetime
+from typing import TypeVar
+
+from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.key_value_storage.memory.expiring_store import ExpiringStore
+
+TObject = TypeVar("TObject")
+
+
+class MemoryStringToDataclassMap(StringToDataclassMap[TObject]):
+    # NOTE: objects are copied on save and get, so changes of saved or returned object do not leak into store
+
+    def __init__(
+        self,
+        store: ExpiringStore,
+        collection_prefix: str,
+        ttl: datetime.timedelta | None = None,
+    ) -> None:
+        self._store = store
+        self._collection_prefix = collection_prefix
+        self._ttl = None if ttl is None else ttl.total_seconds()
+
+    async def save(self, key: str, obj: TObject) -> None:
+        self._store.set(self._add_key_prefix(key), dataclasses.replace(obj), ttl=self._ttl)
+
+    async def get(self, key: str) -> TObject | None:
+        obj = self._store.get(self._add_key_prefix(key))
+        return None if obj is None else dataclasses.replace(obj)
+
+    async def pop(self, key: str) -> TObject | None:
+        return self._store.pop(self._add_key_prefix(key))
+
+    async def remove(self, key: str) -> None:
+        self._store.pop(self._add_key_prefix(key))
+
+    def _add_key_prefix(self, key: str) -> str:
+        return f"{self._collection_prefix}:{key}"
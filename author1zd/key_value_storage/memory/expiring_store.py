@@ -0,0 +1,86 @@
+import heapq
+import math
+import time
+from typing import Any, Final
+
+MISSING: Final = object()
+
+
+class StoreFullException(Exception):
+    pass
+
+
+class ExpiringStore:
+    # NOTE: store plays role of Redis server for in-memory collections and is shared by all of them,
+    # expired entries are dropped lazily on access and from expiration heap on every write,
+    # when store is full of live entries new keys are rejected, since evicting any of them could drop
+    # valid auth code or refresh token.
+    # Store is not thread safe, it is meant to be used from event loop thread only
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        self._max_entries = max_entries
+        self._entries: dict[str, tuple[float, Any]] = {}
+        # heap may hold outdated (expires_at, key) pairs of overwritten and removed entries,
+        # they are skipped when popped and compacted away when heap grows too big
+        self._expiration_heap: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        return value
+
+    def contains(self, key: str) -> bool:
+        return self.get(key, MISSING) is not MISSING
+
+    def ensure_room(self, keys: list[str], removed_keys: list[str] | None = None) -> None:
+        """Raise StoreFullException unless all of keys can be set once removed keys are removed,
+        so writes spanning several keys can be rejected before any of them is made"""
+        self._remove_expired()
+
+        if self._max_entries is None:
+            return
+        new_keys = {key for key in keys if key not in self._entries}
+        freed_keys = {key for key in removed_keys or () if key in self._entries and key not in keys}
+        if len(self._entries) - len(freed_keys) + len(new_keys) > self._max_entries:
+            raise StoreFullException("Key-value storage is full. Try again later")
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self.ensure_room([key])
+
+        expires_at = math.inf if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires_at, value)
+        heapq.heappush(self._expiration_heap, (expires_at, key))
+
+        if len(self._expiration_heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            return default
+
+        del self._entries[key]
+        return value
+
+    def _remove_expired(self) -> None:
+        now = time.monotonic()
+
+        while self._expiration_heap and self._expiration_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiration_heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self._entries[key]
+
+    def _compact(self) -> None:
+        self._expiration_heap = [(expires_at, key) for key, (expires_at, _) in self._entries.items()]
+        heapq.heapify(self._expiration_heap)
@@ -0,0 +1,19 @@
+from typing import TypeAlias
+
+from redis.asyncio import Redis, RedisCluster
+from redis.crc import key_slot
+
+RedisClient: TypeAlias = Redis | RedisCluster
+
+
+def is_cluster_client(redis_client: RedisClient) -> bool:
+    return isinstance(redis_client, RedisCluster)
+
+
+def add_hash_tag(key: str) -> str:
+    # NOTE: Redis Cluster hashes only the part inside braces, so keys with equal tags land on the same slot
+    return f"{{{key}}}"
+
+
+def are_in_same_slot(keys: list[str]) -> bool:
+    return len({key_slot(key.encode()) for key in keys}) <= 1
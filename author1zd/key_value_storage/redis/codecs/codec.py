@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+
+TObject = TypeVar("TObject")
+
+
+class DataclassCodec(ABC, Generic[TObject]):
+    @abstractmethod
+    def encode(self, obj: TObject) -> bytes:
+        """Encode dataclass object to bytes"""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> TObject:
+        """Decode dataclass object from bytes"""
@@ -0,0 +1,26 @@
+import types
+import typing
+from typing import Any, Callable, Type
+
+FIELD_PARSERS: dict[Any, Callable[[str], Any]] = {
+    str: str,
+    int: int,
+    float: float,
+}
+
+
+def get_field_parsers(object_type: Type) -> dict[str, Callable[[str], Any]]:
+    """Get functions converting string values stored in Redis back to types of dataclass fields"""
+    return {
+        field_name: FIELD_PARSERS.get(_unwrap_optional(field_type), str)
+        for field_name, field_type in typing.get_type_hints(object_type).items()
+    }
+
+
+def _unwrap_optional(field_type: Any) -> Any:
+    """Get X out of Optional[X], Union[X, None] and X | None, other types are returned as they are"""
+    if typing.get_origin(field_type) not in (typing.Union, types.UnionType):
+        return field_type
+
+    arg_types = [arg_type for arg_type in typing.get_args(field_type) if arg_type is not type(None)]
+    return arg_types[0] if len(arg_types) == 1 else field_type
@@ -0,0 +1,41 @@
+import dataclasses
+import datetime
+from typing import Any, Final, Type, TypeVar
+
+import msgpack
+
+from author1zd.key_value_storage.redis.codecs.codec import DataclassCodec
+
+TObject = TypeVar("TObject")
+
+# msgpack timestamps accept only timezone aware datetimes, naive ones are packed as ISO strings in extension type
+DATETIME_EXT_TYPE: Final = 1
+
+
+class MsgpackDataclassCodec(DataclassCodec[TObject]):
+    # NOTE: object is packed as array of field values without field names,
+    # so changing order of dataclass fields makes previously stored objects unreadable
+
+    def __init__(self, object_type: Type[TObject]) -> None:
+        self._object_type = object_type
+        self._field_names = tuple(field.name for field in dataclasses.fields(object_type))
+
+    def encode(self, obj: TObject) -> bytes:
+        return msgpack.packb(
+            [getattr(obj, field_name) for field_name in self._field_names], use_bin_type=True, default=_pack_ext
+        )
+
+    def decode(self, data: bytes) -> TObject:
+        return self._object_type(*msgpack.unpackb(data, raw=False, ext_hook=_unpack_ext))
+
+
+def _pack_ext(value: Any) -> msgpack.ExtType:
+    if isinstance(value, datetime.datetime):
+        return msgpack.ExtType(DATETIME_EXT_TYPE, value.isoformat().encode())
+    raise TypeError(f"Cannot pack {type(value).__name__}")
+
+
+def _unpack_ext(code: int, data: bytes) -> Any:
+    if code == DATETIME_EXT_TYPE:
+        return datetime.datetime.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
@@ -1,36 +1,157 @@
 import datetime
+from typing import Literal, Type, TypeVar
 
-from redis.client import Redis
-
+from author1zd.entities.user import User
 from author1zd.objects.auth_code_data import AuthCodeData
 from author1zd.objects.auth_info import AuthInfo
+from author1zd.key_value_storage.abstract.collections.bloom_filter import BloomFilter
+from author1zd.key_value_storage.abstract.collections.indexed_string_set import IndexedStringSet
+from author1zd.key_value_storage.abstract.collections.sliding_window_counter import SlidingWindowCounter
+from author1zd.key_value_storage.abstract.collections.string_set import StringSet
+from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.key_value_storage.instrumented.collections.instrumented_bloom_filter import InstrumentedBloomFilter
+from author1zd.key_value_storage.instrumented.collections.instrumented_indexed_string_set import (
+    InstrumentedIndexedStringSet,
+)
+from author1zd.key_value_storage.instrumented.collections.instrumented_sliding_window_counter import (
+    InstrumentedSlidingWindowCounter,
+)
+from author1zd.key_value_storage.instrumented.collections.instrumented_string_set import InstrumentedStringSet
+from author1zd.key_value_storage.instrumented.collections.instrumented_string_to_dataclass_map import (
+    InstrumentedStringToDataclassMap,
+)
+from author1zd.key_value_storage.redis.codecs.msgpack_codec import MsgpackDataclassCodec
+from author1zd.key_value_storage.redis.collections.redis_encoded_string_to_dataclass_map import (
+    RedisEncodedStringToDataclassMap,
+)
+from author1zd.key_value_storage.redis.collections.redis_bloom_filter import RedisBloomFilter
+from author1zd.key_value_storage.redis.collections.redis_cluster_indexed_string_set import (
+    RedisClusterIndexedStringSet,
+)
+from author1zd.key_value_storage.redis.collections.redis_indexed_string_set import RedisIndexedStringSet
+from author1zd.key_value_storage.redis.collections.redis_sliding_window_counter import RedisSlidingWindowCounter
 from author1zd.key_value_storage.redis.collections.redis_string_set import RedisStringSet
 from author1zd.key_value_storage.redis.collections.redis_string_to_dataclass_map import (
     RedisStringToDataclassMap,
 )
+from author1zd.key_value_storage.redis.cluster import RedisClient, is_cluster_client
+from author1zd.utility.bloom import BloomFilterLayout
+
+TObject = TypeVar("TObject")
+
+DataclassEncoding = Literal["hash", "msgpack"]
 
 
 def create_redis_auth_code_collection(
-    redis_client: Redis, default_ttl: datetime.timedelta
-) -> RedisStringToDataclassMap[AuthCodeData]:
-    return RedisStringToDataclassMap(
+    redis_client: RedisClient, default_ttl: datetime.timedelta, encoding: DataclassEncoding = "hash"
+) -> StringToDataclassMap[AuthCodeData]:
+    return _create_redis_string_to_dataclass_map(
         redis_client,
         object_type=AuthCodeData,
         collection_prefix="auth_code",
         ttl=default_ttl,
+        encoding=encoding,
     )
 
 
 def create_redis_auth_info_collection(
-    redis_client: Redis, default_ttl: datetime.timedelta
-) -> RedisStringToDataclassMap[AuthInfo]:
-    return RedisStringToDataclassMap(
+    redis_client: RedisClient, default_ttl: datetime.timedelta, encoding: DataclassEncoding = "hash"
+) -> StringToDataclassMap[AuthInfo]:
+    return _create_redis_string_to_dataclass_map(
         redis_client,
         object_type=AuthInfo,
         collection_prefix="auth_info",
         ttl=default_ttl,
+        encoding=encoding,
     )
 
 
-def create_redis_refresh_token_collection(redis_client: Redis, default_ttl: datetime.timedelta) -> RedisStringSet:
-    return RedisStringSet(redis_client, collection_prefix="refresh_token", ttl=default_ttl)
+def create_redis_user_collection(
+    redis_client: RedisClient, default_ttl: datetime.timedelta
+) -> StringToDataclassMap[User]:
+    return _create_redis_string_to_dataclass_map(
+        redis_client,
+        object_type=User,
+        collection_prefix="user",
+        ttl=default_ttl,
+        encoding="msgpack",
+    )
+
+
+def create_redis_refresh_token_collection(
+    redis_client: RedisClient, default_ttl: datetime.timedelta, key_group_separator: str
+) -> IndexedStringSet:
+    collection: IndexedStringSet
+    if is_cluster_client(redis_client):
+        collection = RedisClusterIndexedStringSet(
+            redis_client, collection_prefix="refresh_token", ttl=default_ttl, key_group_separator=key_group_separator
+        )
+    else:
+        collection = RedisIndexedStringSet(redis_client, collection_prefix="refresh_token", ttl=default_ttl)
+
+    return InstrumentedIndexedStringSet(collection, collection_name="refresh_token")
+
+
+def create_redis_revoked_access_token_collection(
+    redis_client: RedisClient, default_ttl: datetime.timedelta
+) -> StringSet:
+    return InstrumentedStringSet(
+        RedisStringSet(redis_client, collection_prefix="revoked_access_token", ttl=default_ttl),
+        collection_name="revoked_access_token",
+    )
+
+
+def create_redis_login_rate_limit_collection(
+    redis_client: RedisClient, window: datetime.timedelta
+) -> SlidingWindowCounter:
+    return InstrumentedSlidingWindowCounter(
+        RedisSlidingWindowCounter(redis_client, collection_prefix="rate_limit:login", window=window),
+        collection_name="rate_limit:login",
+    )
+
+
+def create_redis_signup_rate_limit_collection(
+    redis_client: RedisClient, window: datetime.timedelta
+) -> SlidingWindowCounter:
+    return InstrumentedSlidingWindowCounter(
+        RedisSlidingWindowCounter(redis_client, collection_prefix="rate_limit:signup", window=window),
+        collection_name="rate_limit:signup",
+    )
+
+
+def create_redis_user_filter(
+    redis_client: RedisClient, layout: BloomFilterLayout, rebuild_batch_size: int
+) -> BloomFilter:
+    return InstrumentedBloomFilter(
+        RedisBloomFilter(
+            redis_client, collection_prefix="user_filter", layout=layout, rebuild_batch_size=rebuild_batch_size
+        ),
+        collection_name="user_filter",
+    )
+
+
+def _create_redis_string_to_dataclass_map(
+    redis_client: RedisClient,
+    object_type: Type[TObject],
+    collection_prefix: str,
+    ttl: datetime.timedelta,
+    encoding: DataclassEncoding,
+) -> StringToDataclassMap[TObject]:
+    # NOTE: only Redis collections are timed, in-memory operations are too cheap to be worth it
+    collection: StringToDataclassMap[TObject]
+    if encoding == "msgpack":
+        collection = RedisEncodedStringToDataclassMap(
+            redis_client,
+            codec=MsgpackDataclassCodec(object_type),
+            collection_prefix=collection_prefix,
+            ttl=ttl,
+        )
+    else:
+        collection = RedisStringToDataclassMap(
+            redis_client,
+            object_type=object_type,
+            collection_prefix=collection_prefix,
+            ttl=ttl,
+        )
+
+    return InstrumentedStringToDataclassMap(collection, collection_name=collection_prefix)
@@ -0,0 +1,131 @@
+import datetime
+from typing import AsyncIterator, Final
+
+from author1zd.key_value_storage.abstract.collections.bloom_filter import BloomFilter
+from author1zd.key_value_storage.redis.cluster import RedisClient, add_hash_tag, is_cluster_client
+from author1zd.utility.bloom import BloomFilterLayout
+
+# KEYS[1] - filter bitmap, KEYS[2] - bitmap of filter being rebuilt, ARGV - bit offsets
+ADD_SCRIPT: Final[
+    str
+] = """
+for _, key in ipairs(KEYS) do
+    if redis.call("EXISTS", key) == 1 then
+        for _, offset in ipairs(ARGV) do
+            redis.call("SETBIT", key, offset, 1)
+        end
+    end
+end
+"""
+
+# KEYS[1] - filter bitmap, ARGV - bit offsets
+MIGHT_CONTAIN_SCRIPT: Final[
+    str
+] = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 1
+end
+for _, offset in ipairs(ARGV) do
+    if redis.call("GETBIT", KEYS[1], offset) == 0 then
+        return 0
+    end
+end
+return 1
+"""
+
+# KEYS[1] - bitmap of filter being rebuilt, KEYS[2] - filter bitmap
+FINISH_REBUILD_SCRIPT: Final[
+    str
+] = """
+redis.call("RENAME", KEYS[1], KEYS[2])
+redis.call("PERSIST", KEYS[2])
+return 1
+"""
+
+
+# KEYS[1] - filter bitmap stored under key without hash tag by earlier versions, KEYS[2] - filter bitmap
+MIGRATE_LEGACY_KEY_SCRIPT: Final[
+    str
+] = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    if redis.call("EXISTS", KEYS[2]) == 0 then
+        redis.call("RENAME", KEYS[1], KEYS[2])
+    else
+        redis.call("DEL", KEYS[1])
+    end
+end
+return redis.call("EXISTS", KEYS[2])
+"""
+
+
+class RedisBloomFilter(BloomFilter):
+    # NOTE: filter is plain bitmap, so it does not need RedisBloom module,
+    # rebuild fills separate bitmap that doubles as lock and is renamed over filter once it is complete,
+    # both bitmaps share hash tag to stay on one Redis Cluster slot
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        collection_prefix: str,
+        layout: BloomFilterLayout,
+        rebuild_batch_size: int = 1000,
+        rebuild_timeout: datetime.timedelta = datetime.timedelta(hours=1),
+    ) -> None:
+        self._redis_client = redis_client
+        self._key = add_hash_tag(collection_prefix)
+        self._legacy_key = collection_prefix
+        self._rebuilding_key = f"{self._key}:rebuilding"
+        self._layout = layout
+        self._rebuild_batch_size = rebuild_batch_size
+        self._rebuild_timeout = rebuild_timeout
+        self._add_script = redis_client.register_script(ADD_SCRIPT)
+        self._might_contain_script = redis_client.register_script(MIGHT_CONTAIN_SCRIPT)
+        self._finish_rebuild_script = redis_client.register_script(FINISH_REBUILD_SCRIPT)
+        self._migrate_legacy_key_script = redis_client.register_script(MIGRATE_LEGACY_KEY_SCRIPT)
+
+    async def add(self, values: list[str]) -> None:
+        offsets = [offset for value in values for offset in self._layout.get_bit_offsets(value)]
+        await self._add_script(keys=[self._key, self._rebuilding_key], args=offsets)
+
+    async def might_contain(self, value: str) -> bool:
+        return bool(await self._might_contain_script(keys=[self._key], args=self._layout.get_bit_offsets(value)))
+
+    async def is_built(self) -> bool:
+        if is_cluster_client(self._redis_client):
+            return bool(await self._redis_client.exists(self._key))
+
+        # NOTE: filter built under key without hash tag is moved to current key instead of being rebuilt,
+        # or dropped when current key was built meanwhile, cluster deployments never had such key
+        return bool(await self._migrate_legacy_key_script(keys=[self._legacy_key, self._key]))
+
+    async def clear(self) -> None:
+        await self._redis_client.delete(self._key)
+
+    async def rebuild(self, values: AsyncIterator[str]) -> bool:
+        # rebuild of crashed process stops blocking new ones after timeout
+        if not await self._redis_client.set(self._rebuilding_key, b"", nx=True, ex=self._rebuild_timeout):
+            return False
+
+        try:
+            batch = []
+            async for value in values:
+                batch.append(value)
+                if len(batch) == self._rebuild_batch_size:
+                    await self._set_bits(self._rebuilding_key, batch)
+                    batch = []
+            if batch:
+                await self._set_bits(self._rebuilding_key, batch)
+
+            await self._finish_rebuild_script(keys=[self._rebuilding_key, self._key])
+        except BaseException:
+            await self._redis_client.delete(self._rebuilding_key)
+            raise
+
+        return True
+
+    async def _set_bits(self, key: str, values: list[str]) -> None:
+        arguments = []
+        for value in values:
+            for offset in self._layout.get_bit_offsets(value):
+                arguments.extend(("SET", "u1", offset, 1))
+        await self._redis_client.execute_command("BITFIELD", key, *arguments)
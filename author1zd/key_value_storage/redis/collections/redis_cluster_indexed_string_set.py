@@ -0,0 +1,118 @@
+import datetime
+from typing import Final
+
+from author1zd.key_value_storage.redis.cluster import RedisClient, add_hash_tag, are_in_same_slot
+from author1zd.key_value_storage.redis.collections.redis_indexed_string_set import RedisIndexedStringSet
+
+# KEYS[1] - key, KEYS[2..] - indexes on the same slot
+# ARGV[1] - ttl in seconds, ARGV[2] - expiration timestamp, ARGV[3] - unprefixed key
+SAVE_SCRIPT: Final[
+    str
+] = """
+redis.call("SET", KEYS[1], "", "EX", ARGV[1])
+for i = 2, #KEYS do
+    redis.call("ZADD", KEYS[i], ARGV[2], ARGV[3])
+    redis.call("EXPIRE", KEYS[i], ARGV[1])
+end
+return 1
+"""
+
+# KEYS[1] - old key, KEYS[2] - new key, KEYS[3..] - indexes on the same slot
+# ARGV[1] - ttl in seconds, ARGV[2] - expiration timestamp, ARGV[3] - unprefixed old key, ARGV[4] - unprefixed new key
+REPLACE_SCRIPT: Final[
+    str
+] = """
+if redis.call("DEL", KEYS[1]) == 0 then
+    return 0
+end
+redis.call("SET", KEYS[2], "", "EX", ARGV[1])
+for i = 3, #KEYS do
+    redis.call("ZREM", KEYS[i], ARGV[3])
+    redis.call("ZADD", KEYS[i], ARGV[2], ARGV[4])
+    redis.call("EXPIRE", KEYS[i], ARGV[1])
+end
+return 1
+"""
+
+
+class RedisClusterIndexedStringSet(RedisIndexedStringSet):
+    # NOTE: key starting with index name and separator belongs to group of that index and shares its hash tag,
+    # so scripts keep key together with its group index atomic, while other indexes and registry
+    # live on other slots and are updated ahead of key, leaving at worst index entries of missing keys
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        collection_prefix: str,
+        ttl: datetime.timedelta,
+        key_group_separator: str,
+        prune_batch_size: int = 100,
+        remove_batch_size: int = 100,
+    ) -> None:
+        super().__init__(redis_client, collection_prefix, ttl, prune_batch_size, remove_batch_size)
+        self._key_group_separator = key_group_separator
+        self._save_script = redis_client.register_script(SAVE_SCRIPT)
+        self._replace_script = redis_client.register_script(REPLACE_SCRIPT)
+
+    async def save(self, key: str, indexes: list[str]) -> None:
+        prefixed_key = self._add_key_prefix(key)
+        group_indexes, other_indexes = self._split_indexes(prefixed_key, indexes)
+
+        await self._update_other_indexes(key, None, other_indexes, indexes)
+        await self._save_script(
+            keys=[prefixed_key, *map(self._get_index_key, group_indexes)],
+            args=[self._ttl_seconds, self._get_expiration_timestamp(), key],
+        )
+
+    async def replace(self, old_key: str, new_key: str, indexes: list[str]) -> bool:
+        prefixed_old_key, prefixed_new_key = self._add_key_prefix(old_key), self._add_key_prefix(new_key)
+
+        if not are_in_same_slot([prefixed_old_key, prefixed_new_key]):
+            # deleting old key first still lets only one of concurrent replacements succeed
+            if await self._redis_client.delete(prefixed_old_key) == 0:
+                return False
+            await self.save(new_key, indexes)
+            return True
+
+        group_indexes, other_indexes = self._split_indexes(prefixed_new_key, indexes)
+
+        await self._update_other_indexes(new_key, old_key, other_indexes, indexes)
+        replaced = await self._replace_script(
+            keys=[prefixed_old_key, prefixed_new_key, *map(self._get_index_key, group_indexes)],
+            args=[self._ttl_seconds, self._get_expiration_timestamp(), old_key, new_key],
+        )
+        return replaced == 1
+
+    async def _update_other_indexes(
+        self, key: str, removed_key: str | None, other_indexes: list[str], indexes: list[str]
+    ) -> None:
+        expiration_timestamp = self._get_expiration_timestamp()
+
+        async with self._redis_client.pipeline(transaction=False) as pipeline:
+            for index in other_indexes:
+                index_key = self._get_index_key(index)
+                if removed_key is not None:
+                    pipeline.zrem(index_key, removed_key)
+                pipeline.zadd(index_key, {key: expiration_timestamp})
+                pipeline.expire(index_key, self._ttl_seconds)
+            if indexes:
+                pipeline.sadd(self._get_index_registry_key(), *indexes)
+            await pipeline.execute()
+
+    def _split_indexes(self, prefixed_key: str, indexes: list[str]) -> tuple[list[str], list[str]]:
+        group_indexes, other_indexes = [], []
+        for index in indexes:
+            if are_in_same_slot([prefixed_key, self._get_index_key(index)]):
+                group_indexes.append(index)
+            else:
+                other_indexes.append(index)
+        return group_indexes, other_indexes
+
+    def _add_key_prefix(self, key: str) -> str:
+        group, separator, rest = key.partition(self._key_group_separator)
+        if not separator:
+            return super()._add_key_prefix(key)
+        return super()._add_key_prefix(f"{add_hash_tag(group)}{separator}{rest}")
+
+    def _get_index_key(self, index: str) -> str:
+        return super()._get_index_key(add_hash_tag(index))
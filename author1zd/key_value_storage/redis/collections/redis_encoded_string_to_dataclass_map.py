@@ -0,0 +1,46 @@
+import datetime
+from typing import TypeVar
+
+from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.key_value_storage.redis.codecs.codec import DataclassCodec
+from author1zd.key_value_storage.redis.cluster import RedisClient
+
+TObject = TypeVar("TObject")
+
+
+class RedisEncodedStringToDataclassMap(StringToDataclassMap[TObject]):
+    # NOTE: every object is stored as single encoded string value,
+    # so save, get and pop each take one Redis command
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        codec: DataclassCodec[TObject],
+        collection_prefix: str,
+        ttl: datetime.timedelta | None = None,
+    ) -> None:
+        self._redis_client = redis_client
+        self._codec = codec
+        self._collection_prefix = collection_prefix
+        self._ttl = ttl
+
+    async def save(self, key: str, obj: TObject) -> None:
+        await self._redis_client.set(self._add_key_prefix(key), self._codec.encode(obj), ex=self._ttl)
+
+    async def get(self, key: str) -> TObject | None:
+        data = await self._redis_client.get(self._add_key_prefix(key))
+        if data is None:
+            return None
+        return self._codec.decode(data)
+
+    async def pop(self, key: str) -> TObject | None:
+        data = await self._redis_client.getdel(self._add_key_prefix(key))
+        if data is None:
+            return None
+        return self._codec.decode(data)
+
+    async def remove(self, key: str) -> None:
+        await self._redis_client.delete(self._add_key_prefix(key))
+
+    def _add_key_prefix(self, key: str) -> str:
+        return f"{self._collection_prefix}:{key}"
@@ -0,0 +1,159 @@
+import datetime
+import math
+import time
+from typing import Final
+
+from author1zd.key_value_storage.abstract.collections.indexed_string_set import IndexedStringSet
+from author1zd.key_value_storage.redis.cluster import RedisClient
+
+EMPTY_VALUE: Final[str] = ""
+
+# KEYS[1] - key, KEYS[2] - index registry, KEYS[3..] - indexes
+# ARGV[1] - ttl in seconds, ARGV[2] - expiration timestamp, ARGV[3] - unprefixed key, ARGV[4..] - index names
+SAVE_SCRIPT: Final[
+    str
+] = """
+redis.call("SET", KEYS[1], "", "EX", ARGV[1])
+for i = 3, #KEYS do
+    redis.call("ZADD", KEYS[i], ARGV[2], ARGV[3])
+    redis.call("EXPIRE", KEYS[i], ARGV[1])
+    redis.call("SADD", KEYS[2], ARGV[i + 1])
+end
+return 1
+"""
+
+# KEYS[1] - old key, KEYS[2] - new key, KEYS[3] - index registry, KEYS[4..] - indexes
+# ARGV[1] - ttl in seconds, ARGV[2] - expiration timestamp, ARGV[3] - unprefixed old key,
+# ARGV[4] - unprefixed new key, ARGV[5..] - index names
+REPLACE_SCRIPT: Final[
+    str
+] = """
+if redis.call("DEL", KEYS[1]) == 0 then
+    return 0
+end
+redis.call("SET", KEYS[2], "", "EX", ARGV[1])
+for i = 4, #KEYS do
+    redis.call("ZREM", KEYS[i], ARGV[3])
+    redis.call("ZADD", KEYS[i], ARGV[2], ARGV[4])
+    redis.call("EXPIRE", KEYS[i], ARGV[1])
+    redis.call("SADD", KEYS[3], ARGV[i + 1])
+end
+return 1
+"""
+
+
+class RedisIndexedStringSet(IndexedStringSet):
+    # NOTE: every index is sorted set of keys scored by their expiration time,
+    # removed keys stay in indexes until they expire and get pruned,
+    # removal by index goes through index in batches, so single large index doesn't block Redis
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        collection_prefix: str,
+        ttl: datetime.timedelta,
+        prune_batch_size: int = 100,
+        remove_batch_size: int = 100,
+    ) -> None:
+        self._redis_client = redis_client
+        self._collection_prefix = collection_prefix
+        self._ttl_seconds = int(ttl.total_seconds())
+        self._prune_batch_size = prune_batch_size
+        self._remove_batch_size = remove_batch_size
+        self._save_script = redis_client.register_script(SAVE_SCRIPT)
+        self._replace_script = redis_client.register_script(REPLACE_SCRIPT)
+
+    async def save(self, key: str, indexes: list[str]) -> None:
+        await self._save_script(
+            keys=[self._add_key_prefix(key), self._get_index_registry_key(), *map(self._get_index_key, indexes)],
+            args=[self._ttl_seconds, self._get_expiration_timestamp(), key, *indexes],
+        )
+
+    async def contains(self, key: str) -> bool:
+        return await self._redis_client.exists(self._add_key_prefix(key)) > 0
+
+    async def contains_many(self, keys: list[str]) -> list[bool]:
+        async with self._redis_client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.exists(self._add_key_prefix(key))
+            return [exists > 0 for exists in await pipeline.execute()]
+
+    async def remove(self, key: str) -> None:
+        await self._redis_client.delete(self._add_key_prefix(key))
+
+    async def replace(self, old_key: str, new_key: str, indexes: list[str]) -> bool:
+        replaced = await self._replace_script(
+            keys=[
+                self._add_key_prefix(old_key),
+                self._add_key_prefix(new_key),
+                self._get_index_registry_key(),
+                *map(self._get_index_key, indexes),
+            ],
+            args=[self._ttl_seconds, self._get_expiration_timestamp(), old_key, new_key, *indexes],
+        )
+        return replaced == 1
+
+    async def remove_by_index(self, index: str) -> int:
+        index_key = self._get_index_key(index)
+
+        # keys added to index meanwhile expire last, so they come after keys index had when removal started,
+        # one extra batch picks up keys rotated while removal ran without chasing keys saved for ever
+        max_batches = math.ceil(await self._redis_client.zcard(index_key) / self._remove_batch_size) + 1
+
+        removed = 0
+        for _ in range(max_batches):
+            keys = await self._redis_client.zrange(index_key, 0, self._remove_batch_size - 1)
+            if not keys:
+                break
+            removed += await self._redis_client.delete(*(self._add_key_prefix(key.decode()) for key in keys))
+            await self._redis_client.zrem(index_key, *keys)
+        return removed
+
+    async def prune_indexes(self, interval: float) -> bool:
+        # lease outlives pruning and expires after interval, so only first worker to wake up within interval prunes
+        if not await self._redis_client.set(
+            self._get_prune_lease_key(), EMPTY_VALUE, nx=True, px=max(1, int(interval * 1000))
+        ):
+            return False
+
+        registry_key = self._get_index_registry_key()
+
+        indexes = []
+        async for index in self._redis_client.sscan_iter(registry_key, count=self._prune_batch_size):
+            indexes.append(index.decode())
+            if len(indexes) >= self._prune_batch_size:
+                await self._prune(registry_key, indexes)
+                indexes = []
+
+        if indexes:
+            await self._prune(registry_key, indexes)
+        return True
+
+    async def _prune(self, registry_key: str, indexes: list[str]) -> None:
+        now = time.time()
+
+        async with self._redis_client.pipeline(transaction=False) as pipeline:
+            for index in indexes:
+                pipeline.zremrangebyscore(self._get_index_key(index), "-inf", now)
+                pipeline.exists(self._get_index_key(index))
+            results = await pipeline.execute()
+
+        # index key expires together with its latest key, forget indexes which are already gone
+        expired_indexes = [index for index, exists in zip(indexes, results[1::2]) if not exists]
+        if expired_indexes:
+            await self._redis_client.srem(registry_key, *expired_indexes)
+
+    def _add_key_prefix(self, key: str) -> str:
+        return f"{self._collection_prefix}:{key}"
+
+    def _get_index_key(self, index: str) -> str:
+        return f"{self._collection_prefix}:index:{index}"
+
+    def _get_index_registry_key(self) -> str:
+        return f"{self._collection_prefix}:indexes"
+
+    def _get_prune_lease_key(self) -> str:
+        return f"{self._collection_prefix}:indexes:pruning"
+
+    def _get_expiration_timestamp(self) -> float:
+        return time.time() + self._ttl_seconds
@@ -0,0 +1,54 @@
+import datetime
+import math
+import time
+from typing import Final
+
+from author1zd.key_value_storage.abstract.collections.sliding_window_counter import SlidingWindowCounter
+from author1zd.key_value_storage.redis.cluster import RedisClient
+
+# KEYS[1] - counter hash, fields are window numbers and values are hit counts
+# ARGV[1] - current timestamp, ARGV[2] - window in seconds, ARGV[3] - limit, ARGV[4] - ttl in seconds
+HIT_SCRIPT: Final[
+    str
+] = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+local current_window = math.floor(now / window)
+local elapsed = now / window - current_window
+local current = tonumber(redis.call("HGET", KEYS[1], current_window) or "0")
+local previous = tonumber(redis.call("HGET", KEYS[1], current_window - 1) or "0")
+
+if current + 1 > limit then
+    return tostring((1 - elapsed) * window)
+end
+if previous * (1 - elapsed) + current + 1 > limit then
+    return tostring((1 - (limit - current - 1) / previous - elapsed) * window)
+end
+
+redis.call("HINCRBY", KEYS[1], current_window, 1)
+redis.call("HDEL", KEYS[1], current_window - 2)
+redis.call("EXPIRE", KEYS[1], ARGV[4])
+return "0"
+"""
+
+
+class RedisSlidingWindowCounter(SlidingWindowCounter):
+    def __init__(self, redis_client: RedisClient, collection_prefix: str, window: datetime.timedelta) -> None:
+        self._redis_client = redis_client
+        self._collection_prefix = collection_prefix
+        self._window_seconds = window.total_seconds()
+        # counts of current and previous windows are needed, older ones are dropped together with key
+        self._ttl_seconds = math.ceil(2 * self._window_seconds)
+        self._hit_script = redis_client.register_script(HIT_SCRIPT)
+
+    async def hit(self, key: str, limit: int) -> float:
+        retry_after = await self._hit_script(
+            keys=[self._add_key_prefix(key)],
+            args=[time.time(), self._window_seconds, limit, self._ttl_seconds],
+        )
+        return float(retry_after)
+
+    def _add_key_prefix(self, key: str) -> str:
+        return f"{self._collection_prefix}:{key}"
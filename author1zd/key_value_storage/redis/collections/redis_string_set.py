@@ -1,9 +1,8 @@
 import datetime
 from typing import Final
 
-from redis.client import Redis
-
 from author1zd.key_value_storage.abstract.collections.string_set import StringSet
+from author1zd.key_value_storage.redis.cluster import RedisClient
 
 EMPTY_VALUE: Final[str] = ""
 
@@ -11,7 +10,7 @@ EMPTY_VALUE: Final[str] = ""
 class RedisStringSet(StringSet):
     def __init__(
         self,
-        redis_client: Redis,
+        redis_client: RedisClient,
         collection_prefix: str,
         ttl: datetime.timedelta | None = None,
     ) -> None:
@@ -19,18 +18,20 @@ class RedisStringSet(StringSet):
         self._collection_prefix = collection_prefix
         self._ttl = ttl
 
-    def save(self, key: str) -> None:
-        prefixed_key = self._add_key_prefix(key)
+    async def save(self, key: str) -> None:
+        await self._redis_client.set(self._add_key_prefix(key), EMPTY_VALUE, ex=self._ttl)
 
-        self._redis_client.set(prefixed_key, EMPTY_VALUE)
-        if self._ttl is not None:
-            self._redis_client.expire(prefixed_key, time=self._ttl)
+    async def contains(self, key: str) -> bool:
+        return await self._redis_client.exists(self._add_key_prefix(key)) > 0
 
-    def contains(self, key: str) -> bool:
-        return self._redis_client.get(self._add_key_prefix(key)) is not None
+    async def contains_many(self, keys: list[str]) -> list[bool]:
+        async with self._redis_client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.exists(self._add_key_prefix(key))
+            return [exists > 0 for exists in await pipeline.execute()]
 
-    def remove(self, key: str) -> None:
-        self._redis_client.delete(self._add_key_prefix(key))
+    async def remove(self, key: str) -> None:
+        await self._redis_client.delete(self._add_key_prefix(key))
 
     def _add_key_prefix(self, key: str) -> str:
         return f"{self._collection_prefix}:{key}"
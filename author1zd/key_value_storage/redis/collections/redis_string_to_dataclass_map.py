@@ -2,51 +2,74 @@ import dataclasses
 import datetime
 from typing import TypeVar, Type
 
-from redis.client import Redis
-
 from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.key_value_storage.redis.codecs.field_parsers import get_field_parsers
+from author1zd.key_value_storage.redis.cluster import RedisClient
 
 TObject = TypeVar("TObject")
 
 
 class RedisStringToDataclassMap(StringToDataclassMap[TObject]):
+    # NOTE: every object is stored as hash with field per dataclass field,
+    # prefer RedisEncodedStringToDataclassMap for new collections
+
     def __init__(
         self,
-        redis_client: Redis,
+        redis_client: RedisClient,
         object_type: Type[TObject],
         collection_prefix: str,
         ttl: datetime.timedelta | None = None,
     ) -> None:
         self._redis_client = redis_client
         self._object_type = object_type
+        self._field_parsers = get_field_parsers(object_type)
         self._collection_prefix = collection_prefix
         self._ttl = ttl
 
-    def save(self, key: str, obj: TObject) -> None:
+    async def save(self, key: str, obj: TObject) -> None:
         prefixed_key = self._add_key_prefix(key)
 
-        pipeline = self._redis_client.pipeline()
-        pipeline.multi()
+        async with self._redis_client.pipeline(transaction=True) as pipeline:
+            pipeline.hset(prefixed_key, mapping=dataclasses.asdict(obj))
+
+            if self._ttl is not None:
+                pipeline.expire(prefixed_key, time=self._ttl)
 
-        for key, value in dataclasses.asdict(obj).items():
-            pipeline.hset(prefixed_key, key, value)
+            await pipeline.execute()
 
-        if self._ttl is not None:
-            pipeline.expire(prefixed_key, time=self._ttl)
+    async def get(self, key: str) -> TObject | None:
+        prefixed_key = self._add_key_prefix(key)
 
-        pipeline.execute()
+        obj_dict = await self._redis_client.hgetall(prefixed_key)
+        if not obj_dict:
+            return None
 
-    def get(self, key: str) -> TObject | None:
+        return self._to_object(obj_dict)
+
+    async def pop(self, key: str) -> TObject | None:
         prefixed_key = self._add_key_prefix(key)
 
-        obj_dict = self._redis_client.hgetall(prefixed_key)
+        async with self._redis_client.pipeline(transaction=True) as pipeline:
+            pipeline.hgetall(prefixed_key)
+            pipeline.delete(prefixed_key)
+            obj_dict, _ = await pipeline.execute()
+
         if not obj_dict:
             return None
 
-        return self._object_type(**obj_dict)
+        return self._to_object(obj_dict)
 
-    def remove(self, key: str) -> None:
-        self._redis_client.delete(self._add_key_prefix(key))
+    async def remove(self, key: str) -> None:
+        await self._redis_client.delete(self._add_key_prefix(key))
 
     def _add_key_prefix(self, key: str) -> str:
         return f"{self._collection_prefix}:{key}"
+
+    def _to_object(self, obj_dict: dict[bytes, bytes]) -> TObject:
+        obj_kwargs = {}
+
+        for field, value in obj_dict.items():
+            field_name = field.decode()
+            obj_kwargs[field_name] = self._field_parsers[field_name](value.decode())
+
+        return self._object_type(**obj_kwargs)
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+from redis.asyncio import BlockingConnectionPool
+
+
+@dataclass
+class ConnectionPoolStats:
+    max_connections: int
+    created: int
+    in_use: int
+    idle: int
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    # NOTE: BlockingConnectionPool waits up to 'timeout' seconds for a free connection
+    # when 'max_connections' is reached instead of failing immediately
+
+    def reset(self) -> None:
+        super().reset()
+        self._connections_created = 0
+        self._connections_in_use = set()
+
+    def make_connection(self):
+        connection = super().make_connection()
+        self._connections_created += 1
+        return connection
+
+    async def get_connection(self, command_name, *keys, **options):
+        connection = await super().get_connection(command_name, *keys, **options)
+        self._connections_in_use.add(connection)
+        return connection
+
+    async def release(self, connection) -> None:
+        # NOTE: base class also releases connections that failed to connect inside get_connection,
+        # so connection may be missing from in-use set
+        self._connections_in_use.discard(connection)
+        await super().release(connection)
+
+    def get_stats(self) -> ConnectionPoolStats:
+        return ConnectionPoolStats(
+            max_connections=self.max_connections,
+            created=self._connections_created,
+            in_use=len(self._connections_in_use),
+            idle=self._connections_created - len(self._connections_in_use),
+        )
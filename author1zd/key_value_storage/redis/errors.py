@@ -0,0 +1,6 @@
+from typing import Final
+
+from redis.exceptions import ConnectionError, ReadOnlyError, TimeoutError
+
+# Redis being unreachable, slow or in the middle of failover, worth retrying for idempotent operations
+RETRYABLE_REDIS_EXCEPTIONS: Final[tuple[type[Exception], ...]] = (ConnectionError, TimeoutError, ReadOnlyError)
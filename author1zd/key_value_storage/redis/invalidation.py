@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from typing import Callable, Final
+
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError, TimeoutError
+
+CLIENT_INVALIDATION_CHANNEL: Final[str] = "invalidation:client"
+USER_INVALIDATION_CHANNEL: Final[str] = "invalidation:user"
+INVALIDATE_ALL: Final[str] = "*"
+
+LOGGER: Final = logging.getLogger(__name__)
+
+
+async def publish_invalidation(redis_client: Redis, channel: str, key: str) -> None:
+    await redis_client.publish(channel, key)
+
+
+async def listen_for_invalidations(
+    redis_client: Redis,
+    channel: str,
+    invalidate: Callable[[str], None],
+    invalidate_all: Callable[[], None],
+    retry_interval: float = 1,
+) -> None:
+    try:
+        while True:
+            try:
+                async with redis_client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(channel)
+                    # invalidation messages could have been missed while listener was not subscribed
+                    invalidate_all()
+
+                    while True:
+                        message = await pubsub.get_message(timeout=1)
+                        if message is not None:
+                            _handle_message(channel, message["data"], invalidate, invalidate_all)
+            except (ConnectionError, TimeoutError):
+                LOGGER.warning("Lost subscription to '%s' channel, reconnecting", channel, exc_info=True)
+                await asyncio.sleep(retry_interval)
+    except asyncio.CancelledError:
+        raise
+    except BaseException:
+        LOGGER.exception("Listener of '%s' channel stopped, caches are no longer invalidated", channel)
+        raise
+
+
+def _handle_message(
+    channel: str, data: bytes, invalidate: Callable[[str], None], invalidate_all: Callable[[], None]
+) -> None:
+    try:
+        key = data.decode()
+        if key == INVALIDATE_ALL:
+            invalidate_all()
+        else:
+            invalidate(key)
+    except Exception:
+        # NOTE: it is not known what malformed message was meant to invalidate, so everything is dropped
+        LOGGER.warning("Malformed invalidation message %r on '%s' channel", data, channel, exc_info=True)
+        invalidate_all()
@@ -0,0 +1,80 @@
+import asyncio
+import random
+from typing import Awaitable, Callable, TypeVar
+
+from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.monitoring.metrics import KEY_VALUE_STORAGE_FAILURES_TOTAL
+from author1zd.utility.circuit_breaker import CircuitBreaker, CircuitOpenException
+
+TObject = TypeVar("TObject")
+TResult = TypeVar("TResult")
+
+
+class ResilientStringToDataclassMap(StringToDataclassMap[TObject]):
+    # NOTE: every attempt is bounded by timeout and goes through circuit breaker, failed attempts are retried
+    # after exponential backoff with full jitter, pop is never retried since failed attempt could have popped object
+
+    def __init__(
+        self,
+        collection: StringToDataclassMap[TObject],
+        collection_name: str,
+        retryable_exceptions: tuple[type[Exception], ...],
+        timeout: float | None = None,
+        retries: int = 0,
+        retry_base_delay: float = 0.05,
+        retry_max_delay: float = 1,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self._collection = collection
+        self._collection_name = collection_name
+        # timed out attempt is as good as failed one
+        self._retryable_exceptions = (*retryable_exceptions, asyncio.TimeoutError)
+        self._timeout = timeout
+        self._retries = retries
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        self._circuit_breaker = circuit_breaker
+
+    async def save(self, key: str, obj: TObject) -> None:
+        await self._call("save", lambda: self._collection.save(key, obj), self._retries)
+
+    async def get(self, key: str) -> TObject | None:
+        return await self._call("get", lambda: self._collection.get(key), self._retries)
+
+    async def remove(self, key: str) -> None:
+        await self._call("remove", lambda: self._collection.remove(key), self._retries)
+
+    async def pop(self, key: str) -> TObject | None:
+        return await self._call("pop", lambda: self._collection.pop(key), retries=0)
+
+    async def _call(self, operation: str, function: Callable[[], Awaitable[TResult]], retries: int) -> TResult:
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(function)
+            except CircuitOpenException:
+                self._count_failure(operation, "rejected")
+                raise
+            except self._retryable_exceptions:
+                if attempt >= retries:
+                    self._count_failure(operation, "failed")
+                    raise
+                self._count_failure(operation, "retried")
+
+            await asyncio.sleep(random.uniform(0, min(self._retry_max_delay, self._retry_base_delay * 2**attempt)))
+            attempt += 1
+
+    async def _attempt(self, function: Callable[[], Awaitable[TResult]]) -> TResult:
+        async def attempt_with_timeout() -> TResult:
+            # NOTE: timed out command is cancelled mid-flight, redis-py before 4.5.4 could then hand its reply
+            # to next command on the same connection, hence the lower bound on redis in pyproject.toml
+            return await asyncio.wait_for(function(), self._timeout)
+
+        if self._circuit_breaker is None:
+            return await attempt_with_timeout()
+        return await self._circuit_breaker.call(attempt_with_timeout)
+
+    def _count_failure(self, operation: str, outcome: str) -> None:
+        KEY_VALUE_STORAGE_FAILURES_TOTAL.labels(
+            collection=self._collection_name, operation=operation, outcome=outcome
+        ).inc()
@@ -0,0 +1,46 @@
+import os
+from typing import Callable, Iterator
+
+from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+from prometheus_client.registry import Collector
+
+from author1zd.key_value_storage.redis.connection_pool import ConnectionPoolStats
+
+
+class RedisConnectionPoolCollector(Collector):
+    def __init__(self, get_stats: Callable[[], ConnectionPoolStats | None]) -> None:
+        self._get_stats = get_stats
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        stats = self._get_stats()
+        if stats is None:
+            return
+
+        yield GaugeMetricFamily(
+            "redis_pool_max_connections", "Maximum number of connections in Redis pool", value=stats.max_connections
+        )
+        yield GaugeMetricFamily(
+            "redis_pool_created_connections", "Number of connections created by Redis pool", value=stats.created
+        )
+        yield GaugeMetricFamily(
+            "redis_pool_in_use_connections", "Number of Redis connections checked out of pool", value=stats.in_use
+        )
+        yield GaugeMetricFamily(
+            "redis_pool_idle_connections", "Number of idle Redis connections in pool", value=stats.idle
+        )
+
+
+def create_metrics_registry(
+    get_redis_connection_pool_stats: Callable[[], ConnectionPoolStats | None]
+) -> CollectorRegistry:
+    # NOTE: workers of multi-process server write metrics to files in PROMETHEUS_MULTIPROC_DIR that are merged
+    # on every scrape, live Redis pool stats of worker that happened to serve scrape would be misleading there
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        return registry
+
+    REGISTRY.register(RedisConnectionPoolCollector(get_redis_connection_pool_stats))
+    return REGISTRY
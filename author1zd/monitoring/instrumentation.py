@@ -0,0 +1,84 @@
+import contextlib
+import time
+from typing import Iterator
+
+from prometheus_client import Histogram
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+# NOTE: tracer stays None until tracing is enabled, so spans cost nothing when tracing is off
+_TRACER = None
+
+
+class TracingUnavailableException(Exception):
+    pass
+
+
+def enable_tracing() -> None:
+    global _TRACER
+
+    if trace is None:
+        raise TracingUnavailableException("Tracing requires 'opentelemetry-api' package, install 'tracing' extra")
+    _TRACER = trace.get_tracer("author1zd")
+
+
+def disable_tracing() -> None:
+    global _TRACER
+
+    _TRACER = None
+
+
+@contextlib.contextmanager
+def traced(span_name: str, **attributes: str) -> Iterator[None]:
+    """Cover block with span if tracing is enabled"""
+    if _TRACER is None:
+        yield
+        return
+
+    with _TRACER.start_as_current_span(span_name, attributes=attributes):
+        yield
+
+
+def timed(span_name: str, histogram: Histogram, **labels: str) -> "_TimedBlock":
+    """Observe duration of block in histogram and cover block with span if tracing is enabled"""
+    return _TimedBlock(span_name, histogram, labels)
+
+
+class _TimedBlock:
+    # NOTE: plain context manager class and cached histogram children keep overhead of timed block
+    # to a few microseconds, generator based context manager and 'labels' lookup would double it
+
+    __slots__ = ("_span_name", "_histogram", "_labels", "_span", "_start")
+
+    def __init__(self, span_name: str, histogram: Histogram, labels: dict[str, str]) -> None:
+        self._span_name = span_name
+        self._histogram = histogram
+        self._labels = labels
+        self._span = None
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        if _TRACER is not None:
+            self._span = _TRACER.start_as_current_span(self._span_name, attributes=self._labels)
+            self._span.__enter__()
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        duration = time.perf_counter() - self._start
+        _get_histogram_child(self._histogram, self._labels).observe(duration)
+        if self._span is not None:
+            self._span.__exit__(exc_type, exc_value, traceback)
+
+
+_HISTOGRAM_CHILDREN: dict[tuple, Histogram] = {}
+
+
+def _get_histogram_child(histogram: Histogram, labels: dict[str, str]) -> Histogram:
+    key = (histogram, *labels.values())
+    child = _HISTOGRAM_CHILDREN.get(key)
+    if child is None:
+        child = _HISTOGRAM_CHILDREN[key] = histogram.labels(**labels)
+    return child
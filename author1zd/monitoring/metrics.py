@@ -0,0 +1,81 @@
+from typing import Final
+
+from prometheus_client import Counter, Gauge, Histogram
+
+PASSWORD_HASHING_QUEUE_WAIT_SECONDS: Final = Histogram(
+    "password_hashing_queue_wait_seconds",
+    "Time password hashing job spent waiting for executor thread",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+PASSWORD_HASHING_DURATION_SECONDS: Final = Histogram(
+    "password_hashing_duration_seconds",
+    "Time spent hashing or verifying password",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.15, 0.2, 0.25, 0.5, 1),
+)
+PASSWORD_HASHING_PENDING_JOBS: Final = Gauge(
+    "password_hashing_pending_jobs",
+    "Number of password hashing jobs running or waiting in executor queue",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASHING_REJECTED_TOTAL: Final = Counter(
+    "password_hashing_rejected_total",
+    "Number of password hashing jobs rejected because executor queue was full",
+)
+PASSWORD_REHASHED_TOTAL: Final = Counter(
+    "password_rehashed_total",
+    "Number of password hashes upgraded to current scheme or cost on successful verification",
+)
+
+HTTP_REQUEST_DURATION_SECONDS: Final = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP request",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+HTTP_REQUESTS_TOTAL: Final = Counter(
+    "http_requests_total",
+    "Number of handled HTTP requests",
+    ["method", "route", "status"],
+)
+DATABASE_QUERY_DURATION_SECONDS: Final = Histogram(
+    "database_query_duration_seconds",
+    "Time spent in repository method querying database",
+    ["repository", "method"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+KEY_VALUE_STORAGE_OPERATION_DURATION_SECONDS: Final = Histogram(
+    "key_value_storage_operation_duration_seconds",
+    "Time spent in key-value collection operation",
+    ["collection", "operation"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1),
+)
+KEY_VALUE_STORAGE_FAILURES_TOTAL: Final = Counter(
+    "key_value_storage_failures_total",
+    "Number of failed key-value collection operation attempts by outcome, 'rejected' ones were not attempted "
+    "because circuit was open",
+    ["collection", "operation", "outcome"],
+)
+JWT_OPERATION_DURATION_SECONDS: Final = Histogram(
+    "jwt_operation_duration_seconds",
+    "Time spent signing or verifying JWT",
+    ["token_type", "operation"],
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01),
+)
+USER_FILTER_CHECKS_TOTAL: Final = Counter(
+    "user_filter_checks_total",
+    "Number of username and email checks by result, 'missing' ones were answered by filter without database, "
+    "'not_taken' ones are false positives or checks made before filter was built",
+    ["result"],
+)
+
+STARTUP_DURATION_SECONDS: Final = Gauge(
+    "startup_duration_seconds",
+    "Time spent running application startup hooks",
+    multiprocess_mode="liveall",
+)
+WARM_UP_DURATION_SECONDS: Final = Gauge(
+    "warm_up_duration_seconds",
+    "Time from end of startup until database and Redis connection pools were warmed up",
+    multiprocess_mode="liveall",
+)
@@ -0,0 +1,51 @@
+import time
+from typing import Any, Callable
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from author1zd.monitoring.metrics import HTTP_REQUEST_DURATION_SECONDS, HTTP_REQUESTS_TOTAL
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    # NOTE: plain ASGI middleware, BaseHTTPMiddleware would add a task and a stream per request
+
+    def __init__(self, app: ASGIApp, get_routes: Callable[[], list[BaseRoute]]) -> None:
+        self._app = app
+        self._get_routes = get_routes
+        self._route_paths: dict[Any, str] | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            # route path template rather than request path keeps label cardinality bounded
+            route = self._get_route_path(scope)
+            HTTP_REQUEST_DURATION_SECONDS.labels(scope["method"], route).observe(duration)
+            HTTP_REQUESTS_TOTAL.labels(scope["method"], route, str(status)).inc()
+
+    def _get_route_path(self, scope: Scope) -> str:
+        # NOTE: router stores matched endpoint in scope, routes are registered after middleware is added,
+        # so endpoint to path mapping is built on first request
+        if self._route_paths is None:
+            self._route_paths = {
+                getattr(route, "endpoint", None) or getattr(route, "app", None): route.path
+                for route in self._get_routes()
+            }
+        return self._route_paths.get(scope.get("endpoint"), UNMATCHED_ROUTE)
@@ -7,3 +7,4 @@ class RefreshTokenClaims:
     client_id: str
     sub: str
     exp: datetime.datetime
+    jti: str | None = None
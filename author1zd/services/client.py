@@ -13,8 +13,8 @@ class SecretMismatchException(Exception):
     pass
 
 
-def check_redirect_uri(client_id: str, redirect_uri: str, client_repository: ClientRepository) -> None:
-    client = client_repository.get_by_client_id(client_id)
+async def check_redirect_uri(client_id: str, redirect_uri: str, client_repository: ClientRepository) -> None:
+    client = await client_repository.get_by_client_id(client_id)
 
     if client is None:
         raise ClientNotRegisteredException("Client app with provided 'client_id' not found")
@@ -23,8 +23,8 @@ def check_redirect_uri(client_id: str, redirect_uri: str, client_repository: Cli
         raise RedirectUriNotAllowedException("Provided 'redirect_uri' is not allowed for client")
 
 
-def check_client_secret(client_id: str, client_secret: str, client_repository: ClientRepository) -> None:
-    client = client_repository.get_by_client_id(client_id)
+async def check_client_secret(client_id: str, client_secret: str, client_repository: ClientRepository) -> None:
+    client = await client_repository.get_by_client_id(client_id)
 
     if client is None:
         raise ClientNotRegisteredException("Client app with provided 'client_id' not found")
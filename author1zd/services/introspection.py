@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from jose import JWTError
+
+from author1zd.exchange_objects.token_introspection import TokenIntrospection
+from author1zd.key_value_storage.abstract.collections.indexed_string_set import IndexedStringSet
+from author1zd.key_value_storage.abstract.collections.string_set import StringSet
+from author1zd.monitoring.instrumentation import timed
+from author1zd.monitoring.metrics import JWT_OPERATION_DURATION_SECONDS
+from author1zd.services.key_ring import TokenKeyRings
+from author1zd.utility.ttl_lru_cache import TtlLruCache
+
+TokenType = Literal["access_token", "refresh_token"]
+
+
+class TokenClientMismatchException(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    token_type: TokenType
+    claims: dict[str, Any]
+
+
+class VerifiedTokenCache:
+    # NOTE: cache saves only signature verification, revocation is checked on every introspection,
+    # every entry expires together with its token
+
+    def __init__(self, max_size: int) -> None:
+        self._cache: TtlLruCache[str, VerifiedToken] = TtlLruCache(max_size)
+
+    def verify(
+        self, token: str, token_key_rings: TokenKeyRings, token_type_hint: TokenType | None = None
+    ) -> VerifiedToken | None:
+        token_hash = get_token_hash(token)
+
+        verified_token = self._cache.get(token_hash)
+        if verified_token is not None:
+            return verified_token
+
+        token_types: list[TokenType] = ["access_token", "refresh_token"]
+        if token_type_hint == "refresh_token":
+            token_types.reverse()
+
+        for token_type in token_types:
+            key_ring = token_key_rings.access_token if token_type == "access_token" else token_key_rings.refresh_token
+            try:
+                with timed("jwt.verify", JWT_OPERATION_DURATION_SECONDS, token_type=token_type, operation="verify"):
+                    claims = key_ring.verify(token)
+            except JWTError:
+                continue
+
+            verified_token = VerifiedToken(token_type=token_type, claims=claims)
+            ttl = claims["exp"] - time.time()
+            if ttl > 0:
+                self._cache.set(token_hash, verified_token, ttl=ttl)
+            return verified_token
+
+        return None
+
+
+def get_token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def introspect_tokens(
+    tokens: list[str],
+    token_type_hint: TokenType | None,
+    verified_token_cache: VerifiedTokenCache,
+    token_key_rings: TokenKeyRings,
+    refresh_token_collection: IndexedStringSet,
+    revoked_access_token_collection: StringSet,
+) -> list[TokenIntrospection]:
+    verified_tokens = [verified_token_cache.verify(token, token_key_rings, token_type_hint) for token in tokens]
+
+    refresh_token_keys = []
+    access_token_hashes = []
+    for token, verified_token in zip(tokens, verified_tokens):
+        if verified_token is None:
+            continue
+        if verified_token.token_type == "refresh_token":
+            # NOTE: refresh tokens issued before tokens got 'jti' claim are stored by whole token
+            refresh_token_keys.append(verified_token.claims.get("jti") or token)
+        else:
+            access_token_hashes.append(get_token_hash(token))
+
+    # every collection checks all of its tokens in single pipelined round trip
+    stored_refresh_tokens, revoked_access_tokens = await asyncio.gather(
+        refresh_token_collection.contains_many(refresh_token_keys),
+        revoked_access_token_collection.contains_many(access_token_hashes),
+    )
+    is_stored_refresh_token = iter(stored_refresh_tokens)
+    is_revoked_access_token = iter(revoked_access_tokens)
+
+    introspections = []
+    for verified_token in verified_tokens:
+        if verified_token is None:
+            active = False
+        elif verified_token.token_type == "refresh_token":
+            active = next(is_stored_refresh_token)
+        else:
+            active = not next(is_revoked_access_token)
+
+        if not active:
+            introspections.append(TokenIntrospection(active=False))
+            continue
+
+        introspections.append(
+            TokenIntrospection(
+                active=True,
+                token_type=verified_token.token_type,
+                client_id=verified_token.claims.get("client_id"),
+                username=verified_token.claims.get("username"),
+                email=verified_token.claims.get("email"),
+                sub=verified_token.claims.get("sub"),
+                exp=verified_token.claims.get("exp"),
+                jti=verified_token.claims.get("jti"),
+            )
+        )
+
+    return introspections
+
+
+async def revoke_token(
+    token: str,
+    client_id: str,
+    token_type_hint: TokenType | None,
+    verified_token_cache: VerifiedTokenCache,
+    token_key_rings: TokenKeyRings,
+    refresh_token_collection: IndexedStringSet,
+    revoked_access_token_collection: StringSet,
+) -> None:
+    verified_token = verified_token_cache.verify(token, token_key_rings, token_type_hint)
+    if verified_token is None:
+        # RFC 7009: invalid tokens do not cause an error
+        return
+
+    if verified_token.claims.get("client_id") != client_id:
+        raise TokenClientMismatchException("Token was not issued to provided client")
+
+    if verified_token.token_type == "refresh_token":
+        await refresh_token_collection.remove(verified_token.claims.get("jti") or token)
+    else:
+        await revoked_access_token_collection.save(get_token_hash(token))
@@ -0,0 +1,99 @@
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Final
+
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+from jose.constants import ALGORITHMS
+
+# RFC 7638 members used to compute JWK thumbprint
+THUMBPRINT_MEMBERS: Final[dict[str, tuple[str, ...]]] = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+}
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str | None
+    algorithm: str
+    signing_key: Key
+    verification_key: Key
+
+
+class KeyRing:
+    # NOTE: keys are parsed once when key ring is created,
+    # first key signs new tokens, the rest are kept to verify tokens signed before key rotation
+
+    def __init__(self, keys: list[SigningKey]) -> None:
+        if not keys:
+            raise ValueError("Key ring should contain at least one key")
+
+        self._signing_key = keys[0]
+        self._keys_by_kid = {key.kid: key for key in keys}
+
+    @classmethod
+    def from_secret(cls, secret: str, algorithm: str) -> "KeyRing":
+        if algorithm not in ALGORITHMS.HMAC:
+            raise ValueError(f"Algorithm '{algorithm}' can not be used with secret key")
+
+        key = jwk.construct(secret, algorithm)
+        return cls([SigningKey(kid=None, algorithm=algorithm, signing_key=key, verification_key=key)])
+
+    @classmethod
+    def from_pem_files(cls, private_key_files: list[str], algorithm: str) -> "KeyRing":
+        if algorithm not in ALGORITHMS.RSA_DS | ALGORITHMS.EC_DS:
+            raise ValueError(f"Algorithm '{algorithm}' can not be used with private key files")
+
+        keys = []
+        for private_key_file in private_key_files:
+            with open(private_key_file) as file:
+                private_key = jwk.construct(file.read(), algorithm)
+            public_key = private_key.public_key()
+            keys.append(
+                SigningKey(
+                    kid=_get_thumbprint(public_key),
+                    algorithm=algorithm,
+                    signing_key=private_key,
+                    verification_key=public_key,
+                )
+            )
+
+        return cls(keys)
+
+    def sign(self, claims: dict[str, Any]) -> str:
+        headers = None if self._signing_key.kid is None else {"kid": self._signing_key.kid}
+        return jwt.encode(claims, self._signing_key.signing_key, algorithm=self._signing_key.algorithm, headers=headers)
+
+    def verify(self, token: str) -> dict[str, Any]:
+        """Verify token signature and expiration time, raise JWTError if token is not valid"""
+        key = self._keys_by_kid.get(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            raise JWTError("Token is signed with unknown key")
+
+        return jwt.decode(token, key.verification_key, algorithms=[key.algorithm])
+
+    def get_public_jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Get JWK Set of public keys, symmetric keys are never published"""
+        return {
+            "keys": [
+                {**key.verification_key.to_dict(), "kid": key.kid, "use": "sig"}
+                for key in self._keys_by_kid.values()
+                if key.kid is not None
+            ]
+        }
+
+
+@dataclass(frozen=True)
+class TokenKeyRings:
+    access_token: KeyRing
+    refresh_token: KeyRing
+
+
+def _get_thumbprint(public_key: Key) -> str:
+    public_jwk = public_key.to_dict()
+    members = {name: public_jwk[name] for name in THUMBPRINT_MEMBERS[public_jwk["kty"]]}
+    digest = hashlib.sha256(json.dumps(members, separators=(",", ":"), sort_keys=True).encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
@@ -0,0 +1,76 @@
+import asyncio
+import math
+
+from author1zd.key_value_storage.abstract.collections.sliding_window_counter import SlidingWindowCounter
+from author1zd.settings import RateLimitSettings
+from author1zd.utility.token_bucket import TokenBucketLimiter
+
+
+class RateLimitExceededException(Exception):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Too many attempts. Try again later")
+        self.retry_after = math.ceil(retry_after)
+
+
+def check_local_rate_limit(client_address: str, local_rate_limiter: TokenBucketLimiter | None) -> None:
+    if local_rate_limiter is None:
+        return
+
+    retry_after = local_rate_limiter.acquire(client_address)
+    if retry_after > 0:
+        raise RateLimitExceededException(retry_after)
+
+
+async def check_login_rate_limits(
+    client_address: str,
+    username: str,
+    client_id: str,
+    login_rate_limit_collection: SlidingWindowCounter,
+    rate_limit_settings: RateLimitSettings,
+) -> None:
+    await _check_rate_limits(
+        login_rate_limit_collection,
+        {
+            f"ip:{client_address}": rate_limit_settings.login_ip_limit,
+            # NOTE: username is counted per address, so nobody can lock victim out by failing logins from elsewhere
+            f"ip_username:{client_address}/{username}": rate_limit_settings.login_ip_username_limit,
+            f"client_id:{client_id}": rate_limit_settings.login_client_id_limit,
+        },
+    )
+
+
+async def check_signup_rate_limits(
+    client_address: str,
+    client_id: str,
+    signup_rate_limit_collection: SlidingWindowCounter,
+    rate_limit_settings: RateLimitSettings,
+) -> None:
+    await _check_rate_limits(
+        signup_rate_limit_collection,
+        {
+            f"ip:{client_address}": rate_limit_settings.signup_ip_limit,
+            f"client_id:{client_id}": rate_limit_settings.signup_client_id_limit,
+        },
+    )
+
+
+async def check_username_taken_rate_limits(
+    client_address: str,
+    signup_rate_limit_collection: SlidingWindowCounter,
+    rate_limit_settings: RateLimitSettings,
+) -> None:
+    # NOTE: username checks are counted apart from signups, so that checks while typing do not use up signups
+    await _check_rate_limits(
+        signup_rate_limit_collection,
+        {f"username_taken_ip:{client_address}": rate_limit_settings.username_taken_ip_limit},
+    )
+
+
+async def _check_rate_limits(rate_limit_collection: SlidingWindowCounter, limits: dict[str, int | None]) -> None:
+    # NOTE: every key is counted separately, so attempt rejected by one limit still counts against the others
+    retry_afters = await asyncio.gather(
+        *(rate_limit_collection.hit(key, limit) for key, limit in limits.items() if limit is not None)
+    )
+    retry_after = max(retry_afters, default=0.0)
+    if retry_after > 0:
+        raise RateLimitExceededException(retry_after)
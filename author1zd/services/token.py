@@ -1,18 +1,116 @@
+import asyncio
 import datetime
+import logging
+import uuid
 from dataclasses import asdict
+from typing import Final
 
-from jose import jwt
+from jose import JWTError
 
 from author1zd.entities.user import User
-from author1zd.key_value_storage.abstract.collections.string_set import StringSet
+from author1zd.key_value_storage.abstract.collections.indexed_string_set import IndexedStringSet
+from author1zd.monitoring.instrumentation import timed
+from author1zd.monitoring.metrics import JWT_OPERATION_DURATION_SECONDS
 from author1zd.objects.access_token_claims import AccessTokenClaims
 from author1zd.objects.refresh_token_claims import RefreshTokenClaims
 from author1zd.exchange_objects.token_pair import TokenPair
+from author1zd.services.key_ring import TokenKeyRings
 from author1zd.settings import JwtSettings
 
+LOGGER: Final = logging.getLogger(__name__)
 
-def generate_token_pair(
-    client_id: str, user: User, refresh_token_collection: StringSet, jwt_settings: JwtSettings
+# refresh token ids start with user index, so key-value storage can keep them next to that index
+REFRESH_TOKEN_ID_SEPARATOR: Final[str] = "/"
+
+
+class InvalidTokenException(Exception):
+    pass
+
+
+async def generate_token_pair(
+    client_id: str,
+    user: User,
+    refresh_token_collection: IndexedStringSet,
+    jwt_settings: JwtSettings,
+    token_key_rings: TokenKeyRings,
+) -> TokenPair:
+    refresh_token_id = _create_refresh_token_id(user.id)
+    token_pair = _create_token_pair(client_id, user, refresh_token_id, jwt_settings, token_key_rings)
+    await refresh_token_collection.save(refresh_token_id, _get_refresh_token_indexes(client_id, user.id))
+    return token_pair
+
+
+async def rotate_token_pair(
+    client_id: str,
+    user: User,
+    refresh_token: str,
+    refresh_token_claims: RefreshTokenClaims,
+    refresh_token_collection: IndexedStringSet,
+    jwt_settings: JwtSettings,
+    token_key_rings: TokenKeyRings,
+) -> TokenPair | None:
+    """Issue new token pair in exchange for refresh token, return None if refresh token was already used"""
+    refresh_token_id = _create_refresh_token_id(user.id)
+    token_pair = _create_token_pair(client_id, user, refresh_token_id, jwt_settings, token_key_rings)
+    replaced = await refresh_token_collection.replace(
+        get_refresh_token_key(refresh_token, refresh_token_claims),
+        refresh_token_id,
+        _get_refresh_token_indexes(client_id, user.id),
+    )
+    if not replaced:
+        return None
+    return token_pair
+
+
+def get_refresh_token_claims(refresh_token: str, token_key_rings: TokenKeyRings) -> RefreshTokenClaims:
+    try:
+        with timed("jwt.verify", JWT_OPERATION_DURATION_SECONDS, token_type="refresh_token", operation="verify"):
+            claims_dict = token_key_rings.refresh_token.verify(refresh_token)
+    except JWTError as e:
+        raise InvalidTokenException(str(e))
+    return RefreshTokenClaims(**claims_dict)
+
+
+def get_refresh_token_key(refresh_token: str, refresh_token_claims: RefreshTokenClaims) -> str:
+    # NOTE: refresh tokens issued before tokens got 'jti' claim are stored by whole token
+    return refresh_token_claims.jti or refresh_token
+
+
+async def revoke_user_refresh_tokens(user_id: int, refresh_token_collection: IndexedStringSet) -> int:
+    return await refresh_token_collection.remove_by_index(_get_user_index(user_id))
+
+
+async def revoke_client_refresh_tokens(client_id: str, refresh_token_collection: IndexedStringSet) -> int:
+    return await refresh_token_collection.remove_by_index(_get_client_index(client_id))
+
+
+async def prune_refresh_token_indexes_periodically(refresh_token_collection: IndexedStringSet, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_token_collection.prune_indexes(interval)
+        except Exception:
+            LOGGER.warning("Failed to prune refresh token indexes", exc_info=True)
+
+
+def _create_refresh_token_id(user_id: int) -> str:
+    return f"{_get_user_index(user_id)}{REFRESH_TOKEN_ID_SEPARATOR}{uuid.uuid4().hex}"
+
+
+def _get_refresh_token_indexes(client_id: str, user_id: int) -> list[str]:
+    return [_get_user_index(user_id), _get_client_index(client_id)]
+
+
+def _get_user_index(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def _get_client_index(client_id: str) -> str:
+    return f"client:{client_id}"
+
+
+def _create_token_pair(
+    client_id: str, user: User, refresh_token_id: str, jwt_settings: JwtSettings, token_key_rings: TokenKeyRings
 ) -> TokenPair:
     access_token_claims = AccessTokenClaims(
         client_id=client_id,
@@ -21,23 +119,17 @@ def generate_token_pair(
         sub=str(user.id),
         exp=datetime.datetime.utcnow() + datetime.timedelta(seconds=jwt_settings.access_token_ttl),
     )
-    access_token = jwt.encode(
-        asdict(access_token_claims),
-        key=jwt_settings.access_token_secret_key,
-        algorithm=jwt_settings.algorithm,
-    )
+    with timed("jwt.sign", JWT_OPERATION_DURATION_SECONDS, token_type="access_token", operation="sign"):
+        access_token = token_key_rings.access_token.sign(asdict(access_token_claims))
 
     refresh_token_claims = RefreshTokenClaims(
         client_id=client_id,
         sub=str(user.id),
         exp=datetime.datetime.utcnow() + datetime.timedelta(seconds=jwt_settings.refresh_token_ttl),
+        jti=refresh_token_id,
     )
-    refresh_token = jwt.encode(
-        asdict(refresh_token_claims),
-        key=jwt_settings.refresh_token_secret_key,
-        algorithm=jwt_settings.algorithm,
-    )
-    refresh_token_collection.save(refresh_token)
+    with timed("jwt.sign", JWT_OPERATION_DURATION_SECONDS, token_type="refresh_token", operation="sign"):
+        refresh_token = token_key_rings.refresh_token.sign(asdict(refresh_token_claims))
 
     return TokenPair(
         access_token=access_token,
@@ -45,12 +137,3 @@ def generate_token_pair(
         access_token_expires_in=jwt_settings.access_token_ttl,
         refresh_token_expires_in=jwt_settings.refresh_token_ttl,
     )
-
-
-def get_refresh_token_claims(refresh_token: str, jwt_settings: JwtSettings) -> RefreshTokenClaims:
-    claims_dict = jwt.decode(
-        refresh_token,
-        jwt_settings.refresh_token_secret_key,
-        algorithms=[jwt_settings.algorithm],
-    )
-    return RefreshTokenClaims(**claims_dict)
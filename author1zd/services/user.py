@@ -0,0 +1,18 @@
+from author1zd.database.abstract.repositories.user_repository import UserRepository
+
+
+class UsernameTakenException(Exception):
+    pass
+
+
+class EmailTakenException(Exception):
+    pass
+
+
+async def check_user_data_is_unique(username: str, email: str, user_repository: UserRepository) -> None:
+    # NOTE: checked before password is hashed, unique constraints still reject users signing up concurrently
+    if await user_repository.is_username_taken(username):
+        raise UsernameTakenException("User with provided username already exists")
+
+    if await user_repository.is_email_taken(email):
+        raise EmailTakenException("User with provided email already exists")
@@ -0,0 +1,182 @@
+import asyncio
+import csv
+import datetime
+import itertools
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Literal, TextIO
+
+from author1zd.database.abstract.repositories.user_repository import UserRepository
+from author1zd.entities.user import User
+from author1zd.utility.password import PasswordHasher
+
+FileFormat = Literal["csv", "jsonl"]
+
+MAX_USERNAME_LENGTH = 64
+
+# asyncpg allows at most 32767 parameters per statement and every inserted user takes up to 5 of them
+MAX_IMPORT_BATCH_SIZE = 32767 // 5
+
+EXPORTED_FIELDS = ("id", "username", "email", "password_hash", "registration_date")
+
+
+class InvalidUserRecordException(Exception):
+    pass
+
+
+@dataclass
+class UserImportIssue:
+    line: int
+    username: str | None
+    reason: str
+
+
+@dataclass
+class UserImportSummary:
+    imported: int = 0
+    conflicts: int = 0
+    invalid: int = 0
+
+
+def read_user_records(file: TextIO, file_format: FileFormat) -> Iterator[tuple[int, Any]]:
+    """Read records lazily, yield every record with number of line it starts at,
+    records are not validated and malformed ones are yielded as InvalidUserRecordException"""
+    if file_format == "csv":
+        yield from _read_csv_records(file)
+        return
+
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, InvalidUserRecordException(f"Line is not valid JSON: {e}")
+
+
+async def import_users(
+    records: Iterable[tuple[int, Any]],
+    user_repository: UserRepository,
+    password_hasher: PasswordHasher,
+    batch_size: int,
+    max_concurrent_hashes: int,
+    report_issue: Callable[[UserImportIssue], None],
+) -> UserImportSummary:
+    summary = UserImportSummary()
+    batch_size = min(batch_size, MAX_IMPORT_BATCH_SIZE)
+    hashing_semaphore = asyncio.Semaphore(max_concurrent_hashes)
+
+    records_iterator = iter(records)
+    while batch := list(itertools.islice(records_iterator, batch_size)):
+        built_users = await asyncio.gather(
+            *(_build_user(record, password_hasher, hashing_semaphore) for _, record in batch), return_exceptions=True
+        )
+
+        lines, users = [], []
+        for (line, record), user in zip(batch, built_users):
+            if isinstance(user, InvalidUserRecordException):
+                summary.invalid += 1
+                report_issue(UserImportIssue(line=line, username=_get_username(record), reason=str(user)))
+            elif isinstance(user, BaseException):
+                raise user
+            else:
+                lines.append(line)
+                users.append(user)
+
+        for line, user, saved_user in zip(lines, users, await user_repository.save_many(users)):
+            if saved_user is None:
+                summary.conflicts += 1
+                report_issue(UserImportIssue(line=line, username=user.username, reason="Username or email is taken"))
+            else:
+                summary.imported += 1
+
+    return summary
+
+
+async def export_users(user_repository: UserRepository, file: TextIO, file_format: FileFormat, batch_size: int) -> int:
+    exported = 0
+    writer = csv.DictWriter(file, fieldnames=EXPORTED_FIELDS) if file_format == "csv" else None
+    if writer is not None:
+        writer.writeheader()
+
+    async for user in user_repository.iterate_all(batch_size):
+        record = {
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "password_hash": user.password_hash,
+            "registration_date": None if user.registration_date is None else user.registration_date.isoformat(),
+        }
+        if writer is not None:
+            writer.writerow(record)
+        else:
+            file.write(json.dumps(record) + "\n")
+        exported += 1
+
+    return exported
+
+
+def _read_csv_records(file: TextIO) -> Iterator[tuple[int, Any]]:
+    # NOTE: quoted values may span several lines, so line record starts at is taken before reading it
+    rows = csv.reader(file)
+    field_names = next(rows, None)
+
+    while True:
+        line_number = rows.line_num + 1
+        try:
+            row = next(rows)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield line_number, InvalidUserRecordException(f"Line is not valid CSV: {e}")
+            continue
+
+        if row:
+            yield line_number, dict(zip(field_names, row))
+
+
+def _get_username(record: Any) -> str | None:
+    username = record.get("username") if isinstance(record, dict) else None
+    return username if isinstance(username, str) else None
+
+
+async def _build_user(record: Any, password_hasher: PasswordHasher, hashing_semaphore: asyncio.Semaphore) -> User:
+    if isinstance(record, InvalidUserRecordException):
+        raise record
+    if not isinstance(record, dict):
+        raise InvalidUserRecordException("Record is not an object")
+
+    username, email = record.get("username"), record.get("email")
+    password, password_hash = record.get("password"), record.get("password_hash")
+
+    if not username or not email:
+        raise InvalidUserRecordException("Username and email are required")
+    if not all(isinstance(value, str) for value in (username, email, password or "", password_hash or "")):
+        raise InvalidUserRecordException("Username, email, password and password hash have to be strings")
+    if len(username) > MAX_USERNAME_LENGTH:
+        raise InvalidUserRecordException(f"Username is longer than {MAX_USERNAME_LENGTH} characters")
+    if bool(password) == bool(password_hash):
+        raise InvalidUserRecordException("Exactly one of password and password hash is required")
+
+    if password_hash:
+        # NOTE: hashes of supported but outdated scheme or cost are accepted and upgraded on first login
+        if not password_hasher.is_known_hash(password_hash):
+            raise InvalidUserRecordException("Password hash format is not supported")
+    else:
+        async with hashing_semaphore:
+            password_hash = await password_hasher.hash_password(password)
+
+    registration_date = None
+    if record.get("registration_date"):
+        try:
+            registration_date = datetime.datetime.fromisoformat(record["registration_date"])
+        except (TypeError, ValueError):
+            raise InvalidUserRecordException("Registration date is not in ISO 8601 format")
+
+        # registration date column has no time zone and holds UTC
+        if registration_date.tzinfo is not None:
+            registration_date = registration_date.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+    return User(
+        id=None, username=username, email=email, password_hash=password_hash, registration_date=registration_date
+    )
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import TypeVar, Type, Callable
+from typing import TypeVar, Type, Callable, Literal
 
 from pydantic import BaseSettings
 
@@ -12,15 +12,112 @@ class PostgresSettings(BaseSettings):
     password: str
     host: str
     database: str
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    # asyncpg prepares statements on server and keeps this many of them per connection
+    prepared_statement_cache_size: int = 100
+    # read replicas share credentials, database and pool settings with primary
+    replica_hosts: list[str] = []
+    replica_health_check_interval: float = 5
+    replica_health_check_timeout: float = 1
 
     class Config:
         env_prefix = "postgres_"
 
 
+class ClientCacheSettings(BaseSettings):
+    enabled: bool = True
+    max_size: int = 1024
+    ttl: float = 300
+    negative_ttl: float = 30
+
+    class Config:
+        env_prefix = "client_cache_"
+
+
+class UserCacheSettings(BaseSettings):
+    enabled: bool = True
+    max_size: int = 10_000
+    ttl: float = 60
+    # users are also shared between workers through Redis, this TTL bounds staleness after missed invalidations
+    shared_ttl: float = 3600
+
+    class Config:
+        env_prefix = "user_cache_"
+
+
+class UserFilterSettings(BaseSettings):
+    # Bloom filter over usernames and emails lets signup reject taken ones before hashing password,
+    # false positive rate grows once there are more users than capacity
+    enabled: bool = True
+    capacity: int = 1_000_000
+    false_positive_rate: float = 0.001
+    build_batch_size: int = 10_000
+    build_retry_interval: float = 5
+
+    class Config:
+        env_prefix = "user_filter_"
+
+
+class KeyValueStorageSettings(BaseSettings):
+    # "memory" keeps collections inside worker process, so it fits only single worker deployments
+    backend: Literal["redis", "memory"] = "redis"
+    # writes of new keys are rejected with 503 while that many live entries are stored, entries are not only
+    # auth codes, auth info and tokens, but also one per user and per client app with live refresh tokens
+    # and one per rate limited client address, username and client app within window
+    memory_max_entries: int | None = 1_000_000
+
+    class Config:
+        env_prefix = "key_value_storage_"
+
+
+class ServerSettings(BaseSettings):
+    bind: str = "0.0.0.0:8000"
+    # number of available CPUs when not set
+    workers: int | None = None
+    # time workers get to finish in-flight requests on shutdown or reload before they are killed
+    graceful_timeout: int = 30
+    keepalive: int = 5
+    # restart worker after that many requests, 0 disables restarts
+    max_requests: int = 0
+    max_requests_jitter: int = 0
+
+    class Config:
+        env_prefix = "server_"
+
+
+class StartupSettings(BaseSettings):
+    # schema is normally created by 'create-schema' command before workers start
+    create_schema: bool = False
+    # connections opened in background after startup, '/ready' responds with 200 once they are open
+    warm_up_database_connections: int = 5
+    warm_up_redis_connections: int = 5
+    warm_up_retry_interval: float = 1
+
+    class Config:
+        env_prefix = "startup_"
+
+
 class RedisSettings(BaseSettings):
-    host: str
-    port: int
-    password: str
+    host: str = "localhost"
+    port: int = 6379
+    password: str | None = None
+    unix_socket_path: str | None = None
+    max_connections: int = 50
+    pool_timeout: float = 5
+    socket_timeout: float | None = None
+    socket_connect_timeout: float | None = None
+    health_check_interval: int = 0
+    # "hash" keeps one Redis hash per object, "msgpack" stores object as single value
+    dataclass_encoding: Literal["hash", "msgpack"] = "hash"
+    # cluster is discovered from host and port plus other startup nodes given as "host:port"
+    cluster: bool = False
+    cluster_nodes: list[str] = []
+    # cluster only, replicas serve plain reads such as contains and get but may lag behind primaries
+    read_from_replicas: bool = False
 
     class Config:
         env_prefix = "redis_"
@@ -31,22 +128,106 @@ class AuthSettings(BaseSettings):
     auth_code_ttl: int
 
 
+class AuthInfoStorageSettings(BaseSettings):
+    # worker local tier serving reads of auth info saved or read by worker within ttl, saves go to Redis first
+    # and auth info is consumed in Redis only, so it stays single use across workers
+    local_cache_enabled: bool = False
+    local_cache_max_size: int = 10_000
+    local_cache_ttl: float = 30
+    # every Redis attempt is bounded by timeout, failed ones are retried with jittered exponential backoff
+    timeout: float | None = None
+    retries: int = 0
+    retry_base_delay: float = 0.05
+    retry_max_delay: float = 1
+    # consecutive failures that open circuit and stop attempts for reset timeout, None disables circuit breaker
+    circuit_failure_threshold: int | None = None
+    circuit_reset_timeout: float = 10
+
+    class Config:
+        env_prefix = "auth_info_storage_"
+
+
+class RateLimitSettings(BaseSettings):
+    # limits are numbers of attempts within sliding window shared by all workers, None disables limit
+    window: int = 60
+    login_ip_limit: int | None = 30
+    login_ip_username_limit: int | None = 10
+    login_client_id_limit: int | None = 3000
+    signup_ip_limit: int | None = 10
+    signup_client_id_limit: int | None = 600
+    username_taken_ip_limit: int | None = 60
+    # per worker token bucket for every client address, rejects floods before they reach shared limits
+    local_enabled: bool = True
+    local_rate: float = 2
+    local_burst: int = 20
+    local_max_addresses: int = 100_000
+    # take client address from X-Forwarded-For header set by trusted reverse proxies, every proxy appends address
+    # it received request from, so client address is entry number 'forwarded_for_trusted_proxies' from the right
+    # and entries left of it are sent by client and can't be trusted
+    trust_forwarded_for: bool = False
+    forwarded_for_trusted_proxies: int = 1
+
+    class Config:
+        env_prefix = "rate_limit_"
+
+
+class MonitoringSettings(BaseSettings):
+    # NOTE: spans go to tracer provider configured by OpenTelemetry SDK, e.g. by 'opentelemetry-instrument'
+    tracing_enabled: bool = False
+
+    class Config:
+        env_prefix = "monitoring_"
+
+
+class PasswordHashingSettings(BaseSettings):
+    max_workers: int = 4
+    max_queue_depth: int = 64
+    # use 'python -m author1zd.cli calibrate-password-hashing' to pick cost for target verification time,
+    # hashes with other scheme or cost are upgraded on successful login
+    scheme: Literal["bcrypt", "argon2"] = "bcrypt"
+    bcrypt_rounds: int = 12
+    argon2_time_cost: int = 2
+    argon2_memory_cost: int = 19456
+    argon2_parallelism: int = 1
+
+    class Config:
+        env_prefix = "password_hashing_"
+
+
 class JwtSettings(BaseSettings):
     access_token_ttl: int
     refresh_token_ttl: int
-    access_token_secret_key: str
-    refresh_token_secret_key: str
     algorithm: str
+    # HS* algorithms sign access tokens with secret key, RS* and ES* algorithms with private keys from PEM files,
+    # first file holds current key, others hold previous keys which are still accepted and published in JWKS
+    access_token_secret_key: str | None = None
+    access_token_private_key_files: list[str] = []
+    refresh_token_secret_key: str
+    # refresh tokens are verified only by user pool, so they are signed with HS* algorithm,
+    # defaults to 'algorithm' when it is HS* algorithm and to HS256 otherwise
+    refresh_token_algorithm: str | None = None
+    jwks_max_age: int = 300
+    refresh_token_index_prune_interval: float = 600
 
     class Config:
         env_prefix = "jwt_"
 
 
+class IntrospectionSettings(BaseSettings):
+    verified_token_cache_max_size: int = 100_000
+    max_batch_size: int = 1000
+
+    class Config:
+        env_prefix = "introspection_"
+
+
+@lru_cache(maxsize=None)
 def settings_provider(settings_type: Type[TSettings]) -> Callable[[], TSettings]:
-    settings = settings_type()
+    # NOTE: settings are read from environment on first use instead of when routes are declared,
+    # and every caller gets the same provider, so overriding it as dependency affects all of them
 
     @lru_cache
     def provide_settings() -> TSettings:
-        return settings
+        return settings_type()
 
     return provide_settings
@@ -0,0 +1,24 @@
+import hashlib
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BloomFilterLayout:
+    bits: int
+    hashes: int
+
+    @classmethod
+    def for_capacity(cls, capacity: int, false_positive_rate: float) -> "BloomFilterLayout":
+        """Get smallest layout keeping false positive rate for given number of values"""
+        bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        hashes = max(1, round(bits / capacity * math.log(2)))
+        return cls(bits=bits, hashes=hashes)
+
+    def get_bit_offsets(self, value: str) -> list[int]:
+        # NOTE: offsets are derived from two halves of single digest (Kirsch-Mitzenmacher),
+        # which is as good as independent hash functions for Bloom filter
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], "little")
+        second_hash = int.from_bytes(digest[8:], "little") | 1
+        return [(first_hash + index * second_hash) % self.bits for index in range(self.hashes)]
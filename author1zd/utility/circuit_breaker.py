@@ -0,0 +1,67 @@
+import math
+import time
+from typing import Awaitable, Callable, TypeVar
+
+TResult = TypeVar("TResult")
+
+
+class CircuitOpenException(Exception):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Service is temporarily unavailable. Try again later")
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class CircuitBreaker:
+    # NOTE: not thread safe, breaker is meant to be used from event loop thread only
+    # after 'failure_threshold' consecutive failures calls are rejected for 'reset_timeout' seconds,
+    # then single trial call decides whether circuit closes again or stays open for another period
+
+    def __init__(
+        self, failure_threshold: int, reset_timeout: float, failure_exceptions: tuple[type[BaseException], ...]
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failure_exceptions = failure_exceptions
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    async def call(self, function: Callable[[], Awaitable[TResult]]) -> TResult:
+        trial = self._acquire()
+        try:
+            result = await function()
+        except self._failure_exceptions:
+            self._record_failure()
+            raise
+        finally:
+            if trial:
+                self._trial_running = False
+
+        self._record_success()
+        return result
+
+    def _acquire(self) -> bool:
+        """Raise CircuitOpenException if call is rejected, return whether call is trial of open circuit"""
+        if self._opened_at is None:
+            return False
+
+        retry_after = self._opened_at + self._reset_timeout - time.monotonic()
+        if retry_after > 0:
+            raise CircuitOpenException(retry_after)
+        if self._trial_running:
+            raise CircuitOpenException(0)
+
+        self._trial_running = True
+        return True
+
+    def _record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
@@ -0,0 +1,36 @@
+import math
+import os
+
+
+def get_available_cpu_count() -> int:
+    """Get number of CPUs process may run on, limited by CPU affinity and by cgroup CPU quota of container"""
+    cpu_count = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+    quota = _read_cgroup_cpu_quota()
+    if quota is not None:
+        cpu_count = min(cpu_count, max(1, math.ceil(quota)))
+
+    return cpu_count
+
+
+def _read_cgroup_cpu_quota() -> float | None:
+    try:
+        # cgroup v2 keeps '<quota> <period>' or 'max <period>' in single file
+        with open("/sys/fs/cgroup/cpu.max") as file:
+            quota, period = file.read().split()
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as quota_file, open(
+            "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+        ) as period_file:
+            quota, period = int(quota_file.read()), int(period_file.read())
+        if quota <= 0:
+            return None
+        return quota / period
+    except (OSError, ValueError):
+        return None
@@ -1,14 +1,148 @@
-from typing import Final
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Final, Literal, TypeVar
 
 from passlib.context import CryptContext
 
+from author1zd.monitoring.instrumentation import traced
+from author1zd.monitoring.metrics import (
+    PASSWORD_HASHING_DURATION_SECONDS,
+    PASSWORD_HASHING_PENDING_JOBS,
+    PASSWORD_HASHING_QUEUE_WAIT_SECONDS,
+    PASSWORD_HASHING_REJECTED_TOTAL,
+    PASSWORD_REHASHED_TOTAL,
+)
 
-PASSWORD_CONTEXT: Final = CryptContext(schemes=["bcrypt"], deprecated="auto")
+PasswordHashingScheme = Literal["bcrypt", "argon2"]
 
+SCHEMES: Final[tuple[PasswordHashingScheme, ...]] = ("bcrypt", "argon2")
 
-def hash_password(password: str) -> str:
-    return PASSWORD_CONTEXT.hash(password)
+DEFAULT_BCRYPT_ROUNDS: Final = 12
+DEFAULT_ARGON2_TIME_COST: Final = 2
+DEFAULT_ARGON2_MEMORY_COST: Final = 19456
+DEFAULT_ARGON2_PARALLELISM: Final = 1
 
+TResult = TypeVar("TResult")
 
-def verify_password(password: str, password_hash: str) -> bool:
-    return PASSWORD_CONTEXT.verify(password, password_hash)
+
+class PasswordHashingOverloadedException(Exception):
+    pass
+
+
+def create_password_context(
+    scheme: PasswordHashingScheme = "bcrypt",
+    bcrypt_rounds: int = DEFAULT_BCRYPT_ROUNDS,
+    argon2_time_cost: int = DEFAULT_ARGON2_TIME_COST,
+    argon2_memory_cost: int = DEFAULT_ARGON2_MEMORY_COST,
+    argon2_parallelism: int = DEFAULT_ARGON2_PARALLELISM,
+) -> CryptContext:
+    # NOTE: hashes of other schemes still verify but are deprecated,
+    # bcrypt cost is pinned from both sides, so hashes with any other cost need update too
+    return CryptContext(
+        schemes=[scheme, *(other_scheme for other_scheme in SCHEMES if other_scheme != scheme)],
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__time_cost=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+PASSWORD_CONTEXT: Final = create_password_context()
+
+
+def hash_password(password: str, context: CryptContext = PASSWORD_CONTEXT) -> str:
+    return context.hash(password)
+
+
+def verify_password(password: str, password_hash: str, context: CryptContext = PASSWORD_CONTEXT) -> bool:
+    return context.verify(password, password_hash)
+
+
+def verify_and_update_password(
+    password: str, password_hash: str, context: CryptContext = PASSWORD_CONTEXT
+) -> tuple[bool, str | None]:
+    """Verify password, return new hash as well if password is correct but hash uses deprecated scheme or cost"""
+    return context.verify_and_update(password, password_hash)
+
+
+def measure_verify_time(context: CryptContext, samples: int = 5) -> float:
+    password_hash = context.hash("calibration-password")
+
+    durations = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify("calibration-password", password_hash)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+class PasswordHasher:
+    # NOTE: bcrypt releases the GIL while hashing, so threads are enough to keep it off the event loop
+
+    def __init__(self, max_workers: int, max_queue_depth: int, context: CryptContext = PASSWORD_CONTEXT) -> None:
+        self._context = context
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hashing")
+        self._max_pending_jobs = max_workers + max_queue_depth
+        self._pending_jobs = 0
+        self._pending_jobs_lock = threading.Lock()
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run("hash", hash_password, password, self._context)
+
+    async def verify_password(self, password: str, password_hash: str) -> bool:
+        return await self._run("verify", verify_password, password, password_hash, self._context)
+
+    async def verify_and_update_password(self, password: str, password_hash: str) -> tuple[bool, str | None]:
+        verified, new_password_hash = await self._run(
+            "verify", verify_and_update_password, password, password_hash, self._context
+        )
+        if new_password_hash is not None:
+            PASSWORD_REHASHED_TOTAL.inc()
+        return verified, new_password_hash
+
+    def is_known_hash(self, password_hash: str) -> bool:
+        return self._context.identify(password_hash, required=False) is not None
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, operation: str, function: Callable[..., TResult], *args) -> TResult:
+        if self._pending_jobs >= self._max_pending_jobs:
+            PASSWORD_HASHING_REJECTED_TOTAL.inc()
+            raise PasswordHashingOverloadedException("Too many password hashing requests. Try again later")
+
+        submitted_at = time.perf_counter()
+
+        def timed_function() -> TResult:
+            started_at = time.perf_counter()
+            PASSWORD_HASHING_QUEUE_WAIT_SECONDS.observe(started_at - submitted_at)
+            try:
+                return function(*args)
+            finally:
+                PASSWORD_HASHING_DURATION_SECONDS.labels(operation).observe(time.perf_counter() - started_at)
+
+        # NOTE: job stays pending until its thread finishes, even when awaiting request was cancelled meanwhile,
+        # so done callback of executor future releases it instead of awaiting coroutine
+        with self._pending_jobs_lock:
+            self._pending_jobs += 1
+        PASSWORD_HASHING_PENDING_JOBS.inc()
+        try:
+            future = self._executor.submit(timed_function)
+        except BaseException:
+            self._release_job(None)
+            raise
+        future.add_done_callback(self._release_job)
+
+        with traced("password_hashing", operation=operation):
+            return await asyncio.wrap_future(future)
+
+    def _release_job(self, _future: Future | None) -> None:
+        with self._pending_jobs_lock:
+            self._pending_jobs -= 1
+        PASSWORD_HASHING_PENDING_JOBS.dec()
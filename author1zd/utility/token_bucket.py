@@ -0,0 +1,31 @@
+import time
+from typing import Hashable
+
+from author1zd.utility.ttl_lru_cache import TtlLruCache
+
+
+class TokenBucketLimiter:
+    # NOTE: not thread safe, limiter is meant to be used from event loop thread only
+    # bucket that refilled to burst is the same as missing one, so buckets expire once they are full
+
+    def __init__(self, rate: float, burst: int, max_keys: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._buckets: TtlLruCache[Hashable, tuple[float, float]] = TtlLruCache(max_keys)
+
+    def acquire(self, key: Hashable) -> float:
+        """Take token from bucket of key, return 0 if token was taken or number of seconds until it can be otherwise"""
+        now = time.monotonic()
+
+        tokens = self._burst
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket_tokens, updated_at = bucket
+            tokens = min(self._burst, bucket_tokens + (now - updated_at) * self._rate)
+
+        if tokens < 1:
+            return (1 - tokens) / self._rate
+
+        tokens -= 1
+        self._buckets.set(key, (tokens, now), ttl=(self._burst - tokens) / self._rate)
+        return 0.0
@@ -0,0 +1,27 @@
+import os
+
+# NOTE: settings are read from environment once and then reused,
+# so defaults for local stand-ins have to be in place before any benchmark imports author1zd modules
+_DEFAULT_ENVIRONMENT = {
+    "AUTH_EXPIRATION_TIME": "600",
+    "AUTH_CODE_TTL": "60",
+    "JWT_ACCESS_TOKEN_TTL": "300",
+    "JWT_REFRESH_TOKEN_TTL": "3600",
+    "JWT_ALGORITHM": "HS256",
+    "JWT_ACCESS_TOKEN_SECRET_KEY": "benchmark-access-token-secret",
+    "JWT_REFRESH_TOKEN_SECRET_KEY": "benchmark-refresh-token-secret",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_DATABASE": "author1zd_benchmark",
+    # all virtual users share one client address, client app and a few usernames
+    "RATE_LIMIT_LOCAL_ENABLED": "false",
+    "RATE_LIMIT_LOGIN_IP_LIMIT": "1000000000",
+    "RATE_LIMIT_LOGIN_IP_USERNAME_LIMIT": "1000000000",
+    "RATE_LIMIT_LOGIN_CLIENT_ID_LIMIT": "1000000000",
+    "RATE_LIMIT_SIGNUP_IP_LIMIT": "1000000000",
+    "RATE_LIMIT_SIGNUP_CLIENT_ID_LIMIT": "1000000000",
+}
+
+for _name, _value in _DEFAULT_ENVIRONMENT.items():
+    os.environ.setdefault(_name, _value)
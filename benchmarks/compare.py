@@ -0,0 +1,57 @@
+"""Compare two JSON reports of the same benchmark and flag regressions
+
+Exits with status 1 when any latency grew or throughput dropped by more than threshold.
+
+Run with: python -m benchmarks.compare baseline.json candidate.json --threshold 0.1
+"""
+import argparse
+import json
+import sys
+
+LOWER_IS_BETTER = ("p50_ms", "p95_ms", "p99_ms")
+HIGHER_IS_BETTER = ("ops_per_second",)
+
+
+def _load_report(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change counted as regression")
+    args = parser.parse_args()
+
+    baseline = _load_report(args.baseline)
+    candidate = _load_report(args.candidate)
+    if baseline["benchmark"] != candidate["benchmark"]:
+        sys.exit(f"Can not compare '{baseline['benchmark']}' report with '{candidate['benchmark']}' report")
+
+    print(f"{baseline['commit']} -> {candidate['commit']}")
+    print(f"{'result':<48}{'metric':<16}{'baseline':>12}{'candidate':>12}{'change':>10}")
+
+    regressions = 0
+    for name, baseline_result in baseline["results"].items():
+        candidate_result = candidate["results"].get(name)
+        if candidate_result is None:
+            continue
+
+        for metric in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            if metric not in baseline_result or not baseline_result[metric]:
+                continue
+
+            change = candidate_result[metric] / baseline_result[metric] - 1
+            regressed = change > args.threshold if metric in LOWER_IS_BETTER else change < -args.threshold
+            regressions += regressed
+            print(
+                f"{name:<48}{metric:<16}{baseline_result[metric]:>12.3f}{candidate_result[metric]:>12.3f}"
+                f"{change:>+10.1%}{'  REGRESSION' if regressed else ''}"
+            )
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
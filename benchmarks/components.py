@@ -0,0 +1,171 @@
+"""Microbenchmarks of components on the hot path of the OAuth flow
+
+Covers token pair generation, password verification, entity/model conversion
+and key-value collections of both storage backends.
+
+Run with: python -m benchmarks.components --output components.json
+"""
+import argparse
+import asyncio
+import datetime
+import uuid
+from typing import Any, Awaitable, Callable
+
+from author1zd.database.sqlalchemy.converters.default_converter import DefaultConverter
+from author1zd.database.sqlalchemy.models import UserModel
+from author1zd.dependencies import key_value_storage
+from author1zd.dependencies.token_keys import get_token_key_rings, open_token_key_rings
+from author1zd.entities.user import User
+from author1zd.key_value_storage.abstract.collections.indexed_string_set import IndexedStringSet
+from author1zd.key_value_storage.abstract.collections.string_set import StringSet
+from author1zd.key_value_storage.abstract.collections.string_to_dataclass_map import StringToDataclassMap
+from author1zd.key_value_storage.memory.collections.factory_functions import (
+    create_memory_auth_code_collection,
+    create_memory_refresh_token_collection,
+    create_memory_revoked_access_token_collection,
+)
+from author1zd.key_value_storage.memory.expiring_store import ExpiringStore
+from author1zd.key_value_storage.redis.collections.factory_functions import (
+    create_redis_auth_code_collection,
+    create_redis_refresh_token_collection,
+    create_redis_revoked_access_token_collection,
+)
+from author1zd.objects.auth_code_data import AuthCodeData
+from author1zd.services.token import REFRESH_TOKEN_ID_SEPARATOR, generate_token_pair
+from author1zd.settings import JwtSettings, RedisSettings
+from author1zd.utility.password import hash_password, verify_password
+from benchmarks.reporting import measure, measure_async, summarize, write_report
+from benchmarks.stand_ins import use_fake_redis
+
+TTL = datetime.timedelta(minutes=10)
+
+USER = User(
+    id=1,
+    username="benchmark-user",
+    email="benchmark-user@benchmark.local",
+    password_hash=hash_password("benchmark-password"),
+    registration_date=datetime.datetime(2023, 1, 1),
+)
+
+
+def _benchmark_converter(calls: int) -> dict[str, dict[str, Any]]:
+    converter = DefaultConverter(User, UserModel)
+    model = converter.entity_to_model(USER)
+    return {
+        "DefaultConverter.entity_to_model": summarize(measure(lambda: converter.entity_to_model(USER), calls)),
+        "DefaultConverter.model_to_entity": summarize(measure(lambda: converter.model_to_entity(model), calls)),
+    }
+
+
+def _benchmark_verify_password(calls: int) -> dict[str, dict[str, Any]]:
+    return {
+        "verify_password": summarize(measure(lambda: verify_password("benchmark-password", USER.password_hash), calls))
+    }
+
+
+async def _benchmark_generate_token_pair(calls: int) -> dict[str, dict[str, Any]]:
+    jwt_settings = JwtSettings()
+    open_token_key_rings(jwt_settings)
+    token_key_rings = get_token_key_rings()
+    refresh_token_collection = create_memory_refresh_token_collection(ExpiringStore(max_entries=None), TTL)
+
+    latencies = await measure_async(
+        lambda: generate_token_pair("benchmark-client", USER, refresh_token_collection, jwt_settings, token_key_rings),
+        calls,
+    )
+    return {f"generate_token_pair[{jwt_settings.algorithm}]": summarize(latencies)}
+
+
+async def _benchmark_collections(
+    backend: str,
+    auth_code_collection: StringToDataclassMap[AuthCodeData],
+    refresh_token_collection: IndexedStringSet,
+    revoked_access_token_collection: StringSet,
+    calls: int,
+) -> dict[str, dict[str, Any]]:
+    auth_code_data = AuthCodeData(client_id="benchmark-client", user_id=USER.id)
+    keys = [uuid.uuid4().hex for _ in range(calls)]
+    new_keys = [uuid.uuid4().hex for _ in range(calls)]
+    indexes = [f"user:{USER.id}", "client:benchmark-client"]
+
+    def over_keys(operation: Callable[[int], Awaitable[object]]) -> Callable[[], Awaitable[object]]:
+        counter = iter(range(calls))
+        return lambda: operation(next(counter))
+
+    cases = {
+        "auth_code.save": over_keys(lambda i: auth_code_collection.save(keys[i], auth_code_data)),
+        "auth_code.get": over_keys(lambda i: auth_code_collection.get(keys[i])),
+        "auth_code.pop": over_keys(lambda i: auth_code_collection.pop(keys[i])),
+        "refresh_token.save": over_keys(lambda i: refresh_token_collection.save(keys[i], indexes)),
+        "refresh_token.replace": over_keys(lambda i: refresh_token_collection.replace(keys[i], new_keys[i], indexes)),
+        "revoked_access_token.save": over_keys(lambda i: revoked_access_token_collection.save(keys[i])),
+        "revoked_access_token.contains": over_keys(lambda i: revoked_access_token_collection.contains(keys[i])),
+    }
+
+    results = {}
+    for name, operation in cases.items():
+        results[f"{backend}.{name}"] = summarize(await measure_async(operation, calls))
+    return results
+
+
+async def _benchmark_memory_collections(calls: int) -> dict[str, dict[str, Any]]:
+    store = ExpiringStore(max_entries=None)
+    return await _benchmark_collections(
+        "memory",
+        create_memory_auth_code_collection(store, TTL),
+        create_memory_refresh_token_collection(store, TTL),
+        create_memory_revoked_access_token_collection(store, TTL),
+        calls,
+    )
+
+
+async def _benchmark_redis_collections(backend: str, calls: int) -> dict[str, dict[str, Any]]:
+    key_value_storage.open_redis_connection_pool(RedisSettings())
+    try:
+        redis_client = key_value_storage.create_redis_client()
+        results = {}
+        for encoding in ("hash", "msgpack"):
+            results |= await _benchmark_collections(
+                f"{backend}[{encoding}]",
+                create_redis_auth_code_collection(redis_client, TTL, encoding=encoding),
+                create_redis_refresh_token_collection(redis_client, TTL, REFRESH_TOKEN_ID_SEPARATOR),
+                create_redis_revoked_access_token_collection(redis_client, TTL),
+                calls,
+            )
+        return results
+    finally:
+        await key_value_storage.close_redis_connection_pool()
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    results = _benchmark_converter(args.calls)
+    results |= _benchmark_verify_password(args.password_calls)
+    results |= await _benchmark_generate_token_pair(args.calls)
+    results |= await _benchmark_memory_collections(args.calls)
+    results |= await _benchmark_redis_collections(args.key_value_storage, args.calls)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000, help="number of calls of every fast operation")
+    parser.add_argument("--password-calls", type=int, default=20, help="number of password verifications")
+    parser.add_argument("--key-value-storage", choices=["fakeredis", "redis"], default="fakeredis")
+    parser.add_argument("--output", help="file to write JSON report to, stdout by default")
+    args = parser.parse_args()
+
+    if args.key_value_storage == "fakeredis":
+        use_fake_redis()
+
+    results = asyncio.run(run(args))
+
+    parameters = {
+        "calls": args.calls,
+        "password_calls": args.password_calls,
+        "key_value_storage": args.key_value_storage,
+    }
+    write_report("components", parameters, results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Per-call cost of entity/model conversion: reflective conversion against generated DefaultConverter functions
+
+Run with: python -m benchmarks.converters --output converters.json
+"""
+import argparse
+import datetime
+from dataclasses import asdict
+from typing import Any
+
+from author1zd.database.sqlalchemy.converters.default_converter import DefaultConverter
+from author1zd.database.sqlalchemy.models import UserModel
+from author1zd.entities.user import User
+from benchmarks.reporting import measure, summarize, write_report
+
+USER = User(
+    id=1,
+    username="benchmark-user",
+    email="benchmark-user@benchmark.local",
+    password_hash="$2b$12$" + "x" * 53,
+    registration_date=datetime.datetime(2023, 1, 1),
+)
+
+
+def _reflective_entity_to_model(entity: User) -> UserModel:
+    model = UserModel()
+    for field, value in asdict(entity).items():
+        if value is not None:
+            setattr(model, field, value)
+    return model
+
+
+def _reflective_model_to_entity(model: UserModel) -> User:
+    entity_kwargs = {}
+    for column in model.__table__.columns:
+        entity_kwargs[column.name] = getattr(model, column.name)
+    return User(**entity_kwargs)
+
+
+def run(calls: int) -> dict[str, dict[str, Any]]:
+    converter = DefaultConverter(User, UserModel)
+    model = converter.entity_to_model(USER)
+    row = tuple(getattr(model, column.name) for column in converter.columns)
+
+    cases = {
+        "entity_to_model[reflective]": lambda: _reflective_entity_to_model(USER),
+        "entity_to_model[generated]": lambda: converter.entity_to_model(USER),
+        "model_to_entity[reflective]": lambda: _reflective_model_to_entity(model),
+        "model_to_entity[generated]": lambda: converter.model_to_entity(model),
+        "row_to_entity[generated]": lambda: converter.row_to_entity(row),
+    }
+    return {name: summarize(measure(function, calls)) for name, function in cases.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--output", help="file to write JSON report to, stdout by default")
+    args = parser.parse_args()
+
+    write_report("converters", {"calls": args.calls}, run(args.calls), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Overhead of request metrics and hot path instrumentation
+
+Compares a trivial endpoint served with and without MetricsMiddleware
+and a timed block with tracing disabled and enabled against a bare block.
+
+Run with: python -m benchmarks.instrumentation --output instrumentation.json
+"""
+import argparse
+import asyncio
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+
+from author1zd.monitoring.instrumentation import disable_tracing, enable_tracing, timed
+from author1zd.monitoring.metrics import JWT_OPERATION_DURATION_SECONDS
+from author1zd.monitoring.middleware import MetricsMiddleware
+from benchmarks.reporting import measure, measure_async, summarize, write_report
+
+
+def _create_app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+    if instrumented:
+        app.add_middleware(MetricsMiddleware, get_routes=lambda: app.routes)
+
+    @app.get("/ping")
+    async def ping_view():
+        return {}
+
+    return app
+
+
+async def _benchmark_middleware(calls: int) -> dict[str, dict[str, Any]]:
+    results = {}
+    for instrumented in (False, True):
+        transport = httpx.ASGITransport(app=_create_app(instrumented))
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark.local") as client:
+            await measure_async(lambda: client.get("/ping"), calls // 10)
+            latencies = await measure_async(lambda: client.get("/ping"), calls)
+        results[f"request[{'instrumented' if instrumented else 'plain'}]"] = summarize(latencies)
+    return results
+
+
+def _benchmark_timed(calls: int) -> dict[str, dict[str, Any]]:
+    def timed_block() -> None:
+        with timed("jwt.sign", JWT_OPERATION_DURATION_SECONDS, token_type="access_token", operation="sign"):
+            pass
+
+    results = {"block[plain]": summarize(measure(lambda: None, calls))}
+    results["block[timed]"] = summarize(measure(timed_block, calls))
+
+    try:
+        enable_tracing()
+    except Exception:
+        return results
+    try:
+        results["block[timed, traced]"] = summarize(measure(timed_block, calls))
+    finally:
+        disable_tracing()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--output", help="file to write JSON report to, stdout by default")
+    args = parser.parse_args()
+
+    results = asyncio.run(_benchmark_middleware(args.calls))
+    results |= _benchmark_timed(args.calls)
+
+    write_report("instrumentation", {"calls": args.calls}, results, args.output)
+
+
+if __name__ == "__main__":
+    main()
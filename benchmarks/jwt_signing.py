@@ -0,0 +1,67 @@
+"""Sign and verify throughput of access token key rings for every supported algorithm family
+
+Run with: python -m benchmarks.jwt_signing
+"""
+import datetime
+import os
+import pathlib
+import tempfile
+import timeit
+from typing import Callable
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwt
+
+from author1zd.services.key_ring import KeyRing
+
+NUMBER_OF_CALLS = 2000
+
+CLAIMS = {
+    "client_id": "benchmark-client",
+    "email": "user@example.com",
+    "username": "user",
+    "sub": "1",
+    "exp": datetime.datetime.utcnow() + datetime.timedelta(days=1),
+}
+
+
+def _write_private_key(directory: str, name: str, private_key) -> str:
+    path = os.path.join(directory, f"{name}.pem")
+    with open(path, "wb") as file:
+        file.write(
+            private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    return path
+
+
+def _calls_per_second(function: Callable[[], object]) -> float:
+    return NUMBER_OF_CALLS / timeit.timeit(function, number=NUMBER_OF_CALLS)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        rsa_key_file = _write_private_key(directory, "rsa", rsa.generate_private_key(65537, 2048))
+        ec_key_file = _write_private_key(directory, "ec", ec.generate_private_key(ec.SECP256R1()))
+
+        cases = {
+            "HS256": ("secret" * 8, KeyRing.from_secret("secret" * 8, "HS256")),
+            "RS256": (pathlib.Path(rsa_key_file).read_text(), KeyRing.from_pem_files([rsa_key_file], "RS256")),
+            "ES256": (pathlib.Path(ec_key_file).read_text(), KeyRing.from_pem_files([ec_key_file], "ES256")),
+        }
+
+        print(f"{'algorithm':<10}{'sign/s':>12}{'verify/s':>12}{'sign/s (raw key)':>20}")
+        for algorithm, (raw_key, key_ring) in cases.items():
+            token = key_ring.sign(CLAIMS)
+            sign_rate = _calls_per_second(lambda: key_ring.sign(CLAIMS))
+            verify_rate = _calls_per_second(lambda: key_ring.verify(token))
+            raw_sign_rate = _calls_per_second(lambda: jwt.encode(CLAIMS, raw_key, algorithm=algorithm))
+            print(f"{algorithm:<10}{sign_rate:>12.0f}{verify_rate:>12.0f}{raw_sign_rate:>20.0f}")
+
+
+if __name__ == "__main__":
+    main()
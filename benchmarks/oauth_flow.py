@@ -0,0 +1,222 @@
+"""Throughput and latency of the full /authorize -> /login -> /token -> /refresh sequence
+
+Application runs in-process behind httpx ASGI transport against SQLite or local Postgres
+and in-memory key-value storage, in-process Redis replacement or local Redis.
+
+Run with: python -m benchmarks.oauth_flow --users 16 --iterations 20 --output flow.json
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import urllib.parse
+from collections import defaultdict
+
+import httpx
+
+from author1zd.app import app
+from author1zd.database.sqlalchemy.models import ClientAppModel, RedirectUriModel
+from author1zd.dependencies import database
+from benchmarks.reporting import summarize, write_report
+from benchmarks.stand_ins import use_fake_redis, use_sqlite
+
+CLIENT_ID = "benchmark-client"
+CLIENT_SECRET = "benchmark-client-secret"
+REDIRECT_URI = "http://benchmark.local/callback"
+PASSWORD = "benchmark-password"
+
+ENDPOINTS = ("authorize", "login", "token", "refresh")
+
+
+class FlowException(Exception):
+    pass
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.intervals: dict[str, list[tuple[float, float]]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def get_latencies(self, endpoint: str) -> list[float]:
+        return [end - start for start, end in self.intervals[endpoint]]
+
+    def get_busy_time(self, endpoint: str) -> float:
+        """Time during which at least one request to endpoint was in flight"""
+        busy_time = 0.0
+        busy_until = float("-inf")
+        for start, end in sorted(self.intervals[endpoint]):
+            if end > busy_until:
+                busy_time += end - max(start, busy_until)
+                busy_until = end
+        return busy_time
+
+    async def request(
+        self, endpoint: str, client: httpx.AsyncClient, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.intervals[endpoint].append((start, time.perf_counter()))
+
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+            raise FlowException(f"{endpoint} responded with {response.status_code}")
+        return response
+
+
+async def _authorize(client: httpx.AsyncClient, recorder: _Recorder) -> str:
+    response = await recorder.request(
+        "authorize",
+        client,
+        "GET",
+        "/authorize",
+        params={"response_type": "code", "client_id": CLIENT_ID, "redirect_uri": REDIRECT_URI, "state": "state"},
+    )
+    return _get_query_parameter(response, "auth_info_key")
+
+
+async def _login(client: httpx.AsyncClient, recorder: _Recorder, auth_info_key: str, username: str) -> str:
+    response = await recorder.request(
+        "login",
+        client,
+        "POST",
+        "/login",
+        params={"auth_info_key": auth_info_key},
+        data={"username": username, "password": PASSWORD},
+    )
+    return _get_query_parameter(response, "code")
+
+
+async def _token(client: httpx.AsyncClient, recorder: _Recorder, code: str) -> str:
+    response = await recorder.request(
+        "token",
+        client,
+        "POST",
+        "/token",
+        data={"grant_type": "authorization_code", "client_id": CLIENT_ID, "client_secret": CLIENT_SECRET, "code": code},
+    )
+    return response.json()["refresh_token"]
+
+
+async def _refresh(client: httpx.AsyncClient, recorder: _Recorder, refresh_token: str) -> str:
+    response = await recorder.request(
+        "refresh",
+        client,
+        "POST",
+        "/refresh",
+        data={
+            "grant_type": "refresh_token",
+            "client_id": CLIENT_ID,
+            "client_secret": CLIENT_SECRET,
+            "refresh_token": refresh_token,
+        },
+    )
+    return response.json()["refresh_token"]
+
+
+def _get_query_parameter(response: httpx.Response, name: str) -> str:
+    query = urllib.parse.urlsplit(response.headers["location"]).query
+    return urllib.parse.parse_qs(query)[name][0]
+
+
+async def _sign_up(client: httpx.AsyncClient, username: str) -> None:
+    recorder = _Recorder()
+    auth_info_key = await _authorize(client, recorder)
+    await recorder.request(
+        "signup",
+        client,
+        "POST",
+        "/signup",
+        params={"auth_info_key": auth_info_key},
+        data={"username": username, "email": f"{username}@benchmark.local", "password": PASSWORD},
+    )
+
+
+async def _run_virtual_user(client: httpx.AsyncClient, recorder: _Recorder, username: str, iterations: int) -> int:
+    completed_flows = 0
+    for _ in range(iterations):
+        try:
+            auth_info_key = await _authorize(client, recorder)
+            code = await _login(client, recorder, auth_info_key, username)
+            refresh_token = await _token(client, recorder, code)
+            await _refresh(client, recorder, refresh_token)
+        except FlowException:
+            continue
+        completed_flows += 1
+    return completed_flows
+
+
+async def _create_client_app() -> None:
+    async with database.open_session() as session:
+        session.add(
+            ClientAppModel(
+                client_id=CLIENT_ID,
+                client_secret=CLIENT_SECRET,
+                redirect_uris=[RedirectUriModel(uri=REDIRECT_URI)],
+            )
+        )
+        await session.commit()
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict]:
+    await app.router.startup()
+    try:
+        await _create_client_app()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark.local") as client:
+            usernames = [f"benchmark-user-{index}" for index in range(args.users)]
+            await asyncio.gather(*(_sign_up(client, username) for username in usernames))
+
+            recorder = _Recorder()
+            start = time.perf_counter()
+            completed_flows = await asyncio.gather(
+                *(_run_virtual_user(client, recorder, username, args.iterations) for username in usernames)
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        await app.router.shutdown()
+
+    # NOTE: every endpoint is called once per flow, so throughput over whole run would be the same for all of them,
+    # endpoint throughput is measured over time its own requests were in flight instead
+    results = {
+        endpoint: summarize(
+            recorder.get_latencies(endpoint), recorder.get_busy_time(endpoint), recorder.errors[endpoint]
+        )
+        for endpoint in ENDPOINTS
+    }
+    results["flow"] = {"calls": sum(completed_flows), "ops_per_second": sum(completed_flows) / elapsed}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=16, help="number of concurrent virtual users")
+    parser.add_argument("--iterations", type=int, default=20, help="number of flows every virtual user runs")
+    parser.add_argument("--database", choices=["sqlite", "postgres"], default="sqlite")
+    parser.add_argument("--key-value-storage", choices=["memory", "fakeredis", "redis"], default="fakeredis")
+    parser.add_argument("--output", help="file to write JSON report to, stdout by default")
+    args = parser.parse_args()
+
+    os.environ["KEY_VALUE_STORAGE_BACKEND"] = "memory" if args.key_value_storage == "memory" else "redis"
+    # schema has to exist before startup, user filter is built from users table in background right after it
+    os.environ["STARTUP_CREATE_SCHEMA"] = "true"
+    if args.key_value_storage == "fakeredis":
+        use_fake_redis()
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.database == "sqlite":
+            use_sqlite(os.path.join(directory, "benchmark.sqlite3"))
+        results = asyncio.run(run(args))
+
+    parameters = {
+        "users": args.users,
+        "iterations": args.iterations,
+        "database": args.database,
+        "key_value_storage": args.key_value_storage,
+    }
+    write_report("oauth_flow", parameters, results, args.output)
+
+
+if __name__ == "__main__":
+    main()
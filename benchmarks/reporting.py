@@ -0,0 +1,78 @@
+"""Latency summaries and JSON reports shared by benchmarks"""
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+
+def measure(function: Callable[[], object], calls: int) -> list[float]:
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def measure_async(function: Callable[[], Awaitable[object]], calls: int) -> list[float]:
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await function()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summarize(latencies: list[float], elapsed: float | None = None, errors: int = 0) -> dict[str, Any]:
+    """Summarize latencies in seconds, throughput is based on elapsed time calls were in flight
+    when they ran concurrently"""
+    if elapsed is None:
+        elapsed = sum(latencies)
+
+    if len(latencies) > 1:
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "ops_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": p50 * 1000,
+        "p95_ms": p95 * 1000,
+        "p99_ms": p99 * 1000,
+    }
+
+
+def write_report(
+    benchmark: str, parameters: dict[str, Any], results: dict[str, dict[str, Any]], output: str | None
+) -> None:
+    report = {
+        "benchmark": benchmark,
+        "commit": _get_commit(),
+        "created_at": datetime.datetime.utcnow().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "results": results,
+    }
+    serialized_report = json.dumps(report, indent=2)
+
+    if output is None:
+        print(serialized_report)
+    else:
+        with open(output, "w") as file:
+            file.write(serialized_report + "\n")
+
+
+def _get_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,34 @@
+"""Containerless replacements for Postgres and Redis
+
+SQLite needs 'aiosqlite' and in-process Redis needs 'fakeredis' with Lua support ('fakeredis[lua]').
+Both are swapped in before application startup, so application code runs unchanged against them.
+"""
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from author1zd.dependencies import database, key_value_storage
+from author1zd.key_value_storage.redis.connection_pool import InstrumentedConnectionPool
+from author1zd.settings import PostgresSettings, RedisSettings
+
+
+def use_sqlite(path: str) -> None:
+    def create_sqlite_engine(postgres_settings: PostgresSettings, host: str | None = None) -> AsyncEngine:
+        return create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    database._create_engine = create_sqlite_engine
+
+
+def use_fake_redis() -> None:
+    import fakeredis
+    from fakeredis.aioredis import FakeConnection
+
+    server = fakeredis.FakeServer()
+
+    def open_fake_redis_connection_pool(redis_settings: RedisSettings) -> None:
+        key_value_storage._REDIS_CONNECTION_POOL = InstrumentedConnectionPool(
+            connection_class=FakeConnection,
+            server=server,
+            max_connections=redis_settings.max_connections,
+            timeout=redis_settings.pool_timeout,
+        )
+
+    key_value_storage.open_redis_connection_pool = open_fake_redis_connection_pool
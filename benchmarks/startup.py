@@ -0,0 +1,81 @@
+"""Time until worker serves requests and until its connection pools are warm
+
+Every sample starts fresh interpreter, so module import (including stand-ins) is measured cold as it is
+when worker starts.
+Database is SQLite, key-value storage is in-process Redis replacement or in-memory storage.
+
+Run with: python -m benchmarks.startup --samples 10 --output startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.reporting import summarize, write_report
+
+PHASES = ("import", "startup", "ready")
+
+_SAMPLE_SCRIPT = """
+import asyncio, json, sys, time
+
+start = time.perf_counter()
+import benchmarks
+from benchmarks.stand_ins import use_fake_redis, use_sqlite
+
+if sys.argv[2] == "fakeredis":
+    use_fake_redis()
+use_sqlite(sys.argv[1])
+
+from author1zd.app import app
+from author1zd.dependencies.readiness import is_ready
+imported = time.perf_counter()
+
+
+async def main():
+    await app.router.startup()
+    started = time.perf_counter()
+    while not is_ready():
+        await asyncio.sleep(0.001)
+    ready = time.perf_counter()
+    await app.router.shutdown()
+    print(json.dumps({"import": imported - start, "startup": started - imported, "ready": ready - imported}))
+
+
+asyncio.run(main())
+"""
+
+
+def _sample(path: str, key_value_storage: str) -> dict[str, float]:
+    environment = os.environ | {"KEY_VALUE_STORAGE_BACKEND": "memory" if key_value_storage == "memory" else "redis"}
+    completed_process = subprocess.run(
+        [sys.executable, "-c", _SAMPLE_SCRIPT, path, key_value_storage],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed_process.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--key-value-storage", choices=["fakeredis", "memory"], default="fakeredis")
+    parser.add_argument("--output", help="file to write JSON report to, stdout by default")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        samples = [
+            _sample(os.path.join(directory, "benchmark.sqlite3"), args.key_value_storage) for _ in range(args.samples)
+        ]
+
+    results = {phase: summarize([sample[phase] for sample in samples]) for phase in PHASES}
+    write_report(
+        "startup", {"samples": args.samples, "key_value_storage": args.key_value_storage}, results, args.output
+    )
+
+
+if __name__ == "__main__":
+    main()